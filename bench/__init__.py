@@ -0,0 +1,10 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmarks of loading and dumping changelogs, run with "python -m bench" (or
+"make bench"), using changelogs from a seeded generator
+"""
+
+from .generate import generate
+
+__all__ = [ 'generate' ]
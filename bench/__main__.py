@@ -0,0 +1,173 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Run the benchmarks, reporting the throughput and peak memory of each, and
+comparing them with a baseline
+"""
+
+import gc
+import sys
+import json
+import time
+import argparse
+import functools
+import tracemalloc
+from io import ( BytesIO, StringIO )
+from typing import ( Any, Callable, Optional, Sequence )
+import changelog
+from .generate import generate
+
+_BENCHMARKS = {
+    'load (text)': lambda data: changelog.load( StringIO( data[ "text" ] ) ),
+    'load (binary)': lambda data: changelog.load( BytesIO( data[ "bytes" ] ) ),
+    'loads': lambda data: changelog.loads( data[ "text" ] ),
+    'dump': lambda data: changelog.dump( data[ "changes" ], BytesIO() ),
+    'dumps': lambda data: changelog.dumps( data[ "changes" ] ),
+    'round trip': lambda data: changelog.dumps( changelog.loads( data[ "text" ] ) )
+}
+
+def _time( function: Callable[ [], Any ], repeat: int )-> float:
+    """
+    Time a function, taking the fastest of several runs (each running it
+    enough times to take at least a tenth of a second)
+    """
+    number, best = 1, float( 'inf' )
+    while True:
+        start = time.perf_counter()
+        for _ in range( number ):
+            function()
+        if 0.1 <= ( elapsed := time.perf_counter() - start ):
+            break
+        number *= 10
+    for _ in range( repeat ):
+        best = min( best, elapsed / number )
+        start = time.perf_counter()
+        for _ in range( number ):
+            function()
+        elapsed = time.perf_counter() - start
+    return min( best, elapsed / number )
+
+def _peak_memory( function: Callable[ [], Any ] )-> int:
+    """
+    Measure the most memory allocated while running a function
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[ 1 ]
+    finally:
+        tracemalloc.stop()
+
+def _calibrate( repeat: int )-> float:
+    """
+    Time a fixed workload, similar to parsing (string checks, slicing, and
+    building dictionaries), to compare timings taken on different machines. It's
+    quick, so it's timed more times than the benchmarks to steady it
+    """
+    lines = [ "## [1.0.0] - 2020-01-01", "### Added", "- A change" ] * 10000
+    def workload():
+        releases = []
+        for line in lines:
+            if line.startswith( "## " ):
+                releases.append( { "version": line[ 4 : line.index( "]" ) ], "changes": [] } )
+            elif line.startswith( "- " ):
+                releases[ -1 ][ "changes" ].append( line[ 2 : ] )
+        return releases
+    return _time( workload, repeat * 3 )
+
+def run( releases: Sequence[ int ], repeat: int = 7, memory: bool = True )-> dict[ str, Any ]:
+    """
+    Run the benchmarks
+
+    :param releases: the numbers of releases of the changelogs to benchmark with
+    :param repeat: the number of times to time each benchmark (taking the fastest)
+    :param memory: also measure the peak memory of each benchmark
+    :return: the calibration time, and the results of each benchmark (keyed by "name/releases")
+    """
+    results = { "calibration": _calibrate( repeat ), "results": {} }
+    for count in releases:
+        text = generate( count )
+        data = { "text": text, "bytes": text.encode(), "changes": changelog.loads( text ) }
+        for name, benchmark in _BENCHMARKS.items():
+            function = functools.partial( benchmark, data )
+            seconds = _time( function, repeat )
+            results[ "results" ][ f'{ name }/{ count }' ] = {
+                "seconds": seconds,
+                "mb_per_second": len( data[ "bytes" ] ) / seconds / 1e6,
+                "releases_per_second": len( data[ "changes" ] ) / seconds,
+                "peak_memory": _peak_memory( function ) if memory else None
+            }
+    return results
+
+def compare( results: dict[ str, Any ], baseline: dict[ str, Any ], threshold: float )-> list[ str ]:
+    """
+    Compare results with a baseline, scaling the baseline's times by the ratio
+    of the calibration times (so that it can be compared on another machine)
+
+    :param results: the results of "run"
+    :param baseline: the results of a previous run
+    :param threshold: the fraction slower than the baseline a benchmark can be before it's a regression
+    :return: descriptions of the regressions
+    """
+    scale, regressions = results[ "calibration" ] / baseline[ "calibration" ], []
+    for key, result in results[ "results" ].items():
+        if key not in baseline[ "results" ]:
+            continue
+        expected = baseline[ "results" ][ key ][ "seconds" ] * scale
+        if expected * ( 1 + threshold ) < result[ "seconds" ]:
+            regressions.append(
+                f'{ key }: { result[ "seconds" ] * 1e3:.3f}ms, { result[ "seconds" ] / expected - 1:.0%} '
+                f'slower than the baseline ({ expected * 1e3:.3f}ms, scaled to this machine)'
+            )
+    return regressions
+
+def _report( results: dict[ str, Any ] )-> str:
+    """
+    Format results as a table
+    """
+    lines = [ f'{ "benchmark":<24}{ "time":>12}{ "MB/s":>10}{ "releases/s":>14}{ "peak memory":>14}' ]
+    for key, result in results[ "results" ].items():
+        peak = "" if result[ "peak_memory" ] is None else f'{ result[ "peak_memory" ] / 1e6:.1f}MB'
+        lines.append(
+            f'{ key:<24}{ result[ "seconds" ] * 1e3:>10.3f}ms{ result[ "mb_per_second" ]:>10.1f}'
+            f'{ result[ "releases_per_second" ]:>14,.0f}{ peak:>14}'
+        )
+    return "\n".join( lines )
+
+def main( args: Optional[ Sequence[ str ] ] = None )-> int:
+    """
+    Run the benchmarks from the command line
+
+    :param args: the command line arguments (by default, those of the process)
+    :return: the exit code, 1 if any benchmark regressed from the baseline
+    """
+    parser = argparse.ArgumentParser( prog = "python -m bench", description = __doc__ )
+    parser.add_argument( '--releases', type = int, nargs = '+', default = [ 10, 1000, 10000 ],
+                         help = 'the release counts of the changelogs to benchmark (default: %(default)s)' )
+    parser.add_argument( '--repeat', type = int, default = 7,
+                         help = 'the number of times to time each benchmark (default: %(default)s)' )
+    parser.add_argument( '--no-memory', action = 'store_true', help = "don't measure peak memory" )
+    parser.add_argument( '--baseline', help = 'a JSON file of results to compare with' )
+    parser.add_argument( '--threshold', type = float, default = 0.3,
+                         help = 'the fraction slower than the baseline that fails (default: %(default)s)' )
+    parser.add_argument( '--save', help = 'write the results to this JSON file (to use as a baseline)' )
+    args = parser.parse_args( args )
+
+    results = run( args.releases, args.repeat, not args.no_memory )
+    print( _report( results ) )
+    if args.save:
+        with open( args.save, 'w', encoding = 'utf-8' ) as fp:
+            json.dump( results, fp, indent = 2 )
+            fp.write( "\n" )
+    if args.baseline:
+        with open( args.baseline, 'r', encoding = 'utf-8' ) as fp:
+            regressions = compare( results, json.load( fp ), args.threshold )
+        if regressions:
+            print( "\nRegressions:\n" + "\n".join( regressions ), file = sys.stderr )
+            return 1
+        print( "\nNo regressions" )
+    return 0
+
+if __name__ == '__main__':
+    sys.exit( main() )
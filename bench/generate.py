@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Generating realistic changelogs (formatted exactly as "changelog.dump" would
+format them) for benchmarking
+"""
+
+import random
+from datetime import ( date, timedelta )
+from changelog import DEFAULT_HEADER
+
+_SECTIONS = ( 'Added', 'Changed', 'Deprecated', 'Removed', 'Fixed', 'Security' )
+_SECTION_WEIGHTS = ( 6, 4, 1, 1, 6, 1 )
+_WORDS = (
+    'add', 'support', 'for', 'the', 'parser', 'release', 'version', 'date', 'translation', 'link',
+    'section', 'fix', 'crash', 'when', 'loading', 'empty', 'files', 'update', 'dependency', 'documentation',
+    'example', 'remove', 'deprecated', 'option', 'improve', 'performance', 'of', 'large', 'changelogs',
+    'handle', 'unicode'
+)
+_REPOSITORY = 'https://github.com/example/project'
+
+def _change( rng: random.Random, multiline: float )-> list[ str ]:
+    """
+    Generate the lines of a change, sometimes continued over multiple lines
+    (and paragraphs)
+    """
+    lines = []
+    for _ in range( rng.randint( 2, 3 ) if rng.random() < multiline else 1 ):
+        if lines and rng.random() < 0.3:
+            lines.append( "" )
+        words = rng.choices( _WORDS, k = rng.randint( 3, 12 ) )
+        if rng.random() < 0.3:
+            words.append( f'(#{ rng.randint( 1, 9999 ) })' )
+        lines.append( " ".join( words ).capitalize() + "." )
+    return lines
+
+def _versions( rng: random.Random, count: int )-> list[ str ]:
+    """
+    Generate increasing semver versions, with the occasional release candidate
+    """
+    versions, major, minor, patch = [], 0, 0, 1
+    while len( versions ) < count:
+        if rng.random() < 0.03 and len( versions ) + 1 < count:
+            versions.append( f'{ major }.{ minor }.{ patch }-rc.1' )
+        versions.append( f'{ major }.{ minor }.{ patch }' )
+        bump = rng.random()
+        if bump < 0.05:
+            major, minor, patch = major + 1, 0, 0
+        elif bump < 0.3:
+            minor, patch = minor + 1, 0
+        else:
+            patch += 1
+    return versions
+
+def generate(   releases: int = 100,
+                *,
+                seed: int = 0,
+                items: tuple[ int, int ] = ( 1, 5 ),
+                multiline: float = 0.1,
+                yanked: float = 0.02,
+                compare_urls: bool = True,
+                unreleased: bool = True
+            )-> str:
+    """
+    Generate a changelog (the same one for the same arguments)
+
+    :param releases: the number of released versions
+    :param seed: the seed of the random choices
+    :param items: the minimum and maximum number of changes in each section
+    :param multiline: the fraction of changes continued over multiple lines
+    :param yanked: the fraction of releases marked as yanked
+    :param compare_urls: add a compare URL for each release
+    :param unreleased: add an "Unreleased" entry before the releases
+    :return: the changelog data
+    """
+    rng = random.Random( seed )
+    versions = _versions( rng, releases )
+    release_date = date( 2000, 1, 1 )
+    headers = []
+    for _ in versions:
+        release_date += timedelta( days = rng.randint( 0, 20 ) )
+        headers.append( f' - { release_date.isoformat() }{ " [YANKED]" if rng.random() < yanked else "" }' )
+    entries = list( zip( versions, headers ) )[ : : -1 ]
+    if unreleased:
+        entries.insert( 0, ( "Unreleased", "" ) )
+
+    parts = [ DEFAULT_HEADER, "\n" ]
+    for version, header in entries:
+        parts.append( f'\n## [{ version }]{ header }\n' )
+        chosen = set( rng.choices( _SECTIONS, _SECTION_WEIGHTS, k = rng.randint( 1, 3 ) ) )
+        for section in ( section for section in _SECTIONS if section in chosen ):
+            parts.append( f'\n### { section }\n\n' )
+            for _ in range( rng.randint( *items ) ):
+                lines = _change( rng, multiline )
+                lines = [ "  " + line if line else line for line in lines ]
+                parts.append( "- " + "\n".join( lines )[ 2 : ] + "\n" )
+
+    if compare_urls and entries:
+        parts.append( "\n" )
+        for index, ( version, _ ) in enumerate( entries ):
+            if index + 1 < len( entries ):
+                previous = f'v{ entries[ index + 1 ][ 0 ] }'
+                current = "HEAD" if version == "Unreleased" else f'v{ version }'
+                parts.append( f'[{ version.lower() }]: { _REPOSITORY }/compare/{ previous }...{ current }\n' )
+            else:
+                parts.append( f'[{ version.lower() }]: { _REPOSITORY }/releases/tag/v{ version }\n' )
+    return "".join( parts )
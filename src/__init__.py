@@ -6,216 +6,672 @@ keepachangelog.com). In Python, the data is managed as a list of
 dictionaries (see README.md for the dictionaries' structure)
 """
 
-__version__ = '0.0.8'
+__version__ = '0.0.27'
 
+import os
 import re
+import mmap
+import stat
 import textwrap
+import functools
+import importlib
+from bisect import ( bisect_left, bisect_right )
 from datetime import date
-from typing import ( Optional, Any )
+from typing import ( TYPE_CHECKING, Optional, Any, Callable, Iterable, Iterator, Union )
+from collections.abc import ( Mapping, MutableMapping )
 from io import ( IOBase, TextIOBase, StringIO )
 from semver import Version
+from ._intern import ( InternInfo, intern_info, set_intern_size, _parse_date, _parse_version )
+from ._entry import ( Release, _CHANGE_TYPES, _SECTION_KEYS, _entry_version )
+from ._releases import _Releases
 
 class ChangelogParsingError( Exception ):
     """
-    An error used when changelog data isn't formatted as the parser expects
+    An error used when changelog data isn't formatted as the parser expects.
+    The message, line and column numbers (counted from 1), and the id of the
+    rule the data broke (eg. "invalid-date") are kept as attributes
     """
-    @property
-    def line_number( self )-> Optional[ int ]:
+    def __init__(   self,
+                    msg: str,
+                    line_number: Optional[ int ] = None,
+                    column_number: Optional[ int ] = None,
+                    rule: Optional[ str ] = None
+                ):
+        self.msg, self.rule = msg, rule
+        self.line_number = line_number if isinstance( line_number, int ) else None
+        self.column_number = column_number if isinstance( column_number, int ) else None
+        specifications = (
+            *( ( f'line { self.line_number }', ) if self.line_number is not None else () ),
+            *( ( f'column { self.column_number }', ) if self.column_number is not None else () )
+        )
+        super().__init__( msg + ( f' (at { ", ".join( specifications ) })' if specifications else '' ) )
+
+    def __reduce__( self )-> tuple:
+        # Errors are pickled (eg. by "load_many") with their attributes, rather than their formatted message
+        return ( type( self ), ( self.msg, self.line_number, self.column_number, self.rule ) )
+
+_COMPARE_URL_PATTERN = re.compile( r'\[([^\]]+)\]: (https?:\/\/.*)' )
+_DUMP_BUFFER_LINES = 4096
+_SEMVER_PATTERN = re.compile(
+    r'(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)'
+    r'(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)'
+    r'(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?'
+    r'(?:\+(?P<build>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?'
+)
+_RELEASE_PATTERN = re.compile( r'## \[([^\s\[\]]+)\](?: - (\S+))?( \[YANKED\])?' )
+
+def _as_version( version: Union[ Version, str ] )-> Union[ Version, str ]:
+    """
+    Convert a version argument (a semver Version, a semver string, or
+    "Unreleased" ignoring case) to the type used in changelog entries
+    """
+    if isinstance( version, str ):
+        return version.capitalize() if version.lower() == "unreleased" else Version.parse( version )
+    return version
+
+def _version_key( version: Union[ Version, str ] )-> Optional[ tuple ]:
+    """
+    Key a version for hashed lookups, the same way semver compares versions for
+    equality ("Unreleased" keys as None). Version strings are keyed without
+    creating a semver Version
+
+    :raises ValueError: if a version string isn't "Unreleased" (ignoring case) or a valid semver version
+    """
+    if isinstance( version, Version ):
+        return ( version.major, version.minor, version.patch, version.prerelease )
+    if version.lower() == "unreleased":
+        return None
+    if ( match := _SEMVER_PATTERN.fullmatch( version ) ) is None:
+        raise ValueError( f'"{ version }" is not a valid semver version' )
+    major, minor, patch, prerelease = match.group( 'major', 'minor', 'patch', 'prerelease' )
+    return ( int( major ), int( minor ), int( patch ), prerelease )
+
+def _invalidating( method: Callable )-> Callable:
+    """
+    Wrap a list method that modifies the list so that it drops the
+    changelog's indexes
+    """
+    @functools.wraps( method )
+    def wrapper( self, *args, **kwargs ):
+        self.reindex()
+        return method( self, *args, **kwargs )
+    return wrapper
+
+class Changelog( list ):
+    """
+    A list of changelog entries (see README.md for structure) with version
+    lookups backed by an index. The index is built on the first lookup and
+    dropped whenever the list is modified; call "reindex" after changing an
+    entry's "version" in place
+    """
+    __slots__ = ( '_index', '_sorted' )
+
+    def __init__( self, iterable: Iterable[ dict[ str, Any ] ] = () ):
+        super().__init__( iterable )
+        self._index = self._sorted = None
+
+    append = _invalidating( list.append )
+    extend = _invalidating( list.extend )
+    insert = _invalidating( list.insert )
+    pop = _invalidating( list.pop )
+    remove = _invalidating( list.remove )
+    clear = _invalidating( list.clear )
+    sort = _invalidating( list.sort )
+    reverse = _invalidating( list.reverse )
+    __setitem__ = _invalidating( list.__setitem__ )
+    __delitem__ = _invalidating( list.__delitem__ )
+    __iadd__ = _invalidating( list.__iadd__ )
+    __imul__ = _invalidating( list.__imul__ )
+
+    def reindex( self )-> None:
         """
-        Parse the line number from the error message, if defined
+        Drop the indexes so they're rebuilt on the next lookup
         """
-        if ( match := re.search( r' \(at line (\d+)(?:, column \d+)?\)$', str( self ) ) ):
-            return int( match.group( 1 ) )
+        self._index = self._sorted = None
 
-    @property
-    def column_number( self )-> Optional[ int ]:
+    def get( self, version: Union[ Version, str ], default: Any = None )-> Optional[ dict[ str, Any ] ]:
         """
-        Parse the column number from the error message, if defined
+        Look up an entry by version (the first one, if a version is listed more than once)
+
+        :param version: a semver Version, a semver string, or "Unreleased" (ignoring case)
+        :param default: returned if there's no entry with the version
+        :return: the entry with the version
         """
-        if ( match := re.search( r' \(at (?:line \d+, )?column (\d+)\)$', str( self ) ) ):
-            return int( match.group( 1 ) )
+        if self._index is None:
+            self._index = {}
+            for change in self:
+                self._index.setdefault( _version_key( _entry_version( change ) ), change )
+        return self._index.get( _version_key( version ), default )
 
-    def __init__( self, msg: str, line_number: Optional[ int ] = None, column_number: Optional[ int ] = None ):
-        specifications = (
-            *( ( f'line { line_number }', ) if isinstance( line_number, int ) else () ),
-            *( ( f'column { column_number }', ) if isinstance( column_number, int ) else () )
-        )
-        super().__init__( msg + ( f' (at { ", ".join( specifications ) })' if specifications else '' ) )
+    def latest( self )-> Optional[ dict[ str, Any ] ]:
+        """
+        :return: the newest (first) entry, which may be "Unreleased"
+        """
+        return self[ 0 ] if self else None
 
-def load( fp: IOBase, encoding: str = 'utf-8' )-> list[ dict[ str, Any ] ]:
-    """
-    Parse changelog data from a stream
+    def latest_released( self )-> Optional[ dict[ str, Any ] ]:
+        """
+        :return: the entry with the greatest semver version
+        """
+        versions, changes = self._released()
+        return changes[ -1 ] if versions else None
 
-    :param input: a stream that outputs changelog data (eg. a file opened for reading)
-    :param encoding: if the stream outputs binary data, decode it using this encoding
-    :return: a list of dictionaries with changelog data (see README.md for structure)
-    """
-    line_no, changes, section, in_compare_urls = 0, [], None, False
+    def between(    self,
+                    lower: Optional[ Union[ Version, str ] ] = None,
+                    upper: Optional[ Union[ Version, str ] ] = None
+                )-> list[ dict[ str, Any ] ]:
+        """
+        Find the released entries within a range of versions
 
-    while ( line := fp.readline() ):
-        line_no += 1
-        if isinstance( line, bytes ):
-            try:
-                line = line.decode( encoding )
-            except Exception as e:
-                raise ChangelogParsingError(
-                    msg = f'Unable to decode line using encoding, "{ encoding }"',
-                    line_number = line_no
-                ) from e
-        if isinstance( line, str ):
-            line = line.removesuffix( '\n' )
-        else:
-            raise ChangelogParsingError(
-                f'Parameter\'s "readline" function call returned unreadable type, "{ type( line ).__name__ }"'
+        :param lower: the least version to include (unbounded if None)
+        :param upper: the greatest version to include (unbounded if None)
+        :return: the entries with versions in the range, greatest version first
+        """
+        versions, changes = self._released()
+        for bound in ( lower, upper ):
+            if bound is not None and not isinstance( _as_version( bound ), Version ):
+                raise ValueError( f'Range bounds must be semver versions, not "{ bound }"' )
+        start = 0 if lower is None else bisect_left( versions, _as_version( lower ) )
+        end = len( versions ) if upper is None else bisect_right( versions, _as_version( upper ) )
+        return changes[ start : end ][ ::-1 ]
+
+    def _released( self )-> tuple[ list[ Version ], list[ dict[ str, Any ] ] ]:
+        """
+        Get the released entries and their versions, sorted by version
+        """
+        if self._sorted is None:
+            released = sorted(
+                ( change for change in self if isinstance( change[ "version" ], Version ) ),
+                key = lambda change: change[ "version" ]
             )
+            self._sorted = ( [ change[ "version" ] for change in released ], released )
+        return self._sorted
 
-        if line.startswith( '## ' ) and not in_compare_urls:
-            if section is not None:
-                if changes[ -1 ][ section ]:
-                    changes[ -1 ][ section ][ -1 ] = changes[ -1 ][ section ][ -1 ].rstrip()
-                section = None
+class _Parser:
+    """
+    Incremental changelog parser. Lines (without their trailing newline) are
+    fed in one at a time, and each release is handed back as soon as the line
+    that closes its block (the next "## " header or the first compare URL) is
+    fed, or when the parser is closed
+    """
+    # Parsing of versions and dates (replaced to time them when collecting statistics)
+    parse_version = staticmethod( _parse_version )
+    parse_date = staticmethod( _parse_date )
 
-            changes.append( { "date": None,  } )
+    def __init__( self, line_no: int = 0, compact: bool = False ):
+        """
+        :param line_no: the number of lines before the first fed line (for error messages)
+        :param compact: create compact Release records instead of dictionaries
+        """
+        self.line_no = line_no
+        self.compact = compact
+        self.release = None
+        self.section = None
+        self.continued = None
+        self.in_compare_urls = False
+        self.index = {}
+        self.compare_urls = {}
+
+    def feed( self, line: str )-> Optional[ dict[ str, Any ] ]:
+        """
+        Parse the next line of changelog data
 
-            if line.rstrip() != line:
+        :param line: a line of changelog data, without its newline
+        :return: the release closed by this line, if any
+        """
+        self.line_no += 1
+
+        # Line types are checked from most to least common; their prefixes don't overlap
+        if not line:
+            if self.section and not self.in_compare_urls:
+                if self.continued is None:
+                    self.continued = [ self.section[ -1 ] ]
+                self.continued.append( line )
+
+        elif self.in_compare_urls:
+            if ( match := _COMPARE_URL_PATTERN.fullmatch( line ) ):
+                self._compare_url( match )
+            else:
                 raise ChangelogParsingError(
-                    msg = "Extra space(s) at end of line",
-                    line_number = line_no,
-                    column_number = len( line.rstrip() ) + 1
+                    'After compare URL definitions have started, no other line types are allowed',
+                    line_number = self.line_no,
+                    rule = 'content-after-compare-urls'
                 )
-            if line.endswith( " [YANKED]" ):
-                changes[ -1 ][ "yanked" ] = True
-                line = line.removesuffix( " [YANKED]" )
+
+        elif line.startswith( ( '- ', '* ' ) ):
+            if self.section is None:
+                if self.release is not None:
+                    raise ChangelogParsingError(
+                        'Change not under a category section',
+                        line_number = self.line_no,
+                        rule = 'change-outside-section'
+                    )
             else:
-                changes[ -1 ][ "yanked" ] = False
-
-            if line.rstrip() != line:
-                raise ChangelogParsingError( "Extra space(s) after date", line_no, len( line.rstrip() ) + 1 )
-            line, sep, change_date = line.partition( ' - ' )
-            if change_date.lstrip() != change_date:
-                raise ChangelogParsingError( "Extra space(s) before date", line_no, len( line + sep ) + 1 )
-            if "]" in line and not line.rstrip().endswith( "]" ):
+                if self.continued is not None:
+                    self._join_continued()
+                self.section.append( line[ 2 : ] )
+
+        elif line.startswith( "  " ) and self.section:
+            if self.continued is None:
+                self.continued = [ self.section[ -1 ] ]
+            self.continued.append( line[ 2 : ] )
+
+        elif line.startswith( '## ' ):
+            closed = self._close_release()
+            self.release = self._release( line )
+            return closed
+
+        elif self.release is None:
+            pass
+
+        elif line.startswith( '### ' ):
+            self._close_section()
+            line = line[ 4 : ]
+            if line not in _CHANGE_TYPES:
                 raise ChangelogParsingError(
-                    msg = 'Version and date must be separated by " - "',
-                    line_number = line_no,
-                    column_number = line.find( "]" ) + 2
+                    f'Invalid change type, "{ line }"', self.line_no, 5, 'invalid-section'
                 )
-            if sep:
-                try:
-                    changes[ -1 ][ "date" ] = date.fromisoformat( change_date )
-                except Exception as e:
-                    raise ChangelogParsingError(
-                        msg = f'Unable to parse changelog entry date, "{ change_date }"',
-                        line_number = line_no,
-                        column_number = len( line + sep ) + 1
-                    ) from e
-
-            if line.rstrip() != line:
+            if line.lower() in self.release:
                 raise ChangelogParsingError(
-                    msg = "Extra space(s) after version",
-                    line_number = line_no,
-                    column_number = len( line.rstrip() ) + 1
+                    f'Multiple "{ line }" sections found', self.line_no, 5, 'duplicate-section'
                 )
-            line = line.removeprefix( "## " )
-            if line.lstrip() != line:
-                raise ChangelogParsingError( "Extra space(s) before version", line_no, 4 )
+            self.release[ line.lower() ] = self.section = []
+
+        elif ( match := _COMPARE_URL_PATTERN.fullmatch( line ) ):
+            closed = self._close_release()
+            self.in_compare_urls = True
+            self._compare_url( match )
+            return closed
+
+        else:
+            raise ChangelogParsingError(
+                f'Unrecognized line pattern, "{ line }"',
+                line_number = self.line_no,
+                rule = 'unrecognized-line'
+            )
+
+        return None
+
+    def close( self )-> Optional[ dict[ str, Any ] ]:
+        """
+        Signal the end of the changelog data
 
-            if not line.startswith( "[" ) or not line.endswith( "]" ):
+        :return: the last release, if it wasn't already closed by a compare URL
+        """
+        return self._close_release()
+
+    def _join_continued( self ):
+        """
+        Join the lines of a change that continued over multiple lines
+        """
+        self.section[ -1 ] = "\n".join( self.continued )
+        self.continued = None
+
+    def _close_section( self ):
+        if self.continued is not None:
+            self._join_continued()
+        if self.section:
+            self.section[ -1 ] = self.section[ -1 ].rstrip()
+        self.section = None
+
+    def _close_release( self )-> Optional[ dict[ str, Any ] ]:
+        self._close_section()
+        closed, self.release = self.release, None
+        if closed is not None:
+            if self.compact:
+                # Compact releases are parsed as dictionaries (with the version left as written), then packed
+                header = ( closed.pop( "version" ), closed.pop( "date" ), closed.pop( "yanked" ) )
+                closed = Release( *header, closed.items() )
+            self.index.setdefault( _version_key( _entry_version( closed ) ), closed )
+        return closed
+
+    def _release( self, line: str )-> dict[ str, Any ]:
+        """
+        Parse a release ("## ") header line, falling back to the line-by-line
+        checks (which pinpoint the problem) when it isn't well formed
+        """
+        if ( match := _RELEASE_PATTERN.fullmatch( line ) ):
+            version, change_date, yanked = match.groups()
+            try:
+                if self.compact:
+                    if _version_key( version ) is None:
+                        version = "Unreleased"
+                elif version.lower() == "unreleased":
+                    version = "Unreleased"
+                else:
+                    version = self.parse_version( version )
+                return {
+                    "date": None if change_date is None else self.parse_date( change_date ),
+                    "yanked": yanked is not None,
+                    "version": version
+                }
+            except ( ValueError, TypeError ):
+                pass
+        return self._check_release( line )
+
+    def _check_release( self, line: str )-> dict[ str, Any ]:
+        """
+        Parse a release ("## ") header line, checking each part of it in turn
+        """
+        release, line_no = { "date": None }, self.line_no
+
+        if line.rstrip() != line:
+            raise ChangelogParsingError(
+                msg = "Extra space(s) at end of line",
+                line_number = line_no,
+                column_number = len( line.rstrip() ) + 1,
+                rule = 'trailing-space'
+            )
+        if line.endswith( " [YANKED]" ):
+            release[ "yanked" ] = True
+            line = line.removesuffix( " [YANKED]" )
+        else:
+            release[ "yanked" ] = False
+
+        if line.rstrip() != line:
+            raise ChangelogParsingError(
+                msg = "Extra space(s) after date",
+                line_number = line_no,
+                column_number = len( line.rstrip() ) + 1,
+                rule = 'extra-space'
+            )
+        line, sep, change_date = line.partition( ' - ' )
+        if change_date.lstrip() != change_date:
+            raise ChangelogParsingError(
+                msg = "Extra space(s) before date",
+                line_number = line_no,
+                column_number = len( line + sep ) + 1,
+                rule = 'extra-space'
+            )
+        if "]" in line and not line.rstrip().endswith( "]" ):
+            raise ChangelogParsingError(
+                msg = 'Version and date must be separated by " - "',
+                line_number = line_no,
+                column_number = line.find( "]" ) + 2,
+                rule = 'date-separator'
+            )
+        if sep:
+            try:
+                release[ "date" ] = self.parse_date( change_date )
+            except Exception as e:
                 raise ChangelogParsingError(
-                    msg = 'Version must be enclosed with square brackets',
+                    msg = f'Unable to parse changelog entry date, "{ change_date }"',
                     line_number = line_no,
-                    column_number = 4 if not line.startswith( "[" ) else 4 + len( line )
-                )
-            line = line.removeprefix( "[" ).removesuffix( "]" )
-            if line.lower() == "unreleased":
-                changes[ -1 ][ "version" ] = line.capitalize()
-            else:
-                try:
-                    changes[ -1 ][ "version" ] = Version.parse( line )
-                except Exception as e:
-                    raise ChangelogParsingError(
-                        msg = f'Failed parsing semver version, "{ line }"',
-                        line_number = line_no,
-                        column_number = 5
-                    ) from e
-
-        elif not changes:
-            continue
-
-        elif line.startswith( '### ' ) and not in_compare_urls:
-            if section is not None and changes[ -1 ][ section ]:
-                changes[ -1 ][ section ][ -1 ] = changes[ -1 ][ section ][ -1 ].rstrip()
-
-            line = line.removeprefix( '### ' )
-            if line not in ( 'Added', 'Changed', 'Deprecated', 'Removed', 'Fixed', 'Security' ):
-                raise ChangelogParsingError( f'Invalid change type, "{ line }"', line_no, 5 )
-            if line.lower() in changes[ -1 ]:
-                raise ChangelogParsingError( f'Multiple "{ line }" sections found', line_no, 5 )
-            changes[ -1 ][ ( section := line.lower() ) ] = []
-
-        elif line.startswith( '- ' ) or line.startswith( '* ' ):
-            if section is None:
-                raise ChangelogParsingError( 'Change not under a category section', line_no )
-            changes[ -1 ][ section ].append( line[ 2 : ] )
-
-        elif ( line.startswith( "  " ) or not line ) and section is not None and changes[ -1 ][ section ]:
-            changes[ -1 ][ section ][ -1 ] += "\n" + line.removeprefix( "  " )
-
-        elif ( match := re.fullmatch( r'\[([^\]]+)\]: (https?:\/\/.*)', line ) ):
-            if match.group( 1 ).lower() == "unreleased":
-                version = match.group( 1 ).capitalize()
-            else:
-                try:
-                    version = Version.parse( match.group( 1 ) )
-                except Exception as e:
-                    raise ChangelogParsingError(
-                        msg = f'Failed parsing semver version, "{ match.group( 1 ) }"',
-                        line_number = line_no,
-                        column_number = 2
-                    ) from e
-
-            for change in changes:
-                if isinstance( change[ "version" ], str ) and isinstance( version, str ):
-                    if change[ "version" ] == version:
-                        break
-                if isinstance( change[ "version" ], Version ) and isinstance( version, Version ):
-                    if change[ "version" ] == version:
-                        break
-            else:
+                    column_number = len( line + sep ) + 1,
+                    rule = 'invalid-date'
+                ) from e
+
+        if line.rstrip() != line:
+            raise ChangelogParsingError(
+                msg = "Extra space(s) after version",
+                line_number = line_no,
+                column_number = len( line.rstrip() ) + 1,
+                rule = 'extra-space'
+            )
+        line = line.removeprefix( "## " )
+        if line.lstrip() != line:
+            raise ChangelogParsingError( "Extra space(s) before version", line_no, 4, 'extra-space' )
+
+        if not line.startswith( "[" ) or not line.endswith( "]" ):
+            raise ChangelogParsingError(
+                msg = 'Version must be enclosed with square brackets',
+                line_number = line_no,
+                column_number = 4 if not line.startswith( "[" ) else 4 + len( line ),
+                rule = 'version-brackets'
+            )
+        line = line.removeprefix( "[" ).removesuffix( "]" )
+        if line.lower() == "unreleased":
+            release[ "version" ] = line.capitalize()
+        else:
+            try:
+                release[ "version" ] = self.parse_version( line )
+            except Exception as e:
                 raise ChangelogParsingError(
-                    msg = f'No corresponding record for compare url with version, "{ match.group( 1 ) }"',
+                    msg = f'Failed parsing semver version, "{ line }"',
                     line_number = line_no,
-                    column_number = 2
-                )
+                    column_number = 5,
+                    rule = 'invalid-version'
+                ) from e
 
-            change[ "compare_url" ] = match.group( 2 )
-            in_compare_urls = True
+        return release
 
-        elif not line:
-            continue
+    def _compare_url( self, match: re.Match ):
+        """
+        Attach a compare URL ("[version]: https://...") to its release
+        """
+        try:
+            key = _version_key( match.group( 1 ) )
+        except ValueError as e:
+            raise ChangelogParsingError(
+                msg = f'Failed parsing semver version, "{ match.group( 1 ) }"',
+                line_number = self.line_no,
+                column_number = 2,
+                rule = 'invalid-version'
+            ) from e
 
-        elif in_compare_urls:
+        if ( release := self.index.get( key ) ) is None:
             raise ChangelogParsingError(
-                'After compare URL definitions have started, no other line types are allowed',
-                line_number = line_no
+                msg = f'No corresponding record for compare url with version, "{ match.group( 1 ) }"',
+                line_number = self.line_no,
+                column_number = 2,
+                rule = 'unknown-compare-url-version'
             )
+        release[ "compare_url" ] = match.group( 2 )
+        line_no, text, _ = self.compare_urls.get( key, ( self.line_no, match.group( 1 ), None ) )
+        self.compare_urls[ key ] = ( line_no, text, match.group( 2 ) )
 
-        else:
-            raise ChangelogParsingError( f'Unrecognized line pattern, "{ line }"', line_no )
+def _decode_error( encoding: str, line_no: int )-> ChangelogParsingError:
+    """
+    Create the error for data that couldn't be decoded
+    """
+    return ChangelogParsingError(
+        msg = f'Unable to decode line using encoding, "{ encoding }"',
+        line_number = line_no,
+        rule = 'decode-error'
+    )
 
-    if section is not None and changes[ -1 ][ section ]:
-        changes[ -1 ][ section ][ -1 ] = changes[ -1 ][ section ][ -1 ].rstrip()
+def _decode_line( line: Any, encoding: str, line_no: int )-> str:
+    """
+    Decode a line read from a stream if needed, and remove its newline
+    """
+    if isinstance( line, bytes ):
+        try:
+            line = line.decode( encoding )
+        except Exception as e:
+            raise _decode_error( encoding, line_no ) from e
+    if not isinstance( line, str ):
+        raise ChangelogParsingError(
+            f'Parameter\'s "readline" function call returned unreadable type, '
+            f'"{ type( line ).__name__ }"',
+            rule = 'unreadable-type'
+        )
+    return line.removesuffix( '\n' )
+
+def _read_lines( fp: IOBase, encoding: str )-> Iterator[ str ]:
+    """
+    Read lines from a stream, decoding them if needed and removing newlines
+    """
+    line_no = 0
+    while ( line := fp.readline() ):
+        line_no += 1
+        yield _decode_line( line, encoding, line_no )
+
+def _parse( lines: Iterable[ str ],
+            limit: Optional[ int ] = None,
+            until: Optional[ Callable[ [ Union[ Version, str ] ], bool ] ] = None,
+            compact: bool = False,
+            parser: Optional[ _Parser ] = None
+        )-> Iterator[ dict[ str, Any ] ]:
+    """
+    Feed lines to a parser, yielding the releases it closes
+    """
+    releases = _Releases( _Parser( compact = compact ) if parser is None else parser, limit, until )
+    for line in ( () if releases.stopped else lines ):
+        yield from releases.feed( line )
+        if releases.stopped:
+            return
+    yield from releases.close()
+
+def _split_lines( s: str )-> list[ str ]:
+    """
+    Split a string into lines the same way reading them from a stream would
+    """
+    lines = s.split( "\n" )
+    if not lines[ -1 ]:
+        lines.pop()
+    return lines
+
+def _decode( buf: Any, encoding: str )-> str:
+    """
+    Decode a whole buffer at once, reporting errors on the line that holds
+    the undecodable data. As when reading the data line by line, an error
+    parsing the lines before that one is raised first
+    """
+    try:
+        return str( buf, encoding )
+    except UnicodeDecodeError as e:
+        error = e
+    except Exception as e:
+        raise _decode_error( encoding, 1 ) from e
+
+    prefix = memoryview( buf )[ : error.start ].tobytes()
+    try:
+        lines = _split_lines( str( prefix[ : prefix.rfind( b"\n" ) + 1 ], encoding ) )
+    except UnicodeError:
+        lines = []
+    parser = _Parser()
+    for line in lines:
+        parser.feed( line )
+    raise _decode_error( encoding, prefix.count( b"\n" ) + 1 ) from error
+
+def iter_load(  fp: IOBase,
+                encoding: str = 'utf-8',
+                *,
+                limit: Optional[ int ] = None,
+                until: Optional[ Callable[ [ Union[ Version, str ] ], bool ] ] = None,
+                compact: bool = False,
+                stats: Optional[ Callable[ [ 'ParseStats' ], Any ] ] = None
+            )-> Iterator[ dict[ str, Any ] ]:
+    """
+    Parse changelog data from a stream, yielding each release as soon as its
+    block is closed (by the next "## " header, the compare URLs, or the end of
+    the stream). Compare URLs are only defined after every release, so they're
+    set on the already yielded dictionaries as they're read (ie. by the time
+    the generator is exhausted); stopping early (see "limit" and "until") skips
+    them
+
+    :param fp: a stream that outputs changelog data (eg. a file opened for reading)
+    :param encoding: if the stream outputs binary data, decode it using this encoding
+    :param limit: stop reading the stream after this many releases were yielded
+    :param until: stop reading the stream after yielding a release whose version this returns true for
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :param stats: call this with statistics about parsing once the generator finishes (see "ParseStats")
+    :return: a generator of dictionaries with changelog data (see README.md for structure)
+    """
+    if stats is not None:
+        return _stats_module().profile_stream( fp, encoding, limit, until, compact, stats )
+    return _parse( _read_lines( fp, encoding ), limit, until, compact )
+
+def iter_loads(   s: str,
+                *,
+                limit: Optional[ int ] = None,
+                until: Optional[ Callable[ [ Union[ Version, str ] ], bool ] ] = None,
+                compact: bool = False,
+                stats: Optional[ Callable[ [ 'ParseStats' ], Any ] ] = None
+            )-> Iterator[ dict[ str, Any ] ]:
+    """
+    Parse changelog data from a string, yielding each release as soon as its
+    block is closed (see "iter_load")
+
+    :param s: the string to parse as a changelog
+    :param limit: stop parsing after this many releases were yielded
+    :param until: stop parsing after yielding a release whose version this returns true for
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :param stats: call this with statistics about parsing once the generator finishes (see "ParseStats")
+    :return: a generator of dictionaries with changelog data (see README.md for structure)
+    """
+    if stats is not None:
+        return _stats_module().profile_string( s, limit, until, compact, stats )
+    return _parse( _split_lines( s ), limit, until, compact )
+
+def load(   fp: IOBase,
+            encoding: str = 'utf-8',
+            *,
+            compact: bool = False,
+            stats: Optional[ Callable[ [ 'ParseStats' ], Any ] ] = None
+        )-> Changelog:
+    """
+    Parse changelog data from a stream
 
-    return changes
+    :param input: a stream that outputs changelog data (eg. a file opened for reading)
+    :param encoding: if the stream outputs binary data, decode it using this encoding
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :param stats: call this with statistics about parsing, even if it fails (see "ParseStats")
+    :return: a list of dictionaries with changelog data (see README.md for structure)
+    """
+    return Changelog( iter_load( fp, encoding, compact = compact, stats = stats ) )
 
-def loads( s: str )-> list[ dict[ str, Any ] ]:
+def loads(  s: str,
+            *,
+            compact: bool = False,
+            stats: Optional[ Callable[ [ 'ParseStats' ], Any ] ] = None
+        )-> Changelog:
     """
     Parse data from a changelog provided as a string
 
     :param input: the string parse as a changelog
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :param stats: call this with statistics about parsing, even if it fails (see "ParseStats")
     :return: a list of dictionaries with changelog data (see README.md for structure)
     """
-    return load( StringIO( s ) )
+    if stats is not None:
+        return Changelog( _stats_module().profile_string( s, None, None, compact, stats ) )
+    return Changelog( _parse( _split_lines( s ), compact = compact ) )
+
+def load_bytes( buf: Any,
+                encoding: str = 'utf-8',
+                *,
+                compact: bool = False,
+                stats: Optional[ Callable[ [ 'ParseStats' ], Any ] ] = None
+            )-> Changelog:
+    """
+    Parse changelog data from a bytes-like object (eg. bytes, a memoryview, or
+    an mmap), decoding it all at once. Equivalent to (but faster than) "load"
+    of a binary stream of the same data
+
+    :param buf: the changelog data
+    :param encoding: decode the data using this encoding
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :param stats: call this with statistics about parsing, even if it fails (see "ParseStats")
+    :return: a list of dictionaries with changelog data (see README.md for structure)
+    """
+    if stats is not None:
+        return Changelog( _stats_module().profile_bytes( buf, encoding, None, None, compact, stats ) )
+    return loads( _decode( buf, encoding ), compact = compact ) if len( buf ) else Changelog()
+
+def load_path(   path: Union[ str, os.PathLike ],
+                encoding: str = 'utf-8',
+                *,
+                compact: bool = False,
+                stats: Optional[ Callable[ [ 'ParseStats' ], Any ] ] = None
+            )-> Changelog:
+    """
+    Parse changelog data from a file, memory mapping it (if it's a regular
+    file) and decoding it all at once. Equivalent to (but faster than) "load"
+    of the file opened for reading binary data
+
+    :param path: the path of the changelog file
+    :param encoding: decode the data using this encoding
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :param stats: call this with statistics about parsing, even if it fails (see "ParseStats")
+    :return: a list of dictionaries with changelog data (see README.md for structure)
+    """
+    with open( path, 'rb' ) as fp:
+        # Pipes, and files like those in /proc, can't be memory mapped (and report a size of 0), so are read
+        if not stat.S_ISREG( ( info := os.fstat( fp.fileno() ) ).st_mode ) or not info.st_size:
+            return load_bytes( fp.read(), encoding, compact = compact, stats = stats )
+        with mmap.mmap( fp.fileno(), 0, access = mmap.ACCESS_READ ) as buf:
+            return load_bytes( buf, encoding, compact = compact, stats = stats )
 
 DEFAULT_HEADER = """
 # Changelog
@@ -226,24 +682,29 @@ The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
 and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
 """.strip()
 
-def dump(   obj: list[ dict[ str, Any ] ],
-            fp: IOBase,
-            header: str = DEFAULT_HEADER,
-            encoding: str = 'utf-8'
-        )-> None:
+def _dump_change( item: str )-> str:
     """
-    Format and write changelog data to a stream
+    Format a change as a list item, indenting any lines after its first
+    """
+    # A single line needs no indenting (checked first, as "textwrap.indent" is comparatively slow)
+    if item.isprintable() and item.strip():
+        return "- " + item + "\n"
+    return "-" + textwrap.indent( item, "  " )[ 1 : ] + "\n"
 
-    :param obj: the changelog data to format and write (see README.md for structure)
-    :param fp: stream to write the changelog data to
-    :param header: head text to add before changelog data
-    :param encoding: if the stream expects binary data, decode string data with this encoding
+def _format( obj: Iterable[ Mapping[ str, Any ] ], header: str )-> Iterator[ str ]:
     """
-    if not isinstance( obj, list ) or any( not isinstance( i, dict ) for i in obj ):
+    Format changelog data, validating it as it goes, into chunks of many lines
+    """
+    if isinstance( obj, ( str, bytes, Mapping ) ) or not isinstance( obj, Iterable ):
         raise ValueError( '"obj" parameter must be a list of dictionaries' )
-    encode = lambda i : i if isinstance( fp, TextIOBase ) else i.encode( encoding )
-    fp.writelines( encode( header + "\n" ).splitlines( keepends = True ) )
+
+    # Compare URLs are written after every entry, and only looked up then (as "iter_load" sets them once it
+    # reads them), so the entries are kept until the end
+    buffer, versions = [ header + "\n" ], []
     for number, change in enumerate( obj, start = 1 ):
+        if not isinstance( change, Mapping ):
+            raise ValueError( '"obj" parameter must be a list of dictionaries' )
+
         # Handle "version" part of the change object
         if "version" not in change:
             raise ValueError( f'Changelog entry #{ number } was missing a "version" key' )
@@ -255,48 +716,72 @@ def dump(   obj: list[ dict[ str, Any ] ],
                 f'The value associated with the "version" key of changelog entry #{ number }, "{ version }", '
                 'was not a semver Version or the string "Unreleased" (ignoring case)'
             )
-        line = f'## [{ version }]'
+        line = f'\n## [{ version }]'
 
         # Handle "date" part of the change object
-        if "date" in change and isinstance( change[ "date" ], date ):
-            line += " - " + change[ "date" ].isoformat()
-        elif change.get( "date" ) is not None:
+        change_date = change.get( "date" )
+        if isinstance( change_date, date ):
+            line += " - " + change_date.isoformat()
+        elif change_date is not None:
             raise ValueError(
                 'The value associated with the "date" key of changelog entry '
-                f'#{ number }, "{ change[ "date" ] }", was not a datetime date or None'
+                f'#{ number }, "{ change_date }", was not a datetime date or None'
             )
 
         # Handle "yanked" part of the change object
-        print(type(change.get("yanked")))
-        if not isinstance( change.get( "yanked", False ), bool):
+        yanked = change.get( "yanked", False )
+        if not isinstance( yanked, bool ):
             raise ValueError(
                 'The value associated with the "yanked" key of changelog entry '
-                f'#{ number }, "{ change[ "yanked" ] }", was not a boolean'
+                f'#{ number }, "{ yanked }", was not a boolean'
             )
-        if change.get( "yanked", False ):
-            line += " [YANKED]"
-
-        # Write the assembled lines
-        fp.writelines( ( encode( i ) for i in ( "\n", line + "\n" ) ) )
+        buffer.append( line + " [YANKED]\n" if yanked else line + "\n" )
 
         # Handle writing the changes
-        for key in change.keys():
-            if key in ( 'added', 'changed', 'deprecated', 'removed', 'fixed', 'security' ):
-                fp.writelines( ( encode( i ) for i in ( "\n", f'### { key.capitalize() }' + "\n" ) ) )
-                if isinstance( change[ key ], list ):
-                    fp.writelines( ( encode( "\n" ), ) )
-                    for item in change[ key ]:
-                        fp.writelines( ( encode( "-" + textwrap.indent( item, "  " )[ 1 : ] + "\n" ), ) )
-    if any( "compare_url" in change for change in obj ):
-        fp.writelines( ( encode( i ) for i in ( "\n" ) ) )
-    for change in obj:
-        if "compare_url" in change:
-            version = change[ "version" ]
-            if isinstance( version, str ) and version.lower() == "unreleased":
-                version = version.lower()
-            fp.writelines( ( encode( f'[{ version }]: { change[ "compare_url" ] }\n' ), ) )
-
-def dumps( obj: list[ dict[ str, Any ] ], header: str = DEFAULT_HEADER )-> str:
+        for key, changes in change.items():
+            if key in _SECTION_KEYS:
+                buffer.append( f'\n### { key.capitalize() }\n' )
+                if isinstance( changes, ( list, tuple ) ):
+                    buffer.append( "\n" )
+                    buffer.extend( map( _dump_change, changes ) )
+
+        versions.append( ( version.lower() if isinstance( version, str ) else version, change ) )
+        if len( buffer ) >= _DUMP_BUFFER_LINES:
+            yield "".join( buffer )
+            buffer.clear()
+
+    if any( "compare_url" in change for _, change in versions ):
+        buffer.append( "\n" )
+        for version, change in versions:
+            if "compare_url" in change:
+                buffer.append( f'[{ version }]: { change[ "compare_url" ] }\n' )
+    yield "".join( buffer )
+
+def dump(   obj: Iterable[ Mapping[ str, Any ] ],
+            fp: IOBase,
+            header: str = DEFAULT_HEADER,
+            encoding: str = 'utf-8'
+        )-> None:
+    """
+    Format and write changelog data to a stream. The data is formatted into a
+    buffer, which is written (and encoded) in large chunks, so the output is
+    never all held in memory, and can be any iterable (like "iter_load"'s
+    generator). If the data is invalid, the stream may be left partially
+    written (see "dump_path" to write a file atomically)
+
+    :param obj: the changelog data to format and write (see README.md for structure)
+    :param fp: stream to write the changelog data to
+    :param header: head text to add before changelog data
+    :param encoding: if the stream expects binary data, decode string data with this encoding
+    """
+    if isinstance( fp, TextIOBase ):
+        for chunk in _format( obj, header ):
+            fp.write( chunk )
+    else:
+        for chunk in _format( obj, header ):
+            fp.write( chunk.encode( encoding ) )
+
+def dumps( obj: Iterable[ Mapping[ str, Any ] ], header: str = DEFAULT_HEADER )-> str:
     """
     Format and write changelog data to a string
 
@@ -312,11 +797,95 @@ def dumps( obj: list[ dict[ str, Any ] ], header: str = DEFAULT_HEADER )-> str:
 __all__ = [
     '__version__',
     'ChangelogParsingError',
+    'Changelog',
+    'Release',
     'load',
     'loads',
+    'load_bytes',
+    'load_path',
+    'iter_load',
+    'iter_loads',
     'dump',
-    'dumps'
+    'dumps',
+    'dump_path',
+    'aload',
+    'aiter_load',
+    'adump',
+    'load_many',
+    'ParseCache',
+    'ChangelogDocument',
+    'ParseStats',
+    'Diagnostic',
+    'validate',
+    'validates',
+    'to_sarif',
+    'ReleaseIndex',
+    'load_release',
+    'diff',
+    'ChangelogDiff',
+    'prepend_release',
+    'promote_unreleased',
+    'mark_yanked',
+    'set_compare_url',
+    'ChangelogTable',
+    'load_documents',
+    'InternInfo',
+    'set_intern_size',
+    'intern_info'
 ]
 
+# Attributes defined in submodules, which are only imported when first used
+if TYPE_CHECKING:
+    from ._files import dump_path
+    from ._async import ( aload, aiter_load, adump )
+    from ._parallel import load_many
+    from ._cache import ParseCache
+    from ._incremental import ChangelogDocument
+    from ._stats import ParseStats
+    from ._validate import ( Diagnostic, validate, validates, to_sarif )
+    from ._index import ( ReleaseIndex, load_release )
+    from ._diff import ( diff, ChangelogDiff )
+    from ._edit import ( prepend_release, promote_unreleased, mark_yanked, set_compare_url )
+    from ._table import ChangelogTable
+    from ._documents import load_documents
+
+_SUBMODULE_ATTRIBUTES = {
+    'dump_path': '_files',
+    'aload': '_async',
+    'aiter_load': '_async',
+    'adump': '_async',
+    'load_many': '_parallel',
+    'ParseCache': '_cache',
+    'ChangelogDocument': '_incremental',
+    'ParseStats': '_stats',
+    'Diagnostic': '_validate',
+    'validate': '_validate',
+    'validates': '_validate',
+    'to_sarif': '_validate',
+    'ReleaseIndex': '_index',
+    'load_release': '_index',
+    'diff': '_diff',
+    'ChangelogDiff': '_diff',
+    'prepend_release': '_edit',
+    'promote_unreleased': '_edit',
+    'mark_yanked': '_edit',
+    'set_compare_url': '_edit',
+    'ChangelogTable': '_table',
+    'load_documents': '_documents'
+}
+
+def _stats_module()-> Any:
+    """
+    Import the module collecting parsing statistics, only once they're requested
+    """
+    return importlib.import_module( '._stats', __name__ )
+
+def __getattr__( name: str )-> Any:
+    if name not in _SUBMODULE_ATTRIBUTES:
+        raise AttributeError( f'module "{ __name__ }" has no attribute "{ name }"' )
+    value = getattr( importlib.import_module( f'.{ _SUBMODULE_ATTRIBUTES[ name ] }', __name__ ), name )
+    globals()[ name ] = value
+    return value
+
 def __dir__() -> list[str]:
     return __all__
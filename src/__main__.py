@@ -0,0 +1,11 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Run the "changelog" command with "python -m changelog" (see "cli")
+"""
+
+import sys
+from .cli import main
+
+if __name__ == '__main__':
+    sys.exit( main() )
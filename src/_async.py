@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Loading and dumping changelogs with asynchronous streams (eg. asyncio's
+StreamReader and StreamWriter)
+"""
+
+import inspect
+from typing import ( Any, AsyncIterator, Callable, Iterable, Optional, Union )
+from collections.abc import Mapping
+from semver import Version
+from . import ( DEFAULT_HEADER, Changelog, ChangelogParsingError, _Parser, _Releases, _decode_line, _format )
+
+_READ_SIZE = 1 << 16
+
+async def _read_lines( reader: Any )-> AsyncIterator[ Any ]:
+    """
+    Read lines (with their newlines) from an asynchronous stream, with its
+    "readline" if it has one, otherwise by splitting the chunks its "read"
+    returns as they arrive
+    """
+    if hasattr( reader, 'readline' ):
+        while ( line := await reader.readline() ):
+            yield line
+        return
+
+    pending = None
+    while ( chunk := await reader.read( _READ_SIZE ) ):
+        if not isinstance( chunk, ( bytes, str ) ):
+            raise ChangelogParsingError(
+                f'Parameter\'s "read" function call returned unreadable type, '
+                f'"{ type( chunk ).__name__ }"',
+                rule = 'unreadable-type'
+            )
+        if pending:
+            chunk = pending + chunk
+        newline, start = b"\n" if isinstance( chunk, bytes ) else "\n", 0
+        while ( end := chunk.find( newline, start ) ) != -1:
+            yield chunk[ start : end + 1 ]
+            start = end + 1
+        pending = chunk[ start : ]
+    if pending:
+        yield pending
+
+async def aiter_load(   reader: Any,
+                        encoding: str = 'utf-8',
+                        *,
+                        limit: Optional[ int ] = None,
+                        until: Optional[ Callable[ [ Union[ Version, str ] ], bool ] ] = None,
+                        compact: bool = False
+                    )-> AsyncIterator[ dict[ str, Any ] ]:
+    """
+    Parse changelog data from an asynchronous stream, yielding each release as
+    soon as its block is closed (see "iter_load"). Lines are parsed as they're
+    read, rather than after the whole stream is
+
+    :param reader: an object with an awaitable "readline" (eg. an asyncio StreamReader), or "read" of a size
+    :param encoding: if the stream outputs binary data, decode it using this encoding
+    :param limit: stop reading the stream after this many releases were yielded
+    :param until: stop reading the stream after yielding a release whose version this returns true for
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :return: an asynchronous generator of dictionaries with changelog data (see README.md for structure)
+    """
+    releases = _Releases( _Parser( compact = compact ), limit, until )
+    if releases.stopped:
+        return
+    async for line in _read_lines( reader ):
+        for release in releases.feed( _decode_line( line, encoding, releases.parser.line_no + 1 ) ):
+            yield release
+        if releases.stopped:
+            return
+    for release in releases.close():
+        yield release
+
+async def aload( reader: Any, encoding: str = 'utf-8', *, compact: bool = False )-> Changelog:
+    """
+    Parse changelog data from an asynchronous stream (see "aiter_load")
+
+    :param reader: an object with an awaitable "readline" (eg. an asyncio StreamReader), or "read" of a size
+    :param encoding: if the stream outputs binary data, decode it using this encoding
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :return: a list of dictionaries with changelog data (see README.md for structure)
+    """
+    return Changelog( [ release async for release in aiter_load( reader, encoding, compact = compact ) ] )
+
+async def adump(    obj: Iterable[ Mapping[ str, Any ] ],
+                    writer: Any,
+                    header: str = DEFAULT_HEADER,
+                    encoding: Optional[ str ] = 'utf-8'
+                )-> None:
+    """
+    Format and write changelog data to an asynchronous stream, in large chunks,
+    waiting for the stream to drain after each (see "dump")
+
+    :param obj: the changelog data to format and write (see README.md for structure)
+    :param writer: an object with a "write" (eg. an asyncio StreamWriter), and optionally an awaitable "drain"
+    :param header: head text to add before changelog data
+    :param encoding: encode the data with this encoding (or None to write strings)
+    """
+    drain = getattr( writer, 'drain', None )
+    for chunk in _format( obj, header ):
+        result = writer.write( chunk if encoding is None else chunk.encode( encoding ) )
+        if inspect.isawaitable( result ):
+            await result
+        if drain is not None:
+            await drain()
@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Caching parsed changelogs by the hash of their contents
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import ( OrderedDict, namedtuple )
+from io import IOBase
+from typing import ( Any, Callable, Optional, Union )
+from . import ( __version__, Changelog, load_bytes, loads )
+
+CacheInfo = namedtuple( 'CacheInfo', ( 'hits', 'disk_hits', 'misses', 'entries', 'size' ) )
+
+def _copy( changes: list[ dict[ str, Any ] ] )-> Changelog:
+    """
+    Copy parsed changelog data down to its lists of changes (versions and dates
+    are immutable, so they're shared)
+    """
+    return Changelog(
+        { key: ( list( value ) if isinstance( value, list ) else value ) for key, value in change.items() }
+        for change in changes
+    )
+
+class ParseCache:
+    """
+    A cache of parsed changelogs, keyed by a hash of the changelog data and the
+    version of this package. Recently used results are kept in memory and,
+    optionally, in a directory shared between processes. Every call returns an
+    independent copy, so changing a result doesn't change the cache
+
+    Cached files are pickled, so only use a directory that untrusted users can't write to
+    """
+    def __init__(   self,
+                    max_entries: Optional[ int ] = 128,
+                    max_size: Optional[ int ] = None,
+                    directory: Optional[ Union[ str, os.PathLike ] ] = None,
+                    max_directory_entries: Optional[ int ] = None,
+                    max_directory_size: Optional[ int ] = None
+                ):
+        """
+        :param max_entries: the most results to keep in memory (unlimited if None)
+        :param max_size: the most bytes of changelog data to keep results of in memory (unlimited if None)
+        :param directory: a directory to also keep results in (only kept in memory if None)
+        :param max_directory_entries: the most results to keep in the directory (unlimited if None)
+        :param max_directory_size: the most bytes of results to keep in the directory (unlimited if None)
+        """
+        self.max_entries, self.max_size = max_entries, max_size
+        self.directory = None if directory is None else os.fspath( directory )
+        self.max_directory_entries, self.max_directory_size = max_directory_entries, max_directory_size
+        self.hits = self.disk_hits = self.misses = 0
+        self._entries, self._size, self._lock = OrderedDict(), 0, threading.Lock()
+        if self.directory is not None:
+            os.makedirs( self.directory, exist_ok = True )
+
+    def info( self )-> CacheInfo:
+        """
+        :return: hit and miss counts (hits include disk hits), and the count and data size of in memory
+            results
+        """
+        with self._lock:
+            return CacheInfo( self.hits, self.disk_hits, self.misses, len( self._entries ), self._size )
+
+    def clear( self )-> None:
+        """
+        Drop the results kept in memory and reset the counters (results in the directory are kept)
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = self.hits = self.disk_hits = self.misses = 0
+
+    def load( self, fp: IOBase, encoding: str = 'utf-8' )-> Changelog:
+        """
+        Parse changelog data from a stream, reading all of it (see "changelog.load")
+        """
+        data = fp.read()
+        return self.loads( data ) if isinstance( data, str ) else self.load_bytes( data, encoding )
+
+    def loads( self, s: str )-> Changelog:
+        """
+        Parse changelog data from a string (see "changelog.loads")
+        """
+        return self._get( s.encode( 'utf-8', 'surrogatepass' ), 'str', lambda: loads( s ) )
+
+    def load_bytes( self, buf: Any, encoding: str = 'utf-8' )-> Changelog:
+        """
+        Parse changelog data from a bytes-like object (see "changelog.load_bytes")
+        """
+        return self._get( buf, f'bytes:{ encoding }', lambda: load_bytes( buf, encoding ) )
+
+    def load_path( self, path: Union[ str, os.PathLike ], encoding: str = 'utf-8' )-> Changelog:
+        """
+        Parse changelog data from a file (see "changelog.load_path")
+        """
+        with open( path, 'rb' ) as fp:
+            return self.load_bytes( fp.read(), encoding )
+
+    def _get( self, data: Any, kind: str, parse: Callable[ [], Changelog ] )-> Changelog:
+        """
+        Get a copy of a cached result, parsing and caching it on a miss
+        """
+        digest = hashlib.sha256( f'{ __version__ }\0{ kind }\0'.encode() )
+        digest.update( data )
+        key, size = digest.hexdigest(), len( data )
+
+        with self._lock:
+            if ( cached := self._entries.get( key ) ) is not None:
+                self._entries.move_to_end( key )
+                self.hits += 1
+                return _copy( cached[ 0 ] )
+
+        if ( entry := self._read( key ) ) is not None:
+            with self._lock:
+                self.hits += 1
+                self.disk_hits += 1
+        else:
+            entry = parse()
+            with self._lock:
+                self.misses += 1
+            self._write( key, entry )
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[ key ] = ( entry, size )
+                self._size += size
+            while self._entries and (
+                    ( self.max_entries is not None and self.max_entries < len( self._entries ) )
+                    or ( self.max_size is not None and self.max_size < self._size ) ):
+                self._size -= self._entries.popitem( last = False )[ 1 ][ 1 ]
+        return _copy( entry )
+
+    def _read( self, key: str )-> Optional[ Changelog ]:
+        """
+        Read a result from the directory, if it's there
+        """
+        if self.directory is None:
+            return None
+        path = os.path.join( self.directory, key + '.pickle' )
+        try:
+            with open( path, 'rb' ) as fp:
+                entry = pickle.load( fp )
+            os.utime( path )
+        except Exception:           # a missing, partial, or corrupt file is a miss (and gets replaced)
+            return None
+        return entry if isinstance( entry, Changelog ) else None
+
+    def _write( self, key: str, entry: Changelog )-> None:
+        """
+        Write a result to the directory (atomically, so concurrent readers never
+        see a partial file), then evict the least recently used results. A
+        result that can't be written (eg. to a full disk, or a directory that's
+        read only) is only kept in memory
+        """
+        if self.directory is None:
+            return
+        try:
+            fd, temp_path = tempfile.mkstemp( dir = self.directory, prefix = '.', suffix = '.tmp' )
+        except OSError:
+            return
+        try:
+            with os.fdopen( fd, 'wb' ) as fp:
+                pickle.dump( entry, fp, protocol = pickle.HIGHEST_PROTOCOL )
+            os.replace( temp_path, os.path.join( self.directory, key + '.pickle' ) )
+        except BaseException as e:
+            try:
+                os.remove( temp_path )
+            except OSError:
+                pass
+            if isinstance( e, OSError ):
+                return
+            raise
+
+        if self.max_directory_entries is None and self.max_directory_size is None:
+            return
+        files = []
+        try:
+            with os.scandir( self.directory ) as entries:
+                for file in entries:
+                    if file.name.endswith( '.pickle' ):
+                        try:
+                            stat = file.stat()
+                        except FileNotFoundError:
+                            continue
+                        files.append( ( stat.st_mtime, stat.st_size, file.path ) )
+        except OSError:
+            return
+        files.sort()
+        count, size = len( files ), sum( file[ 1 ] for file in files )
+        for _, file_size, path in files:
+            if ( ( self.max_directory_entries is None or count <= self.max_directory_entries )
+                    and ( self.max_directory_size is None or size <= self.max_directory_size ) ):
+                break
+            try:
+                os.remove( path )
+            except OSError:
+                pass
+            count, size = count - 1, size - file_size
@@ -0,0 +1,260 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Comparing two versions of a changelog, release by release
+"""
+
+import mmap
+import codecs
+from difflib import SequenceMatcher
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import ( Any, Iterable, Optional, Union )
+from . import ( ChangelogParsingError, _SECTION_KEYS, _as_version, _decode, _entry_version, _version_key )
+from . import load_bytes
+from ._index import ( _blocks, _footer_urls, _header, _normalize, _parse_block )
+
+SectionDiff = namedtuple( 'SectionDiff', ( 'inserted', 'deleted' ) )
+ReleaseDiff = namedtuple( 'ReleaseDiff', ( 'version', 'sections', 'date', 'yanked', 'compare_url' ) )
+
+class ChangelogDiff( namedtuple( 'ChangelogDiff', ( 'added', 'removed', 'changed', 'history_rewritten' ) ) ):
+    """
+    The changes between two versions of a changelog: the versions of the
+    releases "added" and "removed", the ReleaseDiff of each release "changed",
+    and whether "history_rewritten" (a released entry was removed, or its date
+    or changes were edited). It's false if there are no changes
+    """
+    __slots__ = ()
+
+    def __bool__( self )-> bool:
+        return bool( self.added or self.removed or self.changed )
+
+def _raw( obj: Any, encoding: str )-> Optional[ tuple[ Any, str ] ]:
+    """
+    Get the data, and its encoding, of a changelog that's given as a string,
+    bytes-like object, or stream (None if it's given as parsed releases)
+    """
+    if hasattr( obj, 'read' ):
+        obj = obj.read()
+        if not isinstance( obj, ( str, bytes ) ):
+            raise ChangelogParsingError(
+                f'Parameter\'s "read" function call returned unreadable type, '
+                f'"{ type( obj ).__name__ }"',
+                rule = 'unreadable-type'
+            )
+    if isinstance( obj, str ):
+        return obj.encode( 'utf-8', 'surrogatepass' ), 'utf-8'
+    if isinstance( obj, ( bytes, mmap.mmap ) ):
+        return obj, encoding
+    if isinstance( obj, ( bytearray, memoryview ) ):
+        return bytes( obj ), encoding
+    return None
+
+def _pair( old: Any, new: Any )-> Optional[ tuple[ Any, Any ] ]:
+    """
+    Pair the old and new values of a field, if they differ
+    """
+    return None if old == new else ( old, new )
+
+def _diff_items( old: Iterable[ str ], new: Iterable[ str ] )-> SectionDiff:
+    """
+    Find the changes inserted into, and deleted from, a section
+    """
+    old, new = list( old ), list( new )
+    inserted, deleted = [], []
+    for tag, old_start, old_end, new_start, new_end in SequenceMatcher( None, old, new, False ).get_opcodes():
+        if tag in ( 'delete', 'replace' ):
+            deleted.extend( zip( range( old_start, old_end ), old[ old_start : old_end ] ) )
+        if tag in ( 'insert', 'replace' ):
+            inserted.extend( zip( range( new_start, new_end ), new[ new_start : new_end ] ) )
+    return SectionDiff( inserted, deleted )
+
+def _diff_release(  old: Mapping[ str, Any ],
+                    new: Mapping[ str, Any ],
+                    compare_urls: bool = True
+                )-> Optional[ ReleaseDiff ]:
+    """
+    Compare two versions of a release, if they differ
+    """
+    # Equal dictionaries are skipped without comparing them field by field
+    if isinstance( old, dict ) and isinstance( new, dict ) and old == new:
+        return None
+    sections = {
+        key: _diff_items( old.get( key, () ), new.get( key, () ) ) for key in _SECTION_KEYS
+        if tuple( old.get( key, () ) ) != tuple( new.get( key, () ) )
+    }
+    changes = ReleaseDiff(
+        new[ "version" ],
+        sections,
+        _pair( old.get( "date" ), new.get( "date" ) ),
+        _pair( old.get( "yanked", False ), new.get( "yanked", False ) ),
+        _pair( old.get( "compare_url" ), new.get( "compare_url" ) ) if compare_urls else None
+    )
+    return changes if changes[ 1 : ] != ( {}, None, None, None ) else None
+
+def _rewrites_history( key: Optional[ tuple ], changes: Optional[ ReleaseDiff ] )-> bool:
+    """
+    Check whether a release that was removed (without changes) or changed was a
+    released entry whose date or changes were edited
+    """
+    return key is not None and ( changes is None or bool( changes.sections or changes.date ) )
+
+def _by_key( releases: Iterable[ Mapping[ str, Any ] ] )-> dict[ Optional[ tuple ], Mapping[ str, Any ] ]:
+    """
+    Index releases by version (the first one, if a version is listed more than once)
+    """
+    index = {}
+    for release in releases:
+        index.setdefault( _version_key( _entry_version( release ) ), release )
+    return index
+
+def _diff_releases( old: Iterable[ Mapping[ str, Any ] ],
+                    new: Iterable[ Mapping[ str, Any ] ],
+                    stop: bool
+                )-> ChangelogDiff:
+    """
+    Compare two versions of a changelog given as parsed releases
+    """
+    old_releases, new_releases = _by_key( old ), _by_key( new )
+    removed, changed, rewritten = [], [], False
+    for key, release in old_releases.items():
+        if key not in new_releases:
+            removed.append( release[ "version" ] )
+            rewritten = rewritten or _rewrites_history( key, None )
+        elif ( changes := _diff_release( release, new_releases[ key ] ) ) is not None:
+            changed.append( changes )
+            rewritten = rewritten or _rewrites_history( key, changes )
+        if rewritten and stop:
+            return ChangelogDiff( [], removed, changed, True )
+    added = [ release[ "version" ] for key, release in new_releases.items() if key not in old_releases ]
+    return ChangelogDiff( added, removed, changed, rewritten )
+
+def _versions(  buf: Any,
+                blocks: list[ tuple[ int, int, int ] ],
+                encoding: str
+            )-> Optional[ dict[ str, str ] ]:
+    """
+    Find the version of each release block, by normalized version text (None
+    if a version is listed more than once)
+    """
+    versions = {}
+    for start, end, _ in blocks:
+        if ( version := _header( buf, start, end, encoding )[ 0 ] ) is not None:
+            if ( key := _normalize( version ) ) in versions:
+                return None
+            versions[ key ] = version
+    return versions
+
+def _url_changes( old: bytes, new: bytes, encoding: str )-> dict[ str, tuple[ Any, Any ] ]:
+    """
+    Find the compare URLs that differ between two footers, by normalized
+    version text (only normalizing the versions of the URLs that differ)
+    """
+    old_urls, new_urls = _footer_urls( old, 0, encoding ), _footer_urls( new, 0, encoding )
+    texts = [ text for text in { **old_urls, **new_urls } if old_urls.get( text ) != new_urls.get( text ) ]
+    old_urls = { _normalize( text ): old_urls[ text ] for text in texts if text in old_urls }
+    new_urls = { _normalize( text ): new_urls[ text ] for text in texts if text in new_urls }
+    changes = {}
+    for key in { **old_urls, **new_urls }:
+        if ( urls := _pair( old_urls.get( key ), new_urls.get( key ) ) ) is not None:
+            changes[ key ] = urls
+    return changes
+
+def _diff_blocks( old: Any, new: Any, encoding: str, stop: bool )-> ChangelogDiff:
+    """
+    Compare two versions of a changelog given as data. Release blocks with the
+    same text in both are skipped (with one hashed lookup each), so only the
+    blocks that changed are parsed, and the compare URLs only if the footers
+    differ
+    """
+    if old == new:
+        return ChangelogDiff( [], [], [], False )
+    ( old_blocks, old_footer ), ( new_blocks, new_footer ) = _blocks( old ), _blocks( new )
+
+    # Which of a version's blocks is compared depends on every block, so they're all parsed if one is repeated
+    old_versions = _versions( old, old_blocks, encoding )
+    new_versions = _versions( new, new_blocks, encoding )
+    if old_versions is None or new_versions is None:
+        return _diff_releases( load_bytes( old, encoding ), load_bytes( new, encoding ), stop )
+
+    old_texts = [ old[ start : end ] for start, end, _ in old_blocks ]
+    new_texts = [ new[ start : end ] for start, end, _ in new_blocks ]
+    unchanged = set( old_texts ).intersection( new_texts )
+
+    new_releases = _by_key(
+        _parse_block( text, line, encoding, False )
+        for text, ( _, _, line ) in zip( new_texts, new_blocks ) if text not in unchanged
+    )
+    old_releases, removed, changed, rewritten = {}, [], {}, False
+    for text, ( _, _, line ) in zip( old_texts, old_blocks ):
+        if text in unchanged:
+            continue
+        release = _parse_block( text, line, encoding, False )
+        if ( key := _version_key( release[ "version" ] ) ) in old_releases:
+            continue
+        old_releases[ key ] = release
+        if key not in new_releases:
+            removed.append( release[ "version" ] )
+            rewritten = rewritten or _rewrites_history( key, None )
+        elif ( changes := _diff_release( release, new_releases[ key ], False ) ) is not None:
+            changed[ _normalize( str( changes.version ) ) ] = changes
+            rewritten = rewritten or _rewrites_history( key, changes )
+        if rewritten and stop:
+            return ChangelogDiff( [], removed, list( changed.values() ), True )
+    added = [ release[ "version" ] for key, release in new_releases.items() if key not in old_releases ]
+
+    old_footer = b"" if old_footer is None else old[ old_footer : ]
+    new_footer = b"" if new_footer is None else new[ new_footer : ]
+    if old_footer != new_footer:
+        skipped = { _normalize( str( version ) ) for version in added + removed }
+        for key, urls in _url_changes( old_footer, new_footer, encoding ).items():
+            if key in skipped:
+                continue
+            if key in changed:
+                changed[ key ] = changed[ key ]._replace( compare_url = urls )
+                continue
+
+            # The URL of a release whose block didn't change
+            if key in old_versions and key in new_versions:
+                changed[ key ] = ReleaseDiff( _as_version( new_versions[ key ] ), {}, None, None, urls )
+    return ChangelogDiff( added, removed, list( changed.values() ), rewritten )
+
+def diff(   old: Union[ Iterable[ Mapping[ str, Any ] ], str, bytes, Any ],
+            new: Union[ Iterable[ Mapping[ str, Any ] ], str, bytes, Any ],
+            encoding: str = 'utf-8',
+            *,
+            stop_on_rewrite: bool = False
+        )-> ChangelogDiff:
+    """
+    Compare two versions of a changelog, aligning their releases by version.
+    Each changelog can be parsed releases (eg. from "load"), or changelog data:
+    a string, a bytes-like object, or a stream. When both are data, releases
+    whose blocks are unchanged aren't parsed (so aren't checked for errors),
+    unless a version is listed more than once
+
+    :param old: the old version of the changelog
+    :param new: the new version of the changelog
+    :param encoding: decode binary changelog data (or streams) using this encoding
+    :param stop_on_rewrite: stop comparing once history was rewritten (see "ChangelogDiff"), so only the
+        changes found until then are returned
+    :return: the versions of the releases added and removed, and the changes to releases in both (each as
+        a ( version, sections, date, yanked, compare_url ) named tuple, where sections holds the
+        ( inserted, deleted ) changes, as ( index, change ) pairs, of each section that changed, and the
+        others are ( old, new ) pairs, or None if unchanged)
+    """
+    old_data, new_data = _raw( old, encoding ), _raw( new, encoding )
+    if old_data is None or new_data is None:
+        if old_data is not None:
+            old = load_bytes( *old_data )
+        if new_data is not None:
+            new = load_bytes( *new_data )
+        return _diff_releases( old, new, stop_on_rewrite )
+
+    # Data with different (or not ASCII compatible) encodings is compared as UTF-8
+    ( old, old_encoding ), ( new, new_encoding ) = old_data, new_data
+    if codecs.lookup( old_encoding ).name != codecs.lookup( new_encoding ).name or \
+       "\n## [".encode( old_encoding ) != b"\n## [":
+        old = _decode( old, old_encoding ).encode( 'utf-8', 'surrogatepass' )
+        new = _decode( new, new_encoding ).encode( 'utf-8', 'surrogatepass' )
+        old_encoding = 'utf-8'
+    return _diff_blocks( old, new, old_encoding, stop_on_rewrite )
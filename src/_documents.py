@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Parsing many changelog documents from one buffer, stream, or tar archive, in
+one pass
+"""
+
+import tarfile
+from typing import ( Any, Callable, Iterator, Optional, Union )
+from . import ( Changelog, ChangelogParsingError, load_bytes, loads )
+
+_READ_SIZE = 1 << 16
+
+def _load( document: Any, encoding: str, compact: bool )-> Union[ Changelog, ChangelogParsingError ]:
+    """
+    Parse a document, returning the error raised parsing it instead of raising it
+    """
+    try:
+        if isinstance( document, str ):
+            return loads( document, compact = compact )
+        return load_bytes( document, encoding, compact = compact )
+    except ChangelogParsingError as e:
+        return e
+
+def _delimited( buf: Any, delimiter: Any )-> Iterator[ tuple[ int, int ] ]:
+    """
+    Find the ( start, end ) offsets of the documents in a buffer that are
+    separated by a delimiter (which may also end the last one)
+    """
+    start = 0
+    while ( end := buf.find( delimiter, start ) ) != -1:
+        yield start, end
+        start = end + len( delimiter )
+    if start < len( buf ):
+        yield start, len( buf )
+
+def _framed( buf: Any, size: int )-> Iterator[ tuple[ int, int ] ]:
+    """
+    Find the ( start, end ) offsets of the documents in a buffer that each
+    follow their length, as a big-endian unsigned integer of "size" bytes
+    """
+    start = 0
+    while start < len( buf ):
+        end = start + size + int.from_bytes( buf[ start : start + size ], 'big' )
+        if start + size > len( buf ) or end > len( buf ):
+            raise ValueError( f'The document at offset { start } is truncated' )
+        yield start + size, end
+        start = end
+
+def _check_text_delimiter( delimiter: Union[ str, bytes ] )-> None:
+    """
+    Check that the delimiter of text documents is a string
+    """
+    if not isinstance( delimiter, str ):
+        raise ValueError(
+            f'The delimiter of text documents must be a string, not "{ type( delimiter ).__name__ }"'
+        )
+
+def _read( fp: Any, size: int )-> bytes:
+    """
+    Read a number of bytes from a stream, or fewer only at its end
+    """
+    data = fp.read( size )
+    if not isinstance( data, bytes ):
+        raise ChangelogParsingError(
+            f'Parameter\'s "read" function call returned unreadable type, "{ type( data ).__name__ }"',
+            rule = 'unreadable-type'
+        )
+    while len( data ) < size and ( more := fp.read( size - len( data ) ) ):
+        data += more
+    return data
+
+def _read_delimited( fp: Any, delimiter: Union[ str, bytes ], encoding: str )-> Iterator[ Any ]:
+    """
+    Read the documents of a stream that are separated by a delimiter, a chunk
+    at a time
+    """
+    pending: Any = None
+    while ( chunk := fp.read( _READ_SIZE ) ):
+        if pending is None:
+            if not isinstance( chunk, ( str, bytes ) ):
+                raise ChangelogParsingError(
+                    f'Parameter\'s "read" function call returned unreadable type, '
+                    f'"{ type( chunk ).__name__ }"',
+                    rule = 'unreadable-type'
+                )
+            if isinstance( chunk, str ):
+                _check_text_delimiter( delimiter )
+            pending = "" if isinstance( chunk, str ) else bytearray()
+            if isinstance( chunk, bytes ) and isinstance( delimiter, str ):
+                delimiter = delimiter.encode( encoding )
+
+        # Only the new chunk (and the end of what's pending, in case the delimiter spans both) is searched,
+        # and what's pending is only sliced once per chunk
+        start, searched = 0, max( len( pending ) - len( delimiter ) + 1, 0 )
+        pending += chunk
+        while ( end := pending.find( delimiter, searched ) ) != -1:
+            yield pending[ start : end ]
+            start = searched = end + len( delimiter )
+        if start:
+            pending = pending[ start : ]
+    if pending:
+        yield pending
+
+def _read_framed( fp: Any, size: int )-> Iterator[ bytes ]:
+    """
+    Read the documents of a binary stream that each follow their length, as a
+    big-endian unsigned integer of "size" bytes
+    """
+    offset = 0
+    while ( prefix := _read( fp, size ) ):
+        document = _read( fp, int.from_bytes( prefix, 'big' ) ) if len( prefix ) == size else None
+        if document is None or len( document ) < int.from_bytes( prefix, 'big' ):
+            raise ValueError( f'The document at offset { offset } is truncated' )
+        yield document
+        offset += size + len( document )
+
+def load_documents( source: Any,
+                    encoding: str = 'utf-8',
+                    *,
+                    delimiter: Optional[ Union[ str, bytes ] ] = None,
+                    length_prefix: Optional[ int ] = None,
+                    select: Optional[ Callable[ [ str ], bool ] ] = None,
+                    compact: bool = False
+                )-> Iterator[ tuple[ Union[ int, str ], Union[ Changelog, ChangelogParsingError ] ] ]:
+    """
+    Parse many changelog documents from one string, bytes-like object (eg. an
+    mmap), stream, or tar archive, yielding each document's releases as soon as
+    it's read. Documents are separated by a delimiter, each follow their length
+    (as a big-endian integer, with binary data), or are the files of a tar
+    archive (opened with "tarfile.open", which can read a stream with a mode
+    like "r|gz"), which aren't extracted. A document that can't be parsed
+    doesn't stop the others from being parsed
+
+    :param source: the documents (a string, bytes-like object, stream, or tarfile.TarFile)
+    :param encoding: decode binary documents using this encoding
+    :param delimiter: the string (or bytes) separating the documents, which may also end the last one
+    :param length_prefix: the number of bytes of the length before each document
+    :param select: only parse the files of the tar archive whose names this returns true for
+    :param compact: load compact Release records instead of dictionaries (see "Release")
+    :return: a generator of ( document id, result ) tuples, where the id is the name of the file in the tar
+        archive, or else the index of the document, and the result is the parsed changelog (see README.md for
+        structure) or the ChangelogParsingError raised parsing it (with line numbers counted in the document)
+    :raises ValueError: if there isn't one way to find the documents given, the delimiter of text documents
+        isn't a string, or the last document is truncated
+    """
+    if isinstance( source, tarfile.TarFile ):
+        if delimiter is not None or length_prefix is not None:
+            raise ValueError( 'The documents of a tar archive are its files, so they can\'t be split' )
+        for member in source:
+            if member.isfile() and ( select is None or select( member.name ) ):
+                with source.extractfile( member ) as fp:
+                    yield member.name, _load( fp.read(), encoding, compact )
+        return
+    if ( delimiter is None ) == ( length_prefix is None ):
+        raise ValueError( 'Either "delimiter" or "length_prefix" must be given' )
+    if delimiter is not None and not isinstance( delimiter, ( str, bytes ) ):
+        raise ValueError( f'"delimiter" must be a string or bytes, not "{ type( delimiter ).__name__ }"' )
+    if delimiter is not None and not delimiter:
+        raise ValueError( '"delimiter" must not be empty' )
+    if length_prefix is not None and length_prefix < 1:
+        raise ValueError( '"length_prefix" must be at least 1' )
+
+    if hasattr( source, 'read' ):
+        documents = _read_framed( source, length_prefix ) if delimiter is None else \
+            _read_delimited( source, delimiter, encoding )
+        for index, document in enumerate( documents ):
+            yield index, _load( document, encoding, compact )
+        return
+
+    if isinstance( source, str ):
+        if delimiter is None:
+            raise ValueError( 'Length prefixed documents must be binary data' )
+        _check_text_delimiter( delimiter )
+        for index, ( start, end ) in enumerate( _delimited( source, delimiter ) ):
+            yield index, _load( source[ start : end ], encoding, compact )
+        return
+
+    # Documents are parsed from views of the buffer (each released once parsed) instead of copies
+    buf = source if hasattr( source, 'find' ) else bytes( source )
+    if isinstance( delimiter, str ):
+        delimiter = delimiter.encode( encoding )
+    spans = _framed( buf, length_prefix ) if delimiter is None else _delimited( buf, delimiter )
+    for index, ( start, end ) in enumerate( spans ):
+        with memoryview( buf )[ start : end ] as document:
+            result = _load( document, encoding, compact )
+        yield index, result
@@ -0,0 +1,313 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Editing changelog files in place: only the release header lines and compare
+URLs an edit needs are found and decoded, and the rest of the file is copied
+as it is (keeping its formatting), atomically
+"""
+
+import os
+import re
+import mmap
+import itertools
+from datetime import date
+from contextlib import contextmanager
+from collections import namedtuple
+from collections.abc import Mapping
+from typing import ( Any, Iterator, Optional, Union )
+from io import IOBase
+from semver import Version
+from . import ( _COMPARE_URL_PATTERN, _as_version, _format )
+from ._files import _write_atomically
+from ._index import ( _FOOTER_PATTERN, _header, _line_starts, _normalize )
+
+_Header = namedtuple( '_Header', ( 'start', 'end', 'version', 'yanked' ) )
+_CompareUrl = namedtuple( '_CompareUrl', ( 'start', 'end', 'version', 'url' ) )
+
+# A compare URL between a tag and a branch (eg. ".../compare/v1.0.0...HEAD")
+_TAG_COMPARE_URL_PATTERN = re.compile( r'(.*/)([^/]*)\.\.\.([^/.][^/]*)' )
+_COPY_SIZE = 1 << 20
+
+@contextmanager
+def _mapped( path: Union[ str, os.PathLike ], encoding: str )-> Iterator[ Any ]:
+    """
+    Map a changelog file into memory (as an empty bytes object if it's empty)
+    """
+    if "\n## [".encode( encoding ) != b"\n## [":
+        raise ValueError( f'Encoding, "{ encoding }", must be ASCII compatible to edit lines' )
+    with open( path, 'rb' ) as fp:
+        if not os.fstat( fp.fileno() ).st_size:
+            yield b""
+            return
+        with mmap.mmap( fp.fileno(), 0, access = mmap.ACCESS_READ ) as buf:
+            yield buf
+
+def _headers( buf: Any, encoding: str, prefix: bytes = b"## " )-> Iterator[ _Header ]:
+    """
+    Find the release header lines (that start with a prefix), in order (with a
+    None version if malformed)
+    """
+    for start in _line_starts( buf, prefix ):
+        newline = buf.find( b"\n", start )
+        version, _, yanked = _header( buf, start, len( buf ), encoding )
+        yield _Header( start, len( buf ) if newline == -1 else newline, version, yanked )
+
+def _find( buf: Any, encoding: str, version: Union[ Version, str ] )-> tuple[ _Header, _Header ]:
+    """
+    Find the first release header line, and the header line of a release. For
+    semver versions, only the header lines that start with the version's
+    numbers are decoded
+
+    :raises ValueError: if there's no release with the version
+    """
+    headers = _headers( buf, encoding )
+    first, key = next( headers, None ), _normalize( str( version ) )
+    if first is not None and isinstance( version, Version ):
+        prefix = f'## [{ version.major }.{ version.minor }.{ version.patch }'.encode( encoding )
+        headers = _headers( buf, encoding, prefix )
+    for header in itertools.chain( ( first, ) if first is not None else (), headers ):
+        if header.version is not None and _normalize( header.version ) == key:
+            return first, header
+    raise ValueError( f'The changelog has no release with version, "{ version }"' )
+
+def _footer( buf: Any, start: int )-> Optional[ int ]:
+    """
+    Find where the footer of compare URLs starts, after the first release header (at "start")
+    """
+    lines = _line_starts( buf, b"[", start )
+    return next( ( line for line in lines if _FOOTER_PATTERN.match( buf, line ) ), None )
+
+def _compare_urls( buf: Any, footer: Optional[ int ], encoding: str )-> Iterator[ _CompareUrl ]:
+    """
+    Find the compare URL lines of the footer, in order
+    """
+    position = len( buf ) if footer is None else footer
+    while position < len( buf ):
+        newline = buf.find( b"\n", position )
+        end = len( buf ) if newline == -1 else newline
+        if ( match := _COMPARE_URL_PATTERN.fullmatch( str( buf[ position : end ], encoding, 'replace' ) ) ):
+            yield _CompareUrl( position, end, match.group( 1 ), match.group( 2 ) )
+        position = end + 1
+
+def _separator( buf: Any )-> str:
+    """
+    Get the newlines to add to the end of a file to start a block after a blank line
+    """
+    if not buf or buf[ -2 : ] == b"\n\n":
+        return ""
+    return "\n" if buf[ -1 : ] == b"\n" else "\n\n"
+
+def _is_unreleased( header: Optional[ _Header ] )-> bool:
+    """
+    Check whether a header line is for the "Unreleased" entry
+    """
+    return header is not None and header.version is not None and header.version.lower() == "unreleased"
+
+def _check_newer( header: Optional[ _Header ], version: Version )-> None:
+    """
+    Check that a version is newer than the newest release's (at a header line, if any)
+
+    :raises ValueError: if it isn't
+    """
+    if header is not None and header.version is not None and version <= Version.parse( header.version ):
+        raise ValueError(
+            f'Version, "{ version }", must be newer than the newest release, "{ header.version }"'
+        )
+
+def _is_older( text: str, version: Union[ Version, str ] )-> bool:
+    """
+    Check whether the version text of a compare URL is of an older release than a version
+    """
+    if not isinstance( version, Version ):
+        return True
+    try:
+        return Version.parse( text ) < version
+    except ValueError:
+        return False
+
+def _copy( source: IOBase, destination: IOBase, size: int )-> None:
+    """
+    Copy bytes between files, in chunks
+    """
+    while 0 < size and ( chunk := source.read( min( size, _COPY_SIZE ) ) ):
+        destination.write( chunk )
+        size -= len( chunk )
+
+def _splice( path: Union[ str, os.PathLike ], edits: list[ tuple[ int, int, str ] ], encoding: str )-> None:
+    """
+    Rewrite a file atomically, replacing byte ranges with text (and copying the
+    rest). The file is only read while writing its replacement, and closed
+    before it's replaced
+    """
+    def write( fp: IOBase ):
+        with open( path, 'rb' ) as source:
+            position = 0
+            for start, end, text in sorted( edits, key = lambda edit: edit[ 0 ] ):
+                _copy( source, fp, start - position )
+                fp.write( text.encode( encoding ) )
+                source.seek( end )
+                position = end
+            _copy( source, fp, os.fstat( source.fileno() ).st_size - position )
+    if edits:
+        _write_atomically( path, write )
+
+def prepend_release(    path: Union[ str, os.PathLike ],
+                        entry: Mapping[ str, Any ],
+                        encoding: str = 'utf-8'
+                    )-> None:
+    """
+    Add a release to a changelog file, before its newest release (after the
+    "Unreleased" entry, unless it's the entry added), and its compare URL to
+    the footer, without rewriting the rest of the file
+
+    :param path: the path of the changelog file
+    :param entry: the changelog entry to add (see README.md for structure)
+    :param encoding: the encoding of the file, which must be ASCII compatible (eg. UTF-8)
+    :raises ValueError: if the entry is invalid, or isn't newer than the newest release
+    """
+    entry = dict( entry )
+    url = entry.pop( "compare_url", None )
+    entry[ "version" ] = version = _as_version( entry[ "version" ] )
+    block = "".join( _format( [ entry ], "" ) ).lstrip( "\n" ) + "\n"
+
+    with _mapped( path, encoding ) as buf:
+        headers = _headers( buf, encoding )
+        target = first = next( headers, None )
+        if isinstance( version, Version ):
+            if _is_unreleased( first ):
+                target = next( headers, None )
+            _check_newer( target, version )
+        elif _is_unreleased( first ):
+            raise ValueError( 'The changelog already has an "Unreleased" entry' )
+
+        footer = None if first is None else _footer( buf, first.start )
+        compare_urls = _compare_urls( buf, footer, encoding )
+        if target is not None:
+            edits = [ ( target.start, target.start, block ) ]
+        elif footer is not None:
+            edits = [ ( footer, footer, block ) ]
+        else:
+            edits = [ ( len( buf ), len( buf ), _separator( buf ) + block ) ]
+
+        # The compare URL goes after the "Unreleased" one (if it's a release), or first
+        if url is not None:
+            line = f'[{ version }]: { url }\n'
+            if ( compare_url := next( compare_urls, None ) ) is None:
+                separator = "" if edits[ 0 ][ 0 ] == len( buf ) else _separator( buf )
+                edits.append( ( len( buf ), len( buf ), separator + line ) )
+            elif compare_url.version.lower() == "unreleased" and isinstance( version, Version ):
+                newline = "\n" if compare_url.end == len( buf ) else ""
+                edits.append( ( compare_url.end + 1, compare_url.end + 1, newline + line ) )
+            else:
+                edits.append( ( compare_url.start, compare_url.start, line ) )
+    _splice( path, edits, encoding )
+
+def promote_unreleased( path: Union[ str, os.PathLike ],
+                        version: Union[ Version, str ],
+                        release_date: Optional[ Union[ date, str ] ] = None,
+                        encoding: str = 'utf-8'
+                    )-> None:
+    """
+    Release the "Unreleased" entry of a changelog file as a version, adding an
+    empty "Unreleased" entry above it, without rewriting the rest of the file.
+    If the "Unreleased" compare URL compares the newest release's tag with a
+    branch (eg. ".../compare/v1.0.0...HEAD"), it's updated to compare the new
+    version's tag, and a compare URL is added for the new version
+
+    :param path: the path of the changelog file
+    :param version: the version to release, as a semver Version or string
+    :param release_date: the release date, as a datetime date or ISO formatted string (today if None)
+    :param encoding: the encoding of the file, which must be ASCII compatible (eg. UTF-8)
+    :raises ValueError: if there's no "Unreleased" entry, or the version isn't newer than the newest release
+    """
+    version = _as_version( version )
+    if not isinstance( version, Version ):
+        raise ValueError( f'Version, "{ version }", must be a semver version' )
+    if release_date is None:
+        release_date = date.today()
+    elif isinstance( release_date, str ):
+        release_date = date.fromisoformat( release_date )
+
+    with _mapped( path, encoding ) as buf:
+        headers = _headers( buf, encoding )
+        if not _is_unreleased( first := next( headers, None ) ):
+            raise ValueError( 'The changelog has no "Unreleased" entry to promote' )
+        previous = next( headers, None )
+        _check_newer( previous, version )
+        header = f'## [Unreleased]\n\n## [{ version }] - { release_date.isoformat() }'
+        edits = [ ( first.start, first.end, header ) ]
+
+        compare_urls = _compare_urls( buf, _footer( buf, first.start ), encoding )
+        unreleased = next( ( compare_url for compare_url in compare_urls
+                             if compare_url.version.lower() == "unreleased" ), None )
+        match = None if unreleased is None else _TAG_COMPARE_URL_PATTERN.fullmatch( unreleased.url )
+        if match and previous is not None and previous.version \
+           and match.group( 2 ).endswith( previous.version ):
+            base, tag, branch = match.groups()
+            new_tag = tag[ : len( tag ) - len( previous.version ) ] + str( version )
+            edits.append( ( unreleased.start, unreleased.end,
+                            f'[{ unreleased.version }]: { base }{ new_tag }...{ branch }\n'
+                            f'[{ version }]: { base }{ tag }...{ new_tag }' ) )
+    _splice( path, edits, encoding )
+
+def mark_yanked(    path: Union[ str, os.PathLike ],
+                    version: Union[ Version, str ],
+                    yanked: bool = True,
+                    encoding: str = 'utf-8'
+                )-> None:
+    """
+    Mark a release of a changelog file as yanked (or not), only rewriting its header line
+
+    :param path: the path of the changelog file
+    :param version: the version of the release, as a semver Version or string
+    :param yanked: whether the release was yanked
+    :param encoding: the encoding of the file, which must be ASCII compatible (eg. UTF-8)
+    :raises ValueError: if there's no release with the version
+    """
+    version = _as_version( version )
+    if not isinstance( version, Version ):
+        raise ValueError( 'Only released entries can be yanked' )
+    with _mapped( path, encoding ) as buf:
+        _, header = _find( buf, encoding, version )
+        line = str( buf[ header.start : header.end ], encoding ).removesuffix( " [YANKED]" )
+    if header.yanked != yanked:
+        _splice( path, [ ( header.start, header.end, line + " [YANKED]" if yanked else line ) ], encoding )
+
+def set_compare_url(    path: Union[ str, os.PathLike ],
+                        version: Union[ Version, str ],
+                        url: Optional[ str ],
+                        encoding: str = 'utf-8'
+                    )-> None:
+    """
+    Set (or remove) the compare URL of a release of a changelog file, only
+    rewriting its line of the footer. A new compare URL is added in order of
+    version (before those of older releases)
+
+    :param path: the path of the changelog file
+    :param version: the version of the release, as a semver Version or string, or "Unreleased"
+    :param url: the compare URL (an HTTP or HTTPS URL), or None to remove it
+    :param encoding: the encoding of the file, which must be ASCII compatible (eg. UTF-8)
+    :raises ValueError: if there's no release with the version, or the URL is invalid
+    """
+    if url is not None and not _COMPARE_URL_PATTERN.fullmatch( f'[x]: { url }' ):
+        raise ValueError( f'Compare URL, "{ url }", must be an HTTP or HTTPS URL' )
+    version = _as_version( version )
+    with _mapped( path, encoding ) as buf:
+        first, header = _find( buf, encoding, version )
+        key = _normalize( header.version )
+        compare_urls = list( _compare_urls( buf, _footer( buf, first.start ), encoding ) )
+        matches = [ compare_url for compare_url in compare_urls if _normalize( compare_url.version ) == key ]
+
+        line = f'[{ header.version }]: { url }'
+        if url is None:
+            edits = [ ( match.start, min( match.end + 1, len( buf ) ), "" ) for match in matches ]
+        elif matches:
+            edits = [ ( matches[ -1 ].start, matches[ -1 ].end, line ) ]
+        elif ( older := next( ( compare_url for compare_url in compare_urls
+                                if _is_older( compare_url.version, version ) ), None ) ) is not None:
+            edits = [ ( older.start, older.start, line + "\n" ) ]
+        elif compare_urls:
+            edits = [ ( compare_urls[ -1 ].end, compare_urls[ -1 ].end, "\n" + line ) ]
+        else:
+            edits = [ ( len( buf ), len( buf ), _separator( buf ) + line + "\n" ) ]
+    _splice( path, edits, encoding )
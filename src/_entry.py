@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: MIT
+
+"""
+The keys of changelog entries, and compact entries, which keep their version
+as written (parsing it when first accessed) and pack each section's changes
+into one string
+"""
+
+from datetime import date
+from collections.abc import ( Mapping, MutableMapping )
+from typing import ( Any, Iterable, Iterator, Optional, Union )
+from semver import Version
+from ._intern import ( _parse_date, _parse_version )
+
+_CHANGE_TYPES = ( 'Added', 'Changed', 'Deprecated', 'Removed', 'Fixed', 'Security' )
+_SECTION_KEYS = tuple( change_type.lower() for change_type in _CHANGE_TYPES )
+
+def _entry_version( change: Mapping[ str, Any ] )-> Union[ Version, str ]:
+    """
+    Get the version of a changelog entry, without parsing it for compact entries
+    """
+    return change.raw_version if isinstance( change, Release ) else change[ "version" ]
+
+def _pack( changes: Iterable[ str ] )-> Union[ str, tuple ]:
+    """
+    Pack the changes of a section into one string, separated by NUL characters
+    (or into a tuple, if there are none, or a change isn't a string or holds
+    one)
+    """
+    changes = tuple( changes )
+    try:
+        packed = "\0".join( changes )
+    except TypeError:
+        return changes
+    return packed if changes and packed.count( "\0" ) == len( changes ) - 1 else changes
+
+class Release( MutableMapping ):
+    """
+    A compact changelog entry (see README.md for structure), as loaded with
+    "compact = True". The version is kept as written and only parsed into a
+    semver Version the first time it's accessed, and each section's changes
+    are packed into one string, and unpacked into a tuple when accessed.
+    Loaded dates are already parsed (validating them as they're loaded, and
+    sharing each parsed date between releases, which takes less memory than
+    their text)
+    """
+    __slots__ = ( '_version', '_date', '_yanked', '_sections', '_compare_url' )
+
+    def __init__(   self,
+                    version: Union[ Version, str ],
+                    release_date: Optional[ Union[ date, str ] ] = None,
+                    yanked: bool = False,
+                    sections: Iterable[ tuple[ str, Iterable[ str ] ] ] = (),
+                    compare_url: Optional[ str ] = None
+                ):
+        """
+        :param version: a semver Version or version string, or "Unreleased"
+        :param release_date: a datetime date or ISO formatted date string (parsed when first accessed), if any
+        :param yanked: whether the release was yanked
+        :param sections: ( section key, changes ) pairs (eg. ( "added", [ "A feature" ] ))
+        :param compare_url: the compare URL of the release, if it has one
+        """
+        self._version, self._date, self._yanked = version, release_date, yanked
+        self._compare_url = compare_url
+        # Sections are kept in one flat tuple of alternating keys and packed changes
+        self._sections = tuple( i for key, changes in sections for i in ( key, _pack( changes ) ) )
+
+    @property
+    def raw_version( self )-> Union[ Version, str ]:
+        """
+        The version, without parsing it if it's still the string it was loaded as
+        """
+        return self._version
+
+    def __getitem__( self, key: str )-> Any:
+        if key == "version":
+            if isinstance( self._version, str ) and self._version != "Unreleased":
+                self._version = _parse_version( self._version )
+            return self._version
+        if key == "date":
+            if isinstance( self._date, str ):
+                self._date = _parse_date( self._date )
+            return self._date
+        if key == "yanked":
+            return self._yanked
+        if key == "compare_url" and self._compare_url is not None:
+            return self._compare_url
+        if key in self._sections[ : : 2 ]:
+            changes = self._sections[ self._sections.index( key ) + 1 ]
+            return tuple( changes.split( "\0" ) ) if isinstance( changes, str ) else changes
+        raise KeyError( key )
+
+    def __setitem__( self, key: str, value: Any ):
+        if key == "version":
+            self._version = value
+        elif key == "date":
+            self._date = value
+        elif key == "yanked":
+            self._yanked = value
+        elif key == "compare_url":
+            self._compare_url = value
+        elif key not in _SECTION_KEYS:
+            raise KeyError( f'"{ key }" is not a changelog entry key' )
+        elif key in self._sections[ : : 2 ]:
+            index = self._sections.index( key ) + 1
+            self._sections = self._sections[ : index ] + ( _pack( value ), ) + self._sections[ index + 1 : ]
+        else:
+            self._sections += ( key, _pack( value ) )
+
+    def __delitem__( self, key: str ):
+        if key == "compare_url" and self._compare_url is not None:
+            self._compare_url = None
+        elif key in _SECTION_KEYS and key in self._sections[ : : 2 ]:
+            index = self._sections.index( key )
+            self._sections = self._sections[ : index ] + self._sections[ index + 2 : ]
+        else:
+            raise KeyError( key )
+
+    def __contains__( self, key: Any )-> bool:
+        if key in ( "version", "date", "yanked" ):
+            return True
+        if key == "compare_url":
+            return self._compare_url is not None
+        return key in self._sections[ : : 2 ]
+
+    def __iter__( self )-> Iterator[ str ]:
+        yield from ( "date", "yanked", "version" )
+        yield from self._sections[ : : 2 ]
+        if self._compare_url is not None:
+            yield "compare_url"
+
+    def __len__( self )-> int:
+        return 3 + len( self._sections ) // 2 + ( self._compare_url is not None )
+
+    def __repr__( self )-> str:
+        return f'{ type( self ).__name__ }({ dict( self ) !r})'
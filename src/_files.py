@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Writing changelog files atomically
+"""
+
+import os
+import shutil
+import tempfile
+from typing import ( Any, Callable, Iterable, Union )
+from collections.abc import Mapping
+from io import IOBase
+from . import ( DEFAULT_HEADER, dump )
+
+def _write_atomically( path: Union[ str, os.PathLike ], write: Callable[ [ IOBase ], None ] )-> None:
+    """
+    Write a file by writing a temporary file next to it, then renaming it over
+    the file (keeping the file's permissions), so the file is never left
+    partially written
+    """
+    directory = os.path.dirname( os.path.abspath( path ) )
+    fd, temp_path = tempfile.mkstemp( dir = directory, prefix = '.', suffix = '.tmp' )
+    try:
+        with os.fdopen( fd, 'wb' ) as fp:
+            write( fp )
+        try:
+            shutil.copymode( path, temp_path )
+        except FileNotFoundError:
+            os.chmod( temp_path, 0o644 )
+        os.replace( temp_path, path )
+    except BaseException:
+        os.remove( temp_path )
+        raise
+
+def dump_path(  obj: Iterable[ Mapping[ str, Any ] ],
+                path: Union[ str, os.PathLike ],
+                header: str = DEFAULT_HEADER,
+                encoding: str = 'utf-8'
+            )-> None:
+    """
+    Format and write changelog data to a file, atomically (if the data is
+    invalid, or writing fails, the file is left as it was)
+
+    :param obj: the changelog data to format and write (see README.md for structure)
+    :param path: the path of the file to write
+    :param header: head text to add before changelog data
+    :param encoding: encode the changelog data with this encoding
+    """
+    _write_atomically( path, lambda fp : dump( obj, fp, header, encoding ) )
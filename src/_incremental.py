@@ -0,0 +1,220 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Reparsing edited changelogs by only parsing the releases an edit touches
+"""
+
+from bisect import bisect_right
+from typing import ( Any, Optional )
+from . import ( Changelog, ChangelogParsingError, _Parser, _split_lines, _version_key )
+
+def _common_prefix( a: list[ str ], b: list[ str ] )-> int:
+    """
+    Count the lines two lists start with in common (comparing slices, which is
+    much faster than comparing line by line in Python)
+    """
+    low, high = 0, min( len( a ), len( b ) )
+    while low < high:
+        middle = ( low + high + 1 ) // 2
+        if a[ low : middle ] == b[ low : middle ]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+def _common_suffix( a: list[ str ], b: list[ str ], limit: int )-> int:
+    """
+    Count the lines (up to a limit) two lists end with in common
+    """
+    low, high = 0, limit
+    while low < high:
+        middle = ( low + high + 1 ) // 2
+        if a[ len( a ) - middle : len( a ) - low ] == b[ len( b ) - middle : len( b ) - low ]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+def _parse_spans(   lines: list[ str ],
+                    offset: int = 0
+                )-> tuple[ list[ dict[ str, Any ] ], list[ int ], Optional[ int ], dict ]:
+    """
+    Parse lines, also finding the index of each release's header line and of
+    the first compare URL line
+
+    :param lines: the lines to parse
+    :param offset: the index of the first line in the document
+    :return: the releases, the indexes of their headers, the index of the compare URLs, and the compare URLs
+    """
+    parser, releases, starts, footer = _Parser( offset ), [], [], None
+    for index, line in enumerate( lines, start = offset ):
+        header = line.startswith( '## ' ) and not parser.in_compare_urls
+        if ( release := parser.feed( line ) ) is not None:
+            releases.append( release )
+        if header:
+            starts.append( index )
+        elif footer is None and parser.in_compare_urls:
+            footer = index
+    if ( release := parser.close() ) is not None:
+        releases.append( release )
+    return releases, starts, footer, parser.compare_urls
+
+class ChangelogDocument:
+    """
+    Changelog data parsed from text, along with the span of lines each release
+    came from, so that edits to the text only reparse the releases they touch.
+    Edits update "changes" in place, keeping the dictionaries of untouched
+    releases, and parsing errors refer to lines of the whole (edited) text. If
+    an edit raises an error, the document is left as it was before the edit
+    """
+    def __init__( self, text: str ):
+        """
+        :param text: the changelog data
+        """
+        self.changes = Changelog()
+        self._lines, self._starts, self._footer, self._compare_urls = [], [], None, {}
+        self._reparse( _split_lines( text ) )
+
+    @property
+    def text( self )-> str:
+        """
+        The changelog data (with a newline at the end of each line)
+        """
+        return "".join( line + "\n" for line in self._lines )
+
+    def span( self, index: int )-> tuple[ int, int ]:
+        """
+        Find the lines a release was parsed from
+
+        :param index: the index of the release in "changes"
+        :return: the indexes of the release's first line and of the line after its last
+        """
+        index = range( len( self._starts ) )[ index ]
+        return self._starts[ index ], self._end( index )
+
+    def update( self, text: str )-> Changelog:
+        """
+        Replace the changelog data, only reparsing the lines that changed
+        (found by comparing it with the current data)
+
+        :param text: the new changelog data
+        :return: the updated changelog data (see README.md for structure)
+        """
+        lines = _split_lines( text )
+        prefix = _common_prefix( self._lines, lines )
+        suffix = _common_suffix( self._lines, lines, min( len( self._lines ), len( lines ) ) - prefix )
+        return self._edit( prefix, len( self._lines ) - suffix, lines[ prefix : len( lines ) - suffix ] )
+
+    def edit( self, start: int, end: int, text: str )-> Changelog:
+        """
+        Replace a range of lines in the changelog data
+
+        :param start: the index of the first line to replace
+        :param end: the index of the line after the last to replace (equal to "start" to insert lines)
+        :param text: the lines to replace them with
+        :return: the updated changelog data (see README.md for structure)
+        """
+        if not 0 <= start <= end <= len( self._lines ):
+            raise ValueError( f'Invalid range of lines, { start } to { end }, '
+                              f'for { len( self._lines ) } lines' )
+        return self._edit( start, end, _split_lines( text ) )
+
+    def _block( self, index: int )-> int:
+        """
+        Find the block a line belongs to: -1 for the lines before the first
+        release, the index of a release, or the number of releases for the
+        compare URLs
+        """
+        if self._footer is not None and self._footer <= index:
+            return len( self._starts )
+        return bisect_right( self._starts, index ) - 1
+
+    def _end( self, block: int )-> int:
+        """
+        Find the index of the line after a block's last
+        """
+        if block + 1 < len( self._starts ):
+            return self._starts[ block + 1 ]
+        return len( self._lines ) if self._footer is None else self._footer
+
+    def _reparse( self, lines: list[ str ] )-> Changelog:
+        """
+        Parse the whole document
+        """
+        releases, starts, footer, compare_urls = _parse_spans( lines )
+        self._lines, self._starts, self._footer = lines, starts, footer
+        self._compare_urls = {
+            key: ( line_no - 1 - footer, text, url ) for key, ( line_no, text, url ) in compare_urls.items()
+        }
+        self.changes[ : ] = releases
+        return self.changes
+
+    def _edit( self, start: int, end: int, lines: list[ str ] )-> Changelog:
+        """
+        Replace a range of lines, reparsing the blocks the edit touches
+        """
+        first = self._block( max( start - 1, 0 ) )
+        last = self._block( max( end - 1, start - 1, 0 ) )
+        # Compare URLs depend on every release before them, so they're only parsed along with the whole
+        # document (as are edits before the first release without compare URLs, where lines like them are
+        # ignored)
+        if last == len( self._starts ) or any( line.startswith( '[' ) for line in lines ) or \
+           not self._starts or ( first < 0 and self._footer is None ):
+            return self._reparse( self._lines[ : start ] + lines + self._lines[ end : ] )
+
+        block_start = 0 if first < 0 else self._starts[ first ]
+        block_end = self._end( last )
+        releases, starts, _, _ = _parse_spans(
+            self._lines[ block_start : start ] + lines + self._lines[ end : block_end ],
+            block_start
+        )
+        # Swap in the reparsed releases, then check (and, if needed, undo) how that affects the compare URLs
+        delta = len( lines ) - ( end - start )
+        low, high = max( first, 0 ), last + 1
+        if len( self._starts ) - ( high - low ) + len( starts ) == 0:
+            # Without releases, compare URLs are ignored like any other line before the first release
+            return self._reparse( self._lines[ : start ] + lines + self._lines[ end : ] )
+        replaced = self.changes[ low : high ]
+        keys = {
+            key for key in ( _version_key( release[ "version" ] ) for release in replaced + releases )
+            if key in self._compare_urls
+        }
+        holders = { key: self.changes.get( self._compare_urls[ key ][ 1 ] ) for key in keys }
+        self.changes[ low : high ] = releases
+        try:
+            self._check_compare_urls( keys, delta )
+        except ChangelogParsingError:
+            self.changes[ low : low + len( releases ) ] = replaced
+            raise
+        for key in keys:
+            holder = self.changes.get( self._compare_urls[ key ][ 1 ] )
+            if holder is not holders[ key ] and all( holders[ key ] is not release for release in replaced ):
+                holders[ key ].pop( "compare_url", None )
+            holder[ "compare_url" ] = self._compare_urls[ key ][ 2 ]
+
+        self._lines[ start : end ] = lines
+        self._starts[ low : high ] = starts
+        if delta:
+            shifted = low + len( starts )
+            self._starts[ shifted : ] = [ index + delta for index in self._starts[ shifted : ] ]
+        if self._footer is not None:
+            self._footer += delta
+        return self.changes
+
+    def _check_compare_urls( self, keys: set, delta: int )-> None:
+        """
+        Raise an error like a full parse would if a compare URL no longer has a
+        release with its version
+        """
+        missing = [
+            self._compare_urls[ key ][ : 2 ] for key in keys
+            if self.changes.get( self._compare_urls[ key ][ 1 ] ) is None
+        ]
+        if missing:
+            offset, text = min( missing, key = lambda i: i[ 0 ] )
+            raise ChangelogParsingError(
+                msg = f'No corresponding record for compare url with version, "{ text }"',
+                line_number = self._footer + delta + offset + 1,
+                column_number = 2,
+                rule = 'unknown-compare-url-version'
+            )
@@ -0,0 +1,335 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Indexing the byte ranges of the releases in changelog files, to parse single
+releases (or ranges of them) without parsing the rest of the file
+"""
+
+import os
+import re
+import mmap
+import json
+import hashlib
+from collections import namedtuple
+from bisect import ( bisect_left, bisect_right )
+from typing import ( Any, Iterator, Optional, Union )
+from semver import Version
+from . import ( ChangelogParsingError, _RELEASE_PATTERN, _Parser, _as_version )
+from . import ( _decode, _parse_version, _split_lines, _version_key )
+from ._files import _write_atomically
+
+IndexEntry = namedtuple( 'IndexEntry', ( 'version', 'date', 'yanked', 'start', 'end', 'line' ) )
+
+# The start of a compare URL line (the first of which, after a release, starts the footer), and the whole line
+_FOOTER_PATTERN = re.compile( rb'\[[^\]\n]+\]: https?://' )
+_COMPARE_URL_LINE_PATTERN = re.compile( r'^\[([^\]\n]+)\]: (https?:\/\/.*)$', re.MULTILINE )
+_SIDECAR_FORMAT = 1
+_HASH_CHUNK_SIZE = 1 << 20
+
+def _line_starts( buf: Any, prefix: bytes, start: int = 0 )-> Iterator[ int ]:
+    """
+    Find the lines (after the one at "start") that start with a prefix
+    """
+    if start == 0 and buf[ : len( prefix ) ] == prefix:
+        yield 0
+    needle = b"\n" + prefix
+    while ( start := buf.find( needle, start ) ) != -1:
+        start += 1
+        yield start
+
+def _normalize( version: str )-> str:
+    """
+    Normalize version text so that texts of versions "_version_key" keys the
+    same are equal (semver ignores build metadata, and "Unreleased" its case)
+    """
+    return "unreleased" if version.lower() == "unreleased" else version.partition( "+" )[ 0 ]
+
+def _header(    buf: Any,
+                start: int,
+                end: int,
+                encoding: str
+            )-> tuple[ Optional[ str ], Optional[ str ], bool ]:
+    """
+    Parse the version, date, and yanked flag of a release header line (the
+    version is None if the header is malformed; loading the release raises
+    the error, on the right line)
+    """
+    newline = buf.find( b"\n", start, end )
+    line = buf[ start : end if newline == -1 else newline ]
+    try:
+        match = _RELEASE_PATTERN.fullmatch( str( line, encoding ) )
+    except UnicodeError:
+        match = None
+    if match is None:
+        return None, None, False
+    return match.group( 1 ), match.group( 2 ), match.group( 3 ) is not None
+
+def _blocks( buf: Any )-> tuple[ list[ tuple[ int, int, int ] ], Optional[ int ] ]:
+    """
+    Find the block of each release (its start and end offsets, and the line
+    number it starts on), and the start of the footer of compare URLs (if any)
+    """
+    starts, footer = list( _line_starts( buf, b"## " ) ), None
+    if starts:
+        footer = next( ( start for start in _line_starts( buf, b"[", starts[ 0 ] )
+                         if _FOOTER_PATTERN.match( buf, start ) ), None )
+        if footer is not None:
+            starts = starts[ : bisect_left( starts, footer ) ]
+
+    # Each block ends where the next starts (or where the footer does)
+    blocks, line_no, position = [], 1, 0
+    for start, end in zip( starts, starts[ 1 : ] + [ len( buf ) if footer is None else footer ] ):
+        line_no += buf[ position : start ].count( b"\n" )
+        position = start
+        blocks.append( ( start, end, line_no ) )
+    return blocks, footer
+
+def _footer_urls( buf: Any, footer: Optional[ int ], encoding: str )-> dict[ str, str ]:
+    """
+    Find the compare URLs of the footer, by version text (the last URL of each)
+    """
+    if footer is None:
+        return {}
+    return dict( _COMPARE_URL_LINE_PATTERN.findall( str( buf[ footer : ], encoding, 'replace' ) ) )
+
+def _scan( buf: Any, encoding: str )-> tuple[ list[ IndexEntry ], dict[ str, str ] ]:
+    """
+    Find the release header lines, and the compare URLs, of changelog data
+    (only decoding those lines)
+    """
+    blocks, footer = _blocks( buf )
+    entries = [
+        IndexEntry( *_header( buf, start, end, encoding ), start, end, line ) for start, end, line in blocks
+    ]
+    return entries, _footer_urls( buf, footer, encoding )
+
+def _parse_block( data: bytes, line: int, encoding: str, compact: bool )-> dict[ str, Any ]:
+    """
+    Parse the block of a release (without its compare URL), reporting errors on
+    the lines of the whole file
+    """
+    try:
+        text = _decode( data, encoding )
+    except ChangelogParsingError as e:
+        raise ChangelogParsingError(
+            e.msg, e.line_number + line - 1, e.column_number, e.rule
+        ) from e.__cause__
+
+    parser = _Parser( line - 1, compact )
+    for text_line in _split_lines( text ):
+        parser.feed( text_line )
+    return parser.close()
+
+def _hash( path: str )-> str:
+    """
+    Hash the contents of a file
+    """
+    digest = hashlib.sha256()
+    with open( path, 'rb' ) as fp:
+        while ( chunk := fp.read( _HASH_CHUNK_SIZE ) ):
+            digest.update( chunk )
+    return digest.hexdigest()
+
+class ReleaseIndex:
+    """
+    An index of the releases in a changelog file: the version, date, and byte
+    range of each release's block, found by only reading the release header
+    lines. Releases are loaded by reading just their blocks, and parsed the
+    same way (with the same errors, on the same lines) as loading the whole
+    file would. The index is rebuilt whenever the file changes, and can be kept
+    in a small (JSON) sidecar file, which is used as long as the file's size and
+    modification time (or, if only the time changed, contents hash) match
+    """
+    def __init__(   self,
+                    path: Union[ str, os.PathLike ],
+                    encoding: str = 'utf-8',
+                    *,
+                    sidecar: Union[ bool, str, os.PathLike ] = False
+                ):
+        """
+        :param path: the path of the changelog file
+        :param encoding: the encoding of the file, which must be ASCII compatible (eg. UTF-8)
+        :param sidecar: keep the index in a file next to the changelog file (its path with ".index" added), or
+            in this file
+        """
+        if "\n## [".encode( encoding ) != b"\n## [":
+            raise ValueError( f'Encoding, "{ encoding }", must be ASCII compatible to index lines' )
+        self.path, self.encoding = os.fspath( path ), encoding
+        self.sidecar = None
+        if sidecar:
+            self.sidecar = f'{ self.path }.index' if sidecar is True else os.fspath( sidecar )
+        self.entries: list[ IndexEntry ] = []
+        self.compare_urls: dict[ str, str ] = {}
+        self._stamp, self._keys, self._urls, self._sorted = None, {}, {}, None
+        self.refresh()
+
+    def refresh( self )-> None:
+        """
+        Rebuild the index if the file changed since it was built (lookups do this first)
+        """
+        stat = os.stat( self.path )
+        if self._stamp is not None and self._stamp[ : 2 ] == [ stat.st_size, stat.st_mtime_ns ]:
+            return
+        if self._read_sidecar( stat ):
+            return
+
+        with open( self.path, 'rb' ) as fp:
+            stat = os.fstat( fp.fileno() )
+            if stat.st_size:
+                with mmap.mmap( fp.fileno(), 0, access = mmap.ACCESS_READ ) as buf:
+                    entries, compare_urls = _scan( buf, self.encoding )
+                    digest = hashlib.sha256( buf ).hexdigest()
+            else:
+                entries, compare_urls, digest = [], {}, hashlib.sha256().hexdigest()
+        self._set( entries, compare_urls, [ stat.st_size, stat.st_mtime_ns, digest ] )
+        if self.sidecar is not None:
+            self._write_sidecar()
+
+    def get( self, version: Union[ Version, str ] )-> Optional[ IndexEntry ]:
+        """
+        Look up the index entry of a release by version (the first one, if a version is listed more than once)
+
+        :param version: a semver Version, a semver string, or "Unreleased" (ignoring case)
+        :return: the entry with the version, if any
+        """
+        self.refresh()
+        if isinstance( version, str ):
+            _version_key( version )     # raises an error for invalid versions
+        return self._keys.get( _normalize( str( version ) ) )
+
+    def load_release(   self,
+                        version: Union[ Version, str ],
+                        *,
+                        compact: bool = False
+                    )-> Optional[ dict[ str, Any ] ]:
+        """
+        Load a release by version, only reading and parsing its block
+
+        :param version: a semver Version, a semver string, or "Unreleased" (ignoring case)
+        :param compact: load a compact Release record instead of a dictionary (see "Release")
+        :return: the release with the version (see README.md for structure), if any
+        """
+        entry = self.get( version )
+        return None if entry is None else self._load( [ entry ], compact )[ 0 ]
+
+    def load_between(   self,
+                        lower: Optional[ Union[ Version, str ] ] = None,
+                        upper: Optional[ Union[ Version, str ] ] = None,
+                        *,
+                        compact: bool = False
+                    )-> list[ dict[ str, Any ] ]:
+        """
+        Load the released entries within a range of versions (see
+        "Changelog.between"), only reading and parsing their blocks
+
+        :param lower: the least version to include (unbounded if None)
+        :param upper: the greatest version to include (unbounded if None)
+        :param compact: load compact Release records instead of dictionaries (see "Release")
+        :return: the releases with versions in the range (see README.md for structure), greatest version first
+        """
+        for bound in ( lower, upper ):
+            if bound is not None and not isinstance( _as_version( bound ), Version ):
+                raise ValueError( f'Range bounds must be semver versions, not "{ bound }"' )
+        self.refresh()
+        if self._sorted is None:
+            released = []
+            for entry in self.entries:
+                try:
+                    released.append( ( _parse_version( entry.version ), entry ) )
+                except ( TypeError, ValueError ):
+                    continue
+            released.sort( key = lambda item: item[ 0 ] )
+            self._sorted = ( [ version for version, _ in released ], [ entry for _, entry in released ] )
+
+        versions, entries = self._sorted
+        start = 0 if lower is None else bisect_left( versions, _as_version( lower ) )
+        end = len( versions ) if upper is None else bisect_right( versions, _as_version( upper ) )
+        return self._load( entries[ start : end ][ ::-1 ], compact )
+
+    def _load( self, entries: list[ IndexEntry ], compact: bool )-> list[ dict[ str, Any ] ]:
+        """
+        Read and parse the blocks of releases
+        """
+        releases = []
+        with open( self.path, 'rb' ) as fp:
+            for entry in entries:
+                fp.seek( entry.start )
+                data = fp.read( entry.end - entry.start )
+                release = _parse_block( data, entry.line, self.encoding, compact )
+                # As when parsing, only the first release with a version gets its compare URL
+                key = None if entry.version is None else _normalize( entry.version )
+                if self._keys.get( key ) is entry and ( url := self._urls.get( key ) ) is not None:
+                    release[ "compare_url" ] = url
+                releases.append( release )
+        return releases
+
+    def _set( self, entries: list[ IndexEntry ], compare_urls: dict[ str, str ], stamp: list )-> None:
+        """
+        Replace the index
+        """
+        self.entries, self.compare_urls, self._stamp = entries, compare_urls, stamp
+        self._keys, self._sorted = {}, None
+        for entry in entries:
+            if entry.version is not None:
+                self._keys.setdefault( _normalize( entry.version ), entry )
+        # As when parsing, a version's last compare URL is the one set on its release
+        self._urls = { _normalize( text ): url for text, url in compare_urls.items() }
+
+    def _read_sidecar( self, stat: os.stat_result )-> bool:
+        """
+        Use the index from the sidecar file, if it's for the file as it is now
+
+        :return: whether the sidecar file's index was used
+        """
+        if self.sidecar is None:
+            return False
+        try:
+            with open( self.sidecar, 'r', encoding = 'utf-8' ) as fp:
+                data = json.load( fp )
+            size, mtime_ns, digest = data[ "stamp" ]
+            if ( data[ "format" ], data[ "encoding" ] ) != ( _SIDECAR_FORMAT, self.encoding ):
+                return False
+            entries = [ IndexEntry( *entry ) for entry in data[ "entries" ] ]
+            compare_urls = dict( data[ "compare_urls" ] )
+        except ( OSError, ValueError, KeyError, TypeError ):   # rebuilt if missing, partial, or corrupt
+            return False
+
+        # If only the modification time changed (eg. the file was checked out again), compare the contents
+        if size != stat.st_size or ( mtime_ns != stat.st_mtime_ns and _hash( self.path ) != digest ):
+            return False
+        self._set( entries, compare_urls, [ size, stat.st_mtime_ns, digest ] )
+        if mtime_ns != stat.st_mtime_ns:
+            self._write_sidecar()
+        return True
+
+    def _write_sidecar( self )-> None:
+        """
+        Write the index to the sidecar file (atomically)
+        """
+        data = json.dumps( {
+            "format": _SIDECAR_FORMAT,
+            "encoding": self.encoding,
+            "stamp": self._stamp,
+            "entries": self.entries,
+            "compare_urls": list( self.compare_urls.items() )
+        }, separators = ( ",", ":" ) ).encode( 'utf-8' )
+        _write_atomically( self.sidecar, lambda fp : fp.write( data ) )
+
+def load_release(   path: Union[ str, os.PathLike ],
+                    version: Union[ Version, str ],
+                    encoding: str = 'utf-8',
+                    *,
+                    sidecar: Union[ bool, str, os.PathLike ] = False,
+                    compact: bool = False
+                )-> Optional[ dict[ str, Any ] ]:
+    """
+    Load a single release from a changelog file, only parsing its block (see "ReleaseIndex")
+
+    :param path: the path of the changelog file
+    :param version: a semver Version, a semver string, or "Unreleased" (ignoring case)
+    :param encoding: the encoding of the file (must be ASCII compatible, like UTF-8)
+    :param sidecar: keep the file's index in a sidecar file (see "ReleaseIndex"), so later calls don't scan it
+    :param compact: load a compact Release record instead of a dictionary (see "Release")
+    :return: the release with the version (see README.md for structure), if any
+    """
+    return ReleaseIndex( path, encoding, sidecar = sidecar ).load_release( version, compact = compact )
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Sharing the parsed versions and dates of strings between loads, so the same
+version or date string isn't parsed (and kept) again
+"""
+
+import functools
+from collections import namedtuple
+from datetime import date
+from typing import ( Any, Callable, Optional )
+from semver import Version
+
+_INTERN_SIZE = 4096
+
+InternInfo = namedtuple( 'InternInfo', ( 'versions', 'dates' ) )
+_CacheInfo = namedtuple( 'CacheInfo', ( 'hits', 'misses', 'maxsize', 'currsize' ) )
+
+def _interned( parse: Callable[ [ str ], Any ], maxsize: Optional[ int ] )-> Callable[ [ str ], Any ]:
+    """
+    Cache the parsed values of strings until "maxsize" are kept. Strings parsed
+    after that are parsed each time instead of replacing kept ones (which
+    would parse every string again, in a loop, once more distinct strings are
+    parsed than are kept)
+    """
+    kept = set()
+    def keep( text: str )-> Any:
+        value = parse( text )
+        kept.add( text )
+        return value
+
+    # Both caches are safe to call from any thread (though a few more than "maxsize" values can be kept, if
+    # they're parsed at the same time), and the second only counts the strings that aren't kept
+    cache = functools.lru_cache( maxsize = None )( keep )
+    uncached = functools.lru_cache( maxsize = 0 )( parse )
+
+    def lookup( text: str )-> Any:
+        if text in kept or maxsize is None or len( kept ) < maxsize:
+            return cache( text )
+        return uncached( text )
+
+    def cache_info()-> _CacheInfo:
+        hits, misses, _, currsize = cache.cache_info()
+        return _CacheInfo( hits, misses + uncached.cache_info().misses, maxsize, currsize )
+
+    lookup.cache_info = cache_info
+    return lookup
+
+# Versions and dates are immutable, so one object can be shared by every release parsed from an equal string
+_interned_versions = _interned( Version.parse, _INTERN_SIZE )
+_interned_dates = _interned( date.fromisoformat, _INTERN_SIZE )
+
+def _parse_version( version: str )-> Version:
+    """
+    Parse a semver version, sharing the Version of an equal string if it's kept
+    """
+    return _interned_versions( version )
+
+def _parse_date( change_date: str )-> date:
+    """
+    Parse an ISO formatted date, sharing the date of an equal string if it's kept
+    """
+    return _interned_dates( change_date )
+
+def set_intern_size( maxsize: Optional[ int ] = _INTERN_SIZE ):
+    """
+    Set how many parsed versions, and how many parsed dates, are kept to be
+    shared by later loads. The first ones parsed are kept, and once there are
+    that many, others are parsed without being kept. This clears them, and
+    their statistics
+
+    :param maxsize: the number of versions (and of dates) to keep, None to keep all of them, or 0 to keep none
+    """
+    global _interned_versions, _interned_dates  # pylint: disable=global-statement
+    _interned_versions = _interned( Version.parse, maxsize )
+    _interned_dates = _interned( date.fromisoformat, maxsize )
+
+def intern_info()-> InternInfo:
+    """
+    Get statistics about the parsed versions and dates shared between loads
+
+    :return: the ( hits, misses, maxsize, currsize ) statistics of the "versions" and of the "dates", where
+        hits are strings whose parsed value was shared instead of parsed again
+    """
+    return InternInfo( _interned_versions.cache_info(), _interned_dates.cache_info() )
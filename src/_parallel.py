@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Parsing many changelog files at once, using a pool of processes or threads
+"""
+
+import os
+from concurrent.futures import ( Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed )
+from typing import ( Iterable, Iterator, Optional, Union )
+from . import ( Changelog, ChangelogParsingError, load_path )
+
+Path = Union[ str, os.PathLike ]
+
+def _load_chunk( paths: list[ Path ], encoding: str )-> list[ Union[ Changelog, Exception ] ]:
+    """
+    Parse a chunk of changelog files, returning errors for files that couldn't be
+    read or parsed instead of raising them
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append( load_path( path, encoding ) )
+        except ( ChangelogParsingError, OSError ) as e:
+            results.append( e )
+    return results
+
+def load_many(  paths: Iterable[ Path ],
+                *,
+                workers: Optional[ int ] = None,
+                chunksize: int = 1,
+                threads: bool = False,
+                ordered: bool = True,
+                encoding: str = 'utf-8'
+            )-> Iterator[ tuple[ Path, Union[ Changelog, ChangelogParsingError, OSError ] ] ]:
+    """
+    Parse many changelog files in parallel (see "load_path"). Processes are
+    used by default, so, on platforms that spawn them, this must be called from
+    code guarded by `if __name__ == "__main__":`; threads are a cheaper choice
+    for a few small files
+
+    :param paths: the paths of the changelog files
+    :param workers: the number of processes (or threads) to parse with (by default, one per CPU)
+    :param chunksize: the number of files each task parses (larger tasks lower the overhead of small files)
+    :param threads: parse using a pool of threads instead of processes
+    :param ordered: yield results in the order of "paths" instead of as they're completed
+    :param encoding: decode the files using this encoding
+    :return: a generator of ( path, result ) tuples, where the result is the parsed changelog (see README.md
+        for structure) or the ChangelogParsingError or OSError raised reading it
+    """
+    if chunksize < 1:
+        raise ValueError( '"chunksize" must be at least 1' )
+    paths = list( paths )
+    executor: Executor = ( ThreadPoolExecutor if threads else ProcessPoolExecutor )( max_workers = workers )
+    try:
+        futures = {
+            executor.submit( _load_chunk, paths[ start : start + chunksize ], encoding ): start
+            for start in range( 0, len( paths ), chunksize )
+        }
+        for future in ( futures if ordered else as_completed( futures ) ):
+            start = futures[ future ]
+            yield from zip( paths[ start : start + chunksize ], future.result() )
+    finally:
+        executor.shutdown( cancel_futures = True )
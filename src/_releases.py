@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Counting the releases parsed from a stream, to stop parsing early
+"""
+
+from typing import ( Any, Callable, Optional, Union )
+from semver import Version
+
+class _Releases:
+    """
+    The releases a parser closes as lines are fed to it, until a limit of them
+    was closed, or one that "until" returns true for
+    """
+    def __init__(   self,
+                    parser: Any,
+                    limit: Optional[ int ] = None,
+                    until: Optional[ Callable[ [ Union[ Version, str ] ], bool ] ] = None
+                ):
+        self.parser, self.limit, self.until, self.count = parser, limit, until, 0
+        self.stopped = limit is not None and limit <= 0
+
+    def feed( self, line: str )-> tuple[ dict[ str, Any ], ... ]:
+        """
+        Feed a line to the parser, returning the release it closed, if any
+        """
+        if ( release := self.parser.feed( line ) ) is None:
+            return ()
+        self.count += 1
+        self.stopped = ( self.limit is not None and self.limit <= self.count ) or \
+                       ( self.until is not None and bool( self.until( release[ "version" ] ) ) )
+        return ( release, )
+
+    def close( self )-> tuple[ dict[ str, Any ], ... ]:
+        """
+        Close the parser (unless it stopped), returning the last release, if any
+        """
+        release = None if self.stopped else self.parser.close()
+        return () if release is None else ( release, )
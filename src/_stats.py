@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Collecting statistics about parsing (counts and timings of each type of line,
+decoding, and version and date parsing), only used when they're requested
+"""
+
+from time import perf_counter
+from datetime import date
+from typing import ( Any, Callable, Iterable, Iterator, Optional, Union )
+from io import IOBase
+from semver import Version
+from . import ( ChangelogParsingError, _COMPARE_URL_PATTERN, _Parser )
+from . import ( _decode, _parse, _parse_date, _parse_version, _read_lines, _split_lines )
+
+_LINE_TYPES = ( 'release', 'section', 'item', 'continuation', 'compare_url', 'blank', 'other' )
+
+class ParseStats:
+    """
+    Statistics about parsing changelog data, passed to the "stats" callback of
+    the load functions. Line types are "release" and "section" headers,
+    "item"s (changes) and their "continuation" lines, "compare_url"s,
+    "blank" lines, and "other" lines (those before the first release, or
+    that failed to parse). Times are in seconds
+    """
+    __slots__ = (
+        'lines', 'line_times', 'bytes_decoded', 'decode_time', 'versions_parsed', 'version_parse_time',
+        'dates_parsed', 'date_parse_time', 'releases', 'total_time', 'error'
+    )
+
+    def __init__( self ):
+        self.lines = dict.fromkeys( _LINE_TYPES, 0 )
+        self.line_times = dict.fromkeys( _LINE_TYPES, 0.0 )
+        self.bytes_decoded, self.decode_time = 0, 0.0
+        self.versions_parsed, self.version_parse_time = 0, 0.0
+        self.dates_parsed, self.date_parse_time = 0, 0.0
+        self.releases, self.total_time = 0, 0.0
+        self.error: Optional[ ChangelogParsingError ] = None
+
+    def as_dict( self )-> dict[ str, Union[ int, float, None ] ]:
+        """
+        Flatten the statistics (eg. to export them as metrics)
+
+        :return: the statistics, with the line counts and times keyed like "lines.item" and "line_times.item"
+        """
+        stats = {}
+        for name in self.__slots__:
+            if name in ( 'lines', 'line_times' ):
+                stats.update( ( f'{ name }.{ key }', value ) for key, value in getattr( self, name ).items() )
+            elif name == 'error':
+                stats[ name ] = None if self.error is None else str( self.error )
+            else:
+                stats[ name ] = getattr( self, name )
+        return stats
+
+    def __repr__( self )-> str:
+        fields = ", ".join( f'{ key }={ value !r}' for key, value in self.as_dict().items() )
+        return f'{ type( self ).__name__ }({ fields })'
+
+class _ProfilingParser( _Parser ):
+    """
+    A parser that counts and times each line it's fed, by type
+    """
+    def __init__( self, stats: ParseStats, compact: bool = False ):
+        super().__init__( compact = compact )
+        self.stats = stats
+
+    def feed( self, line: str )-> Optional[ dict[ str, Any ] ]:
+        # Same order of checks as "_Parser.feed"
+        if not line:
+            line_type = 'blank'
+        elif self.in_compare_urls:
+            line_type = 'compare_url'
+        elif line.startswith( ( '- ', '* ' ) ):
+            line_type = 'item'
+        elif line.startswith( "  " ) and self.section:
+            line_type = 'continuation'
+        elif line.startswith( '## ' ):
+            line_type = 'release'
+        elif self.release is None:
+            line_type = 'other'
+        elif line.startswith( '### ' ):
+            line_type = 'section'
+        else:
+            line_type = 'compare_url' if _COMPARE_URL_PATTERN.fullmatch( line ) else 'other'
+
+        start = perf_counter()
+        try:
+            return super().feed( line )
+        finally:
+            self.stats.lines[ line_type ] += 1
+            self.stats.line_times[ line_type ] += perf_counter() - start
+
+    def parse_version( self, version: str )-> Version:
+        """
+        Parse a semver version, counting and timing it
+        """
+        start = perf_counter()
+        try:
+            return _parse_version( version )
+        finally:
+            self.stats.versions_parsed += 1
+            self.stats.version_parse_time += perf_counter() - start
+
+    def parse_date( self, change_date: str )-> date:
+        """
+        Parse an ISO formatted date, counting and timing it
+        """
+        start = perf_counter()
+        try:
+            return _parse_date( change_date )
+        finally:
+            self.stats.dates_parsed += 1
+            self.stats.date_parse_time += perf_counter() - start
+
+class _DecodingReader:
+    """
+    A stream wrapper that decodes the lines read from it, counting and timing
+    the decoding
+    """
+    def __init__( self, fp: IOBase, encoding: str, stats: ParseStats ):
+        self.fp, self.encoding, self.stats = fp, encoding, stats
+
+    def readline( self )-> Any:
+        """
+        Read and decode a line, counting and timing the decoding
+        """
+        line = self.fp.readline()
+        if isinstance( line, bytes ):
+            self.stats.bytes_decoded += len( line )
+            start = perf_counter()
+            try:
+                line = line.decode( self.encoding )
+            except ( UnicodeError, LookupError ):
+                # Decoded again (and the error reported on the right line) by "_read_lines"
+                pass
+            finally:
+                self.stats.decode_time += perf_counter() - start
+        return line
+
+def _profile(   lines: Callable[ [ ParseStats ], Iterable[ str ] ],
+                limit: Optional[ int ],
+                until: Optional[ Callable[ [ Union[ Version, str ] ], bool ] ],
+                compact: bool,
+                callback: Callable[ [ ParseStats ], Any ]
+            )-> Iterator[ dict[ str, Any ] ]:
+    """
+    Parse lines, collecting statistics, then pass the statistics to a callback
+    (whether parsing succeeded, failed, or was stopped early). Only time spent
+    parsing counts towards the total time, not time spent between releases
+    being yielded
+    """
+    stats = ParseStats()
+    try:
+        start = perf_counter()
+        try:
+            releases = _parse( lines( stats ), limit, until, compact, _ProfilingParser( stats, compact ) )
+        finally:
+            stats.total_time += perf_counter() - start
+        while True:
+            start = perf_counter()
+            try:
+                release = next( releases )
+            except StopIteration:
+                return
+            finally:
+                stats.total_time += perf_counter() - start
+            stats.releases += 1
+            yield release
+    except ChangelogParsingError as e:
+        stats.error = e
+        raise
+    finally:
+        callback( stats )
+
+def profile_stream( fp: IOBase, encoding: str, *args )-> Iterator[ dict[ str, Any ] ]:
+    """
+    Parse changelog data from a stream, collecting statistics (see "_profile")
+    """
+    return _profile( lambda stats : _read_lines( _DecodingReader( fp, encoding, stats ), encoding ), *args )
+
+def profile_string( s: str, *args )-> Iterator[ dict[ str, Any ] ]:
+    """
+    Parse changelog data from a string, collecting statistics (see "_profile")
+    """
+    return _profile( lambda _ : _split_lines( s ), *args )
+
+def profile_bytes( buf: Any, encoding: str, *args )-> Iterator[ dict[ str, Any ] ]:
+    """
+    Parse changelog data from a bytes-like object, decoding it all at once and
+    collecting statistics (see "_profile")
+    """
+    def lines( stats: ParseStats )-> list[ str ]:
+        stats.bytes_decoded = len( buf )
+        start = perf_counter()
+        try:
+            return _split_lines( _decode( buf, encoding ) ) if len( buf ) else []
+        finally:
+            stats.decode_time = perf_counter() - start
+    return _profile( lines, *args )
@@ -0,0 +1,319 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Exporting parsed changelogs as columns (of numbers and strings, rather than
+dictionaries of semver Versions and dates), to analyze many changelogs at once
+"""
+
+import sys
+import json
+import struct
+from array import array
+from datetime import date
+from collections.abc import Mapping
+from typing import ( Any, Iterable, Union )
+from io import ( IOBase, TextIOBase )
+from semver import Version
+from . import ( Changelog, ChangelogParsingError, _SECTION_KEYS, _SEMVER_PATTERN, _entry_version )
+
+# Numeric columns (by array type code) and string columns, in order
+_NUMERIC_COLUMNS = {
+    "source": 'q', "major": 'q', "minor": 'q', "patch": 'q', "date": 'q', "yanked": 'B', "sections": 'B',
+    "offset": 'q', **{ f'{ key }_count': 'q' for key in _SECTION_KEYS }
+}
+_STRING_COLUMNS = ( "prerelease", "build", "compare_url" )
+_SECTION_BITS = { key: 1 << bit for bit, key in enumerate( _SECTION_KEYS ) }
+_MAGIC = b"CLTABLE\x00"
+_FORMAT = 1
+_HEADER = struct.Struct( '<8sBcI' )
+_BYTE_ORDERS = { 'little': b'<', 'big': b'>' }
+
+def _version_fields( version: Union[ Version, str ] )-> tuple[ Any, ... ]:
+    """
+    Split a version into its numbers, prerelease, and build (numbers of -1 for
+    "Unreleased"), without creating a semver Version for version strings
+    """
+    if isinstance( version, Version ):
+        return version.major, version.minor, version.patch, version.prerelease, version.build
+    if version.lower() == "unreleased":
+        return -1, -1, -1, None, None
+    if ( match := _SEMVER_PATTERN.fullmatch( version ) ) is None:
+        raise ValueError( f'"{ version }" is not a valid semver version' )
+    major, minor, patch, prerelease, build = match.group( 'major', 'minor', 'patch', 'prerelease', 'build' )
+    return int( major ), int( minor ), int( patch ), prerelease, build
+
+class ChangelogTable:
+    """
+    Releases of many changelogs as parallel columns, one row per release.
+    Numeric columns are arrays (of 64 bit integers, or bytes for flags), which
+    NumPy can use without copying (eg. "numpy.frombuffer( table.columns[ "major"
+    ], dtype = numpy.int64 )"), and string columns are lists:
+
+    - "source": the index of the release's changelog in "sources"
+    - "major", "minor", and "patch": the version's numbers (-1 for "Unreleased")
+    - "prerelease" and "build": the version's prerelease and build strings (or None)
+    - "date": the release date's proleptic Gregorian ordinal (0 if it has none)
+    - "yanked": 1 if the release was yanked (otherwise 0)
+    - "sections": a bit mask of the sections the release has (bit n for the nth of "SECTION_KEYS")
+    - "offset": the index in "items" of the release's first change (its sections' changes are in the order
+      of "SECTION_KEYS")
+    - "added_count", "changed_count", ...: the number of changes in each section
+    - "compare_url": the release's compare URL (or None)
+    """
+    SECTION_KEYS = _SECTION_KEYS
+
+    def __init__( self ):
+        self.columns: dict[ str, Union[ array, list ] ] = {
+            **{ name: array( typecode ) for name, typecode in _NUMERIC_COLUMNS.items() },
+            **{ name: [] for name in _STRING_COLUMNS }
+        }
+        self.items: list[ str ] = []
+        self.sources: list[ Any ] = []
+
+    def __len__( self )-> int:
+        return len( self.columns[ "source" ] )
+
+    def __eq__( self, other: Any )-> bool:
+        if not isinstance( other, ChangelogTable ):
+            return NotImplemented
+        return ( self.columns, self.items, self.sources ) == ( other.columns, other.items, other.sources )
+
+    def extend( self, changes: Iterable[ Mapping[ str, Any ] ], source: Any = None )-> None:
+        """
+        Add the releases of a parsed changelog (as one more source)
+
+        :param changes: the parsed changelog (see README.md for structure)
+        :param source: an identifier of the changelog (eg. its path), kept in "sources"
+        """
+        index, items, rows = len( self.sources ), self.items, []
+        for change in changes:
+            major, minor, patch, prerelease, build = _version_fields( _entry_version( change ) )
+            change_date = change[ "date" ] if "date" in change else None
+
+            # Only the sections a release has are looked up
+            sections = { key: change[ key ] for key in change if key in _SECTION_BITS }
+            mask, offset = 0, len( items )
+            for key in _SECTION_KEYS:
+                if key in sections:
+                    mask |= _SECTION_BITS[ key ]
+                    items.extend( sections[ key ] )
+            rows.append( (
+                index, major, minor, patch, 0 if change_date is None else change_date.toordinal(),
+                1 if change.get( "yanked", False ) else 0, mask, offset,
+                *[ len( sections[ key ] ) if key in sections else 0 for key in _SECTION_KEYS ],
+                prerelease, build, change.get( "compare_url" )
+            ) )
+
+        # Rows are added to the columns all at once
+        self.sources.append( source )
+        for name, values in zip( ( *_NUMERIC_COLUMNS, *_STRING_COLUMNS ), zip( *rows ) ):
+            self.columns[ name ].extend( values )
+
+    @classmethod
+    def concat( cls, tables: Iterable[ 'ChangelogTable' ] )-> 'ChangelogTable':
+        """
+        Concatenate tables, only shifting their "source" and "offset" columns
+
+        :param tables: the tables to concatenate, in order
+        :return: a table of the releases of every table
+        """
+        result = cls()
+        for table in tables:
+            sources, items = len( result.sources ), len( result.items )
+            for name, column in table.columns.items():
+                if name == "source" and sources:
+                    column = array( 'q', [ value + sources for value in column ] )
+                elif name == "offset" and items:
+                    column = array( 'q', [ value + items for value in column ] )
+                result.columns[ name ] += column
+            result.items += table.items
+            result.sources += table.sources
+        return result
+
+    def changelogs( self )-> list[ tuple[ Any, Changelog ] ]:
+        """
+        Convert the table back into parsed changelogs
+
+        :return: the source and parsed changelog (see README.md for structure) of each changelog, in order
+        """
+        results, columns = [ ( source, Changelog() ) for source in self.sources ], self.columns
+        for row, change in enumerate( self._rows() ):
+            if columns[ "major" ][ row ] < 0:
+                version = "Unreleased"
+            else:
+                version = Version( *( columns[ name ][ row ] for name in (
+                    "major", "minor", "patch", "prerelease", "build"
+                ) ) )
+            ordinal = columns[ "date" ][ row ]
+            change = {
+                "date": date.fromordinal( ordinal ) if ordinal else None,
+                "yanked": bool( columns[ "yanked" ][ row ] ),
+                "version": version,
+                **change
+            }
+            if ( url := columns[ "compare_url" ][ row ] ) is not None:
+                change[ "compare_url" ] = url
+            results[ columns[ "source" ][ row ] ][ 1 ].append( change )
+        return results
+
+    def as_dict( self )-> dict[ str, Any ]:
+        """
+        Convert the table to plain lists (eg. for "pandas.DataFrame( table.as_dict()[ "columns" ] )")
+
+        :return: the "columns" (a dictionary of lists), "items", and "sources"
+        """
+        return {
+            "columns": { name: list( column ) for name, column in self.columns.items() },
+            "items": list( self.items ),
+            "sources": list( self.sources )
+        }
+
+    @classmethod
+    def from_dict( cls, data: Mapping[ str, Any ] )-> 'ChangelogTable':
+        """
+        Create a table from plain lists (see "as_dict")
+
+        :param data: the "columns", "items", and "sources" of a table
+        :return: the table
+        """
+        table = cls()
+        for name, column in data[ "columns" ].items():
+            if name not in table.columns:
+                raise ValueError( f'"{ name }" is not a changelog table column' )
+            table.columns[ name ] = array( _NUMERIC_COLUMNS[ name ], column ) if name in _NUMERIC_COLUMNS \
+                                    else list( column )
+        table.items, table.sources = list( data[ "items" ] ), list( data[ "sources" ] )
+        if any( len( column ) != len( table ) for column in table.columns.values() ):
+            raise ValueError( 'Changelog table columns must all be the same length' )
+        return table
+
+    def dump_jsonl( self, fp: IOBase )-> None:
+        """
+        Write the table as JSON Lines, one object per release (with the index
+        and value of its source, and the changes of its sections, in place of
+        the "source", "offset", and count columns), eg. for "pandas.read_json(
+        fp, lines = True )". A changelog without releases is written as an
+        object with only its source's index and value
+
+        :param fp: a stream to write to (text, or binary to write UTF-8)
+        """
+        columns = self.columns
+        names = [ name for name in columns if name not in ( "source", "offset", "sections" ) ]
+        names = [ name for name in names if not name.endswith( "_count" ) ]
+        encoder, binary = json.JSONEncoder( ensure_ascii = False ), not isinstance( fp, TextIOBase )
+
+        def write( record: dict[ str, Any ] )-> None:
+            line = encoder.encode( record ) + "\n"
+            fp.write( line.encode( 'utf-8' ) if binary else line )
+
+        written = set( columns[ "source" ] )
+        empty = iter( index for index in range( len( self.sources ) ) if index not in written )
+        pending = next( empty, None )
+        for row, change in enumerate( self._rows() ):
+            index = columns[ "source" ][ row ]
+            while pending is not None and pending < index:
+                write( { "source_index": pending, "source": self.sources[ pending ] } )
+                pending = next( empty, None )
+            record = { "source_index": index, "source": self.sources[ index ] }
+            record.update( ( name, columns[ name ][ row ] ) for name in names )
+            record.update( change )
+            write( record )
+        while pending is not None:
+            write( { "source_index": pending, "source": self.sources[ pending ] } )
+            pending = next( empty, None )
+
+    @classmethod
+    def load_jsonl( cls, fp: IOBase )-> 'ChangelogTable':
+        """
+        Read a table written as JSON Lines (see "dump_jsonl")
+
+        :param fp: a stream to read from
+        :return: the table
+        """
+        table, sources = cls(), {}
+        columns = table.columns
+        for line_number, line in enumerate( fp, start = 1 ):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads( line )
+            except ValueError as e:
+                raise ChangelogParsingError( f'Invalid JSON line ({ e })', line_number ) from e
+            sources[ record[ "source_index" ] ] = record[ "source" ]
+            if "major" not in record:
+                continue
+            mask, offset = 0, len( table.items )
+            for bit, key in enumerate( _SECTION_KEYS ):
+                changes = record.get( key )
+                if changes is not None:
+                    mask |= 1 << bit
+                    table.items.extend( changes )
+                columns[ f'{ key }_count' ].append( 0 if changes is None else len( changes ) )
+            columns[ "source" ].append( record[ "source_index" ] )
+            columns[ "sections" ].append( mask )
+            columns[ "offset" ].append( offset )
+            for name in ( "major", "minor", "patch", "date", "yanked", *_STRING_COLUMNS ):
+                columns[ name ].append( record[ name ] )
+        table.sources = [ sources.get( index ) for index in range( max( sources, default = -1 ) + 1 ) ]
+        return table
+
+    def to_bytes( self )-> bytes:
+        """
+        Serialize the table compactly: the numeric columns as raw arrays, and
+        the string columns (and sources, which must be JSON serializable) as JSON
+
+        :return: the serialized table
+        """
+        strings = json.dumps( {
+            "rows": len( self ),
+            "strings": { name: self.columns[ name ] for name in _STRING_COLUMNS },
+            "items": self.items,
+            "sources": self.sources
+        }, ensure_ascii = False, separators = ( ",", ":" ) ).encode( 'utf-8' )
+        return b"".join( (
+            _HEADER.pack( _MAGIC, _FORMAT, _BYTE_ORDERS[ sys.byteorder ], len( strings ) ), strings,
+            *( self.columns[ name ].tobytes() for name in _NUMERIC_COLUMNS )
+        ) )
+
+    @classmethod
+    def from_bytes( cls, buf: Any )-> 'ChangelogTable':
+        """
+        Deserialize a table (see "to_bytes")
+
+        :param buf: a bytes-like object of the serialized table
+        :return: the table
+        """
+        buf = memoryview( buf ).cast( 'B' )
+        if len( buf ) < _HEADER.size:
+            raise ValueError( 'Data is not a serialized changelog table' )
+        magic, version, byte_order, size = _HEADER.unpack_from( buf )
+        if magic != _MAGIC or version != _FORMAT or byte_order not in _BYTE_ORDERS.values():
+            raise ValueError( 'Data is not a serialized changelog table (of a supported format)' )
+        data = json.loads( str( buf[ _HEADER.size : _HEADER.size + size ], 'utf-8' ) )
+        table, position, rows = cls(), _HEADER.size + size, data[ "rows" ]
+        for name, typecode in _NUMERIC_COLUMNS.items():
+            column = array( typecode )
+            end = position + rows * column.itemsize
+            if len( buf ) < end:
+                raise ValueError( 'Serialized changelog table is truncated' )
+            column.frombytes( buf[ position : end ] )
+            if byte_order != _BYTE_ORDERS[ sys.byteorder ]:
+                column.byteswap()
+            table.columns[ name ], position = column, end
+        table.columns.update( data[ "strings" ] )
+        table.items, table.sources = data[ "items" ], data[ "sources" ]
+        return table
+
+    def _rows( self )-> Iterable[ dict[ str, list[ str ] ] ]:
+        """
+        Get the changes of each section of each release
+        """
+        columns, counts = self.columns, [ self.columns[ f'{ key }_count' ] for key in _SECTION_KEYS ]
+        for row in range( len( self ) ):
+            position, mask, sections = columns[ "offset" ][ row ], columns[ "sections" ][ row ], {}
+            for bit, key in enumerate( _SECTION_KEYS ):
+                count = counts[ bit ][ row ]
+                if mask >> bit & 1:
+                    sections[ key ] = self.items[ position : position + count ]
+                position += count
+            yield sections
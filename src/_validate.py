@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: MIT
+
+"""
+Validating changelog data, reporting every problem in one pass
+"""
+
+from collections import namedtuple
+from typing import ( Any, Iterable, Iterator, Mapping, Optional, Union )
+from io import IOBase
+from . import ( __version__, ChangelogParsingError, _COMPARE_URL_PATTERN, _Parser )
+from . import ( _decode_line, _split_lines )
+
+Diagnostic = namedtuple( 'Diagnostic', ( 'line', 'column', 'rule', 'message' ) )
+
+_RULES = {
+    'trailing-space': 'Release headers must not end with spaces',
+    'extra-space': 'Release headers must not have extra spaces around their version or date',
+    'date-separator': 'Release versions and dates must be separated by " - "',
+    'invalid-date': 'Release dates must be ISO formatted (YYYY-MM-DD)',
+    'version-brackets': 'Release versions must be enclosed with square brackets',
+    'invalid-version': 'Versions must be semantic versions (or "Unreleased")',
+    'change-outside-section': 'Changes must be under a change type ("### ") section',
+    'invalid-section': 'Sections must be one of Added, Changed, Deprecated, Removed, Fixed, or Security',
+    'duplicate-section': 'Releases must not have multiple sections of the same change type',
+    'unrecognized-line': 'Lines must be headers, changes (and their continuations), blank lines, or '
+                         'compare URLs',
+    'unknown-compare-url-version': 'Compare URLs must be for the version of a release',
+    'content-after-compare-urls': 'Only compare URLs (and blank lines) can follow the first compare URL',
+    'decode-error': 'Changelog data must be decodable with its encoding',
+    'unreadable-type': 'Streams must output strings or bytes'
+}
+
+# Lines that parsing can resume at after an error
+_RESYNC_PREFIXES = ( '## ', '### ', '[' )
+
+class _ValidatingParser( _Parser ):
+    """
+    A parser that keeps checking the block of a release whose header failed to
+    parse, with a placeholder release (that's dropped when it's closed)
+    """
+    def __init__( self ):
+        super().__init__()
+        self.placeholder = False
+        self.failed_versions = set()
+
+    def fail_release( self, line: str ):
+        """
+        Start a placeholder release after the release header line failed to parse
+        """
+        self.release, self.placeholder = {}, True
+        self.failed_versions.add( line[ 3 : ].partition( "]" )[ 0 ].strip( "[ " ).lower() )
+
+    def _close_release( self )-> Optional[ dict[ str, Any ] ]:
+        if not self.placeholder:
+            return super()._close_release()
+        self._close_section()
+        self.release, self.placeholder = None, False
+        return None
+
+def _read_lines( fp: IOBase, encoding: str )-> Iterator[ Union[ str, ChangelogParsingError ] ]:
+    """
+    Read lines from a stream (see "_read_lines" of the package), returning an
+    error in place of each line that can't be decoded
+    """
+    line_no = 0
+    while ( line := fp.readline() ):
+        line_no += 1
+        try:
+            yield _decode_line( line, encoding, line_no )
+        except ChangelogParsingError as e:
+            yield e
+            if e.rule != 'decode-error':
+                return
+
+def _validate(  lines: Iterable[ Union[ str, ChangelogParsingError ] ],
+                max_errors: Optional[ int ]
+            )-> list[ Diagnostic ]:
+    """
+    Parse lines, recording each error. A release whose header fails is still
+    checked (but compare URLs for it aren't reported). When an error leaves
+    changes without a section, lines are skipped until the next header (or
+    compare URL), rather than reporting each change
+    """
+    parser, diagnostics, resyncing = _ValidatingParser(), [], False
+    for line in lines:
+        if isinstance( line, str ):
+            if resyncing and not line.startswith( _RESYNC_PREFIXES ):
+                parser.line_no += 1
+                continue
+            try:
+                parser.feed( line )
+                resyncing = False
+                continue
+            except ChangelogParsingError as e:
+                error = e
+            if error.rule == 'unknown-compare-url-version' and \
+               _COMPARE_URL_PATTERN.fullmatch( line ).group( 1 ).lower() in parser.failed_versions:
+                continue
+            if line.startswith( '## ' ) and not parser.in_compare_urls:
+                parser.fail_release( line )
+            resyncing = parser.release is not None and parser.section is None and not parser.in_compare_urls
+        else:
+            error = line
+            parser.line_no += 1
+
+        diagnostics.append( Diagnostic( error.line_number, error.column_number, error.rule, error.msg ) )
+        if error.rule == 'unreadable-type' or ( max_errors is not None and max_errors <= len( diagnostics ) ):
+            break
+    return diagnostics
+
+def validate(   fp: IOBase,
+                encoding: str = 'utf-8',
+                *,
+                max_errors: Optional[ int ] = None
+            )-> list[ Diagnostic ]:
+    """
+    Check changelog data from a stream, reporting every problem instead of
+    stopping at the first. Checking carries on after most problems, but
+    changes that are left without a section (eg. under an invalid section
+    header) are skipped, so problems with them may not be reported until it's
+    fixed
+
+    :param fp: a stream that outputs changelog data (eg. a file opened for reading)
+    :param encoding: if the stream outputs binary data, decode it using this encoding
+    :param max_errors: stop after finding this many problems
+    :return: the problems, as ( line, column, rule, message ) named tuples (no problems if it's valid)
+    """
+    return _validate( _read_lines( fp, encoding ), max_errors )
+
+def validates( s: str, *, max_errors: Optional[ int ] = None )-> list[ Diagnostic ]:
+    """
+    Check changelog data provided as a string (see "validate")
+
+    :param s: the string to check as a changelog
+    :param max_errors: stop after finding this many problems
+    :return: the problems, as ( line, column, rule, message ) named tuples (no problems if it's valid)
+    """
+    return _validate( _split_lines( s ), max_errors )
+
+def to_sarif( results: Mapping[ str, Iterable[ Diagnostic ] ] )-> dict[ str, Any ]:
+    """
+    Format problems found in changelog files as a SARIF log (eg. to upload to
+    code scanning, or to aggregate with other tools' results)
+
+    :param results: the problems found in each file, by the file's path (or URI)
+    :return: a SARIF (version 2.1.0) log, to serialize as JSON
+    """
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [ {
+            "tool": {
+                "driver": {
+                    "name": "changelog-parser",
+                    "version": __version__,
+                    "informationUri": "https://github.com/JasonStiefel/changelog-parser",
+                    "rules": [
+                        { "id": rule, "shortDescription": { "text": description } }
+                        for rule, description in _RULES.items()
+                    ]
+                }
+            },
+            "results": [
+                {
+                    "ruleId": diagnostic.rule,
+                    "level": "error",
+                    "message": { "text": diagnostic.message },
+                    "locations": [ { "physicalLocation": {
+                        "artifactLocation": { "uri": path },
+                        **( {} if diagnostic.line is None else { "region": {
+                            "startLine": diagnostic.line,
+                            **( {} if diagnostic.column is None else { "startColumn": diagnostic.column } )
+                        } } )
+                    } } ]
+                }
+                for path, diagnostics in results.items() for diagnostic in diagnostics
+            ]
+        } ]
+    }
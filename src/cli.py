@@ -0,0 +1,270 @@
+# SPDX-License-Identifier: MIT
+
+"""
+The "changelog" command, validating, formatting, and exporting changelog
+files (many at once, in parallel with "--jobs"). Modules only some commands
+use (like json, and the process pool) are imported when they're needed, so
+the command starts quickly
+"""
+
+import os
+import re
+import sys
+import argparse
+import functools
+import importlib
+from datetime import date
+from typing import ( Any, Callable, Iterator, Optional, Sequence )
+from semver import Version
+from . import ( __version__, DEFAULT_HEADER, ChangelogParsingError, dumps, iter_load, load_bytes )
+
+_GLOB_CHARACTERS = ( '*', '?', '[' )
+
+def _expand( patterns: Sequence[ str ] )-> list[ str ]:
+    """
+    Expand the glob patterns of the path arguments (like "**/CHANGELOG.md"),
+    keeping patterns that match nothing as paths, so that they're reported as
+    missing files
+    """
+    paths = []
+    for pattern in patterns:
+        if any( character in pattern for character in _GLOB_CHARACTERS ):
+            matches = importlib.import_module( 'glob' ).glob( pattern, recursive = True )
+            paths.extend( sorted( matches ) or [ pattern ] )
+        else:
+            paths.append( pattern )
+    return paths
+
+def _call( worker: Callable[ [ str, argparse.Namespace ], Any ],
+           options: argparse.Namespace,
+           path: str
+        )-> tuple[ Any, Optional[ str ] ]:
+    """
+    Run a command on a file, returning the error reading or parsing it (if
+    any) instead of raising it, so the other files are still processed
+    """
+    try:
+        return worker( path, options ), None
+    except ( ChangelogParsingError, OSError ) as e:
+        return None, str( e )
+
+def _map(   worker: Callable[ [ str, argparse.Namespace ], Any ],
+            options: argparse.Namespace,
+            paths: list[ str ]
+        )-> Iterator[ tuple[ Any, Optional[ str ] ] ]:
+    """
+    Run a command on each file, in order, using a pool of processes when more
+    than one job is allowed (and there's more than one file)
+    """
+    function = functools.partial( _call, worker, options )
+    if options.jobs == 1 or len( paths ) < 2:
+        yield from map( function, paths )
+        return
+
+    workers = options.jobs or os.cpu_count() or 1
+    futures = importlib.import_module( 'concurrent.futures' )
+    with futures.ProcessPoolExecutor( max_workers = workers ) as executor:
+        yield from executor.map( function, paths, chunksize = max( 1, len( paths ) // ( workers * 4 ) ) )
+
+def _json_default( value: Any )-> str:
+    """
+    Convert the values of changelog data that aren't JSON types to strings
+    """
+    if isinstance( value, Version ):
+        return str( value )
+    if isinstance( value, date ):
+        return value.isoformat()
+    raise TypeError( f'Object of type { type( value ).__name__ } is not JSON serializable' )
+
+def _validate_file( path: str, options: argparse.Namespace )-> list[ Any ]:
+    """
+    Find the problems in a file
+    """
+    with open( path, 'rb' ) as fp:
+        return importlib.import_module( '._validate', __package__ ).validate(
+            fp, options.encoding, max_errors = options.max_errors
+        )
+
+def _format_file( path: str, options: argparse.Namespace )-> bool:
+    """
+    Rewrite a file as "dump" formats it (unless only checking), returning
+    whether it was (or would be) rewritten
+    """
+    with open( path, 'rb' ) as fp:
+        data = fp.read()
+    changes = load_bytes( data, options.encoding )
+    text = data.decode( options.encoding )
+
+    # Text before the first release is kept as the header
+    header = text[ : match.start() ] if ( match := re.search( r'^## ', text, re.MULTILINE ) ) else text
+    header = header.rstrip() or DEFAULT_HEADER
+    if dumps( changes, header ) == text:
+        return False
+    if not options.check:
+        importlib.import_module( '._files', __package__ ).dump_path( changes, path, header, options.encoding )
+    return True
+
+def _latest_file( path: str, options: argparse.Namespace )-> Optional[ str ]:
+    """
+    Format the newest release of a file, only reading as far as it
+    """
+    with open( path, 'rb' ) as fp:
+        if options.released:
+            until = lambda version : isinstance( version, Version )
+            releases = list( iter_load( fp, options.encoding, until = until ) )
+            releases = [ release for release in releases if isinstance( release[ "version" ], Version ) ]
+        else:
+            releases = list( iter_load( fp, options.encoding, limit = 1 ) )
+    if not releases:
+        return None
+    release = { key: value for key, value in releases[ -1 ].items() if key != "compare_url" }
+    return dumps( [ release ], header = "" ).strip( "\n" ) + "\n"
+
+def _json_file( path: str, options: argparse.Namespace )-> list[ dict[ str, Any ] ]:
+    """
+    Parse a file
+    """
+    with open( path, 'rb' ) as fp:
+        return load_bytes( fp.read(), options.encoding )
+
+def _run_validate( options: argparse.Namespace, paths: list[ str ] )-> int:
+    """
+    Report the problems in each file, as text (like "path:line:column: message
+    [rule]"), JSON records, or a SARIF log
+    """
+    results, failed = {}, False
+    for path, ( diagnostics, error ) in zip( paths, _map( _validate_file, options, paths ) ):
+        if error is not None:
+            print( f'{ path }: { error }', file = sys.stderr )
+            failed = True
+            continue
+        results[ path ] = diagnostics
+        failed = failed or bool( diagnostics )
+        if options.format == 'text':
+            for line, column, rule, message in diagnostics:
+                location = ":".join( str( number ) for number in ( line, column ) if number is not None )
+                print( f'{ path }:{ location + ":" if location else "" } { message } [{ rule }]' )
+
+    if options.format == 'json':
+        records = [
+            { "path": path, **diagnostic._asdict() } for path, diagnostics in results.items()
+            for diagnostic in diagnostics
+        ]
+        print( importlib.import_module( 'json' ).dumps( records, indent = 2 ) )
+    elif options.format == 'sarif':
+        sarif = importlib.import_module( '._validate', __package__ ).to_sarif( results )
+        print( importlib.import_module( 'json' ).dumps( sarif, indent = 2 ) )
+    return 1 if failed else 0
+
+def _run_format( options: argparse.Namespace, paths: list[ str ] )-> int:
+    """
+    Rewrite (or check) each file, reporting those that were (or would be) rewritten
+    """
+    failed = False
+    for path, ( changed, error ) in zip( paths, _map( _format_file, options, paths ) ):
+        if error is not None:
+            print( f'{ path }: { error }', file = sys.stderr )
+            failed = True
+        elif changed:
+            print( f'{ "would reformat" if options.check else "reformatted" } { path }' )
+            failed = failed or options.check
+    return 1 if failed else 0
+
+def _run_latest( options: argparse.Namespace, paths: list[ str ] )-> int:
+    """
+    Print the newest release notes of each file (after its path, if there are many)
+    """
+    failed = False
+    for index, ( path, ( notes, error ) ) in enumerate( zip( paths, _map( _latest_file, options, paths ) ) ):
+        if notes is None:
+            print( f'{ path }: { error or "No releases found" }', file = sys.stderr )
+            failed = True
+            continue
+        if 1 < len( paths ):
+            print( ( "\n" if index else "" ) + f'==> { path } <==' )
+        print( notes, end = "" )
+    return 1 if failed else 0
+
+def _run_json( options: argparse.Namespace, paths: list[ str ] )-> int:
+    """
+    Print the data of the files as JSON
+    """
+    results, failed = {}, False
+    for path, ( changes, error ) in zip( paths, _map( _json_file, options, paths ) ):
+        if error is not None:
+            print( f'{ path }: { error }', file = sys.stderr )
+            failed = True
+        else:
+            results[ path ] = changes
+
+    # A single file is exported as its list of releases, many as an object keyed by their paths
+    if len( paths ) == 1:
+        results = results.get( paths[ 0 ], [] )
+    json = importlib.import_module( 'json' )
+    print( json.dumps( results, indent = options.indent, default = _json_default ) )
+    return 1 if failed else 0
+
+_COMMANDS = {
+    'validate': _run_validate,
+    'format': _run_format,
+    'latest': _run_latest,
+    'json': _run_json
+}
+
+def _parser()-> argparse.ArgumentParser:
+    """
+    Create the command line argument parser
+    """
+    parser = argparse.ArgumentParser( prog = "changelog",
+                                      description = "Validate, format, and export changelog files" )
+    parser.add_argument( '--version', action = 'version', version = f'%(prog)s { __version__ }' )
+    common = argparse.ArgumentParser( add_help = False )
+    common.add_argument( 'paths', nargs = '+', metavar = 'PATH',
+                         help = 'changelog files, or glob patterns of them (like "**/CHANGELOG.md")' )
+    common.add_argument( '-j', '--jobs', type = int, default = 1,
+                         help = 'the number of files to process in parallel, 0 for one per CPU (default: 1)' )
+    common.add_argument( '--encoding', default = 'utf-8',
+                         help = 'the encoding of the files (default: %(default)s)' )
+    commands = parser.add_subparsers( dest = 'command', required = True, metavar = 'COMMAND' )
+
+    validate = commands.add_parser( 'validate', parents = [ common ],
+                                    help = 'report every problem in changelogs' )
+    validate.add_argument( '--format', choices = ( 'text', 'json', 'sarif' ), default = 'text',
+                           help = 'the format of the problems (default: %(default)s)' )
+    validate.add_argument( '--max-errors', type = int,
+                           help = 'stop checking a file after this many problems' )
+
+    format_ = commands.add_parser( 'format', parents = [ common ],
+                                   help = 'rewrite changelogs as "dump" formats them, keeping their headers' )
+    format_.add_argument( '--check', action = 'store_true',
+                          help = "don't rewrite the files, only fail if any would be rewritten" )
+
+    latest = commands.add_parser( 'latest', parents = [ common ],
+                                  help = 'print the newest release notes' )
+    latest.add_argument( '--released', action = 'store_true',
+                         help = 'skip the "Unreleased" entry' )
+
+    json = commands.add_parser( 'json', parents = [ common ],
+                                help = 'export changelogs as JSON (one as its list of releases, many as an '
+                                       'object keyed by their paths)' )
+    json.add_argument( '--indent', type = int,
+                       help = 'indent the JSON by this many spaces' )
+    return parser
+
+def main( args: Optional[ Sequence[ str ] ] = None )-> int:
+    """
+    Run the "changelog" command
+
+    :param args: the command line arguments (by default, those of the process)
+    :return: the exit code, 1 if any file had problems (or couldn't be read), 2 for invalid arguments
+    """
+    parser = _parser()
+    options = parser.parse_args( args )
+    if options.jobs < 0:
+        parser.error( '--jobs must be at least 0' )
+    try:
+        return _COMMANDS[ options.command ]( options, _expand( options.paths ) )
+    except BrokenPipeError:
+        # The output was closed early (eg. piped to "head"), so stop, without a second error when exiting
+        os.dup2( os.open( os.devnull, os.O_WRONLY ), sys.stdout.fileno() )
+        return 1
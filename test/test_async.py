@@ -0,0 +1,121 @@
+import asyncio
+from io import BytesIO
+import changelog
+import pytest
+
+class LineReader:
+    def __init__( self, data ):
+        self.fp = BytesIO( data )
+
+    async def readline( self ):
+        await asyncio.sleep( 0 )
+        return self.fp.readline()
+
+class ChunkReader:
+    def __init__( self, data, size = 7 ):
+        self.chunks = [ data[ i : i + size ] for i in range( 0, len( data ), size ) ]
+
+    async def read( self, _ ):
+        await asyncio.sleep( 0 )
+        return self.chunks.pop( 0 ) if self.chunks else b""
+
+class Writer:
+    def __init__( self ):
+        self.data, self.drains = [], 0
+
+    def write( self, data ):
+        self.data.append( data )
+
+    async def drain( self ):
+        self.drains += 1
+
+def stream_reader( data ):
+    async def create():
+        reader = asyncio.StreamReader()
+        reader.feed_data( data )
+        reader.feed_eof()
+        return reader
+    return create
+
+@pytest.fixture
+def contents( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        return fp.read()
+
+@pytest.mark.parametrize( "reader_type", [ "line", "chunk", "stream" ] )
+def test_aload( contents, reader_type ):
+    async def load():
+        if reader_type == "line":
+            reader = LineReader( contents )
+        elif reader_type == "chunk":
+            reader = ChunkReader( contents )
+        else:
+            reader = await stream_reader( contents )()
+        return await changelog.aload( reader )
+    assert asyncio.run( load() ) == changelog.load( BytesIO( contents ) )
+
+def test_incremental():
+    lines, read = [ b"## [1.0.1]\n", b"## [1.0.0]\n", b"## [0.0.1]\n" ], []
+
+    class Reader:
+        async def readline( self ):
+            read.append( lines.pop( 0 ) if lines else b"" )
+            return read[ -1 ]
+
+    async def load():
+        releases = changelog.aiter_load( Reader(), limit = 1 )
+        return [ str( release[ "version" ] ) async for release in releases ]
+    assert asyncio.run( load() ) == [ "1.0.1" ]
+    assert lines == [ b"## [0.0.1]\n" ]
+
+    async def load_none():
+        return [ release async for release in changelog.aiter_load( Reader(), limit = 0 ) ]
+    assert asyncio.run( load_none() ) == []
+    assert lines == [ b"## [0.0.1]\n" ]
+
+def test_no_trailing_newline():
+    reader = ChunkReader( b"## [1.0.0]\n### Added\n- A change", size = 4 )
+    assert asyncio.run( changelog.aload( reader ) )[ 0 ][ "added" ] == [ "A change" ]
+
+@pytest.mark.parametrize( ( "contents", "error_message" ), [
+    ( b"## [1.0.0]\n### Added\n- \xff\n", 'Unable to decode line using encoding, "utf-8" (at line 3)' ),
+    ( b"## [1.0.0]\nfoo\n", 'Unrecognized line pattern, "foo" (at line 2)' )
+] )
+def test_errors( contents, error_message ):
+    for reader in ( LineReader( contents ), ChunkReader( contents, size = 3 ) ):
+        with pytest.raises( changelog.ChangelogParsingError ) as error:
+            asyncio.run( changelog.aload( reader ) )
+        assert str( error.value ) == error_message
+
+def test_unreadable_type():
+    class Reader:
+        async def read( self, _ ):
+            return 1
+    with pytest.raises( changelog.ChangelogParsingError ) as error:
+        asyncio.run( changelog.aload( Reader() ) )
+    assert str( error.value ) == 'Parameter\'s "read" function call returned unreadable type, "int"'
+
+def test_adump( contents ):
+    changes, writer = changelog.load( BytesIO( contents ) ), Writer()
+    asyncio.run( changelog.adump( changes, writer ) )
+    assert b"".join( writer.data ) == contents
+    assert writer.drains == len( writer.data )
+
+def test_adump_text():
+    class Writer:
+        def __init__( self ):
+            self.data = []
+
+        async def write( self, data ):
+            self.data.append( data )
+
+    writer = Writer()
+    asyncio.run( changelog.adump( [ { "version": "Unreleased" } ], writer, encoding = None ) )
+    assert "".join( writer.data ) == changelog.dumps( [ { "version": "Unreleased" } ] )
+
+def test_adump_error():
+    with pytest.raises( ValueError ) as expected:
+        changelog.dumps( [ { "version": 5 } ] )
+    with pytest.raises( ValueError ) as error:
+        asyncio.run( changelog.adump( [ { "version": 5 } ], Writer() ) )
+    assert str( error.value ) == str( expected.value )
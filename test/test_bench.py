@@ -0,0 +1,32 @@
+import changelog
+import pytest
+from bench import generate
+from bench.__main__ import compare
+
+def test_generate():
+    assert generate( 50, seed = 1 ) == generate( 50, seed = 1 )
+    assert generate( 50, seed = 1 ) != generate( 50, seed = 2 )
+
+@pytest.mark.parametrize( "kwargs", [
+    {},
+    { "multiline": 1, "items": ( 3, 3 ) },
+    { "yanked": 1, "compare_urls": False, "unreleased": False }
+] )
+def test_round_trip( kwargs ):
+    text = generate( 200, **kwargs )
+    changes = changelog.loads( text )
+    assert len( changes ) == 200 + kwargs.get( "unreleased", True )
+    assert changelog.dumps( changes ) == text
+    assert all( ( "compare_url" in change ) == kwargs.get( "compare_urls", True ) for change in changes )
+    if kwargs.get( "yanked" ) == 1:
+        assert all( change[ "yanked" ] for change in changes )
+    if kwargs.get( "multiline" ) == 1:
+        assert all( "\n" in item for change in changes[ 1 : ] for key in ( "added", "fixed" ) if key in change
+                    for item in change[ key ] )
+
+def test_compare():
+    results = { "calibration": 1.0, "results": { "loads/10": { "seconds": 2.0 }, "dumps/10": { "seconds": 1.0 } } }
+    assert not compare( results, results, 0 )
+    # Timings from a baseline taken on a machine twice as fast
+    baseline = { "calibration": 0.5, "results": { "loads/10": { "seconds": 0.5 }, "dumps/10": { "seconds": 0.5 } } }
+    assert [ regression.split( ":" )[ 0 ] for regression in compare( results, baseline, 0.5 ) ] == [ "loads/10" ]
@@ -0,0 +1,71 @@
+import changelog
+import errno
+import os
+import pytest
+from io import ( BytesIO, StringIO )
+
+CONTENTS = "## [1.0.0] - 2023-01-01\n\n### Added\n\n- Thing\n"
+
+def test_hits_and_misses( project_example_changelog_path ):
+    cache = changelog.ParseCache()
+    expected = changelog.load_path( project_example_changelog_path )
+    assert cache.load_path( project_example_changelog_path ) == expected
+    with open( project_example_changelog_path, "rb" ) as fp:
+        assert cache.load( fp ) == expected
+    assert cache.info() == ( 1, 0, 1, 1, os.path.getsize( project_example_changelog_path ) )
+
+    assert cache.loads( CONTENTS ) == cache.load( StringIO( CONTENTS ) ) == changelog.loads( CONTENTS )
+    assert cache.info()[ : 3 ] == ( 2, 0, 2 )
+    cache.clear()
+    assert cache.info() == ( 0, 0, 0, 0, 0 )
+
+def test_independent_copies():
+    cache = changelog.ParseCache()
+    changes = cache.loads( CONTENTS )
+    changes[ 0 ][ "added" ].append( "Other" )
+    changes.append( {} )
+    assert cache.loads( CONTENTS ) == changelog.loads( CONTENTS )
+
+@pytest.mark.parametrize( "limits", [ { "max_entries": 2 }, { "max_size": 2 * len( CONTENTS ) + 2 } ] )
+def test_eviction( limits ):
+    cache = changelog.ParseCache( **limits )
+    for contents in ( CONTENTS, CONTENTS + "\n", CONTENTS, CONTENTS + "\n\n", CONTENTS ):
+        cache.loads( contents )
+    assert cache.info()[ : 4 ] == ( 2, 0, 3, 2 )
+    cache.loads( CONTENTS + "\n" )
+    assert cache.info()[ : 3 ] == ( 2, 0, 4 )
+
+def test_directory( tmp_path ):
+    cache = changelog.ParseCache( directory = tmp_path, max_directory_entries = 2 )
+    for contents in ( CONTENTS, CONTENTS + "\n", CONTENTS + "\n\n" ):
+        cache.load_bytes( contents.encode() )
+    assert len( list( tmp_path.glob( "*.pickle" ) ) ) == 2
+    assert not list( tmp_path.glob( "*.tmp" ) )
+
+    other = changelog.ParseCache( directory = tmp_path )
+    assert other.load( BytesIO( ( CONTENTS + "\n\n" ).encode() ) ) == changelog.loads( CONTENTS )
+    assert other.info()[ : 3 ] == ( 1, 1, 0 )
+
+    for path in tmp_path.glob( "*.pickle" ):
+        path.write_bytes( b"corrupt" )
+    assert other.load_bytes( CONTENTS.encode() + b"\n" ) == changelog.loads( CONTENTS )
+    assert other.info()[ : 3 ] == ( 1, 1, 1 )
+
+def test_errors_not_cached():
+    cache = changelog.ParseCache()
+    for _ in range( 2 ):
+        with pytest.raises( changelog.ChangelogParsingError ):
+            cache.loads( "## [asdf]" )
+    assert cache.info()[ : 4 ] == ( 0, 0, 0, 0 )
+
+@pytest.mark.parametrize( "target", [ "pickle.dump", "tempfile.mkstemp", "os.replace", "os.scandir" ] )
+def test_directory_write_errors( tmp_path, monkeypatch, target ):
+    def fail( *args, **kwargs ):
+        raise OSError( errno.ENOSPC, "No space left on device" )
+    cache = changelog.ParseCache( directory = tmp_path, max_directory_entries = 2 )
+    monkeypatch.setattr( "changelog._cache." + target, fail )
+    assert cache.loads( CONTENTS ) == changelog.loads( CONTENTS )
+    assert cache.loads( CONTENTS ) == changelog.loads( CONTENTS )
+    assert cache.info()[ : 4 ] == ( 1, 0, 1, 1 )
+    monkeypatch.undo()
+    assert not list( tmp_path.glob( "*.tmp" ) )
@@ -0,0 +1,43 @@
+import changelog
+import pickle
+import pytest
+import semver
+
+@pytest.fixture
+def changes( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        return changelog.load( fp )
+
+def test_list_compatible( changes ):
+    assert isinstance( changes, list )
+    assert isinstance( changes, changelog.Changelog )
+    assert changes == list( changes )
+    assert pickle.loads( pickle.dumps( changes ) ) == changes
+
+@pytest.mark.parametrize( "version", [ "1.0.0", semver.Version( 1, 0, 0 ) ] )
+def test_get( changes, version ):
+    assert changes.get( version ) is changes[ 3 ]
+    assert changes.get( "unreleased" ) is changes[ 0 ]
+    assert changes.get( "9.9.9" ) is None
+
+def test_get_after_modification( changes ):
+    assert changes.get( "9.9.9" ) is None
+    changes.insert( 0, { "version": semver.Version( 9, 9, 9 ), "date": None, "yanked": False } )
+    assert changes.get( "9.9.9" ) is changes[ 0 ]
+    del changes[ 0 ]
+    assert changes.get( "9.9.9" ) is None
+
+def test_latest( changes ):
+    assert changes.latest()[ "version" ] == "Unreleased"
+    assert changes.latest_released()[ "version" ] == semver.Version( 1, 1, 1 )
+    assert changelog.Changelog().latest() is None
+    assert changelog.Changelog().latest_released() is None
+
+def test_between( changes ):
+    assert [ change[ "version" ] for change in changes.between( "0.3.0", semver.Version( 1, 0, 0 ) ) ] == [
+        semver.Version( 1, 0, 0 ), semver.Version( 0, 3, 0 )
+    ]
+    assert len( changes.between( upper = "0.0.9" ) ) == 8
+    assert len( changes.between() ) == len( changes ) - 1
+    with pytest.raises( ValueError ):
+        changes.between( "Unreleased" )
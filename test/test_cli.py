@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+import shutil
+import subprocess
+import changelog
+from changelog.cli import main
+import pytest
+
+VALID = "# Custom header\n\n## [1.0.0] - 2020-01-01\n\n### Added\n\n- A change\n"
+UNFORMATTED = "# Custom header\n## [1.0.0] - 2020-01-01\n### Added\n* A change\n"
+INVALID = "## [1.0] - 2020-01-01\n### Nope\n"
+
+@pytest.fixture
+def files( tmp_path, project_example_changelog_path ):
+    for name, contents in ( ( "valid", VALID ), ( "unformatted", UNFORMATTED ), ( "invalid", INVALID ) ):
+        ( tmp_path / name ).mkdir()
+        ( tmp_path / name / "CHANGELOG.md" ).write_text( contents )
+    ( tmp_path / "example" ).mkdir()
+    shutil.copy( project_example_changelog_path, tmp_path / "example" / "CHANGELOG.md" )
+    return tmp_path
+
+@pytest.mark.parametrize( "jobs", [ "1", "2" ] )
+def test_validate( files, capsys, jobs ):
+    assert main( [ "validate", "-j", jobs, str( files / "example" / "*.md" ), str( files / "valid" / "*.md" ) ] ) == 0
+    assert capsys.readouterr().out == ""
+
+    assert main( [ "validate", "-j", jobs, str( files / "**" / "CHANGELOG.md" ) ] ) == 1
+    path = files / "invalid" / "CHANGELOG.md"
+    assert capsys.readouterr().out == (
+        f'{ path }:1:5: Failed parsing semver version, "1.0" [invalid-version]\n'
+        f'{ path }:2:5: Invalid change type, "Nope" [invalid-section]\n'
+    )
+
+def test_validate_formats( files, capsys ):
+    path = str( files / "invalid" / "CHANGELOG.md" )
+    assert main( [ "validate", "--format", "json", "--max-errors", "1", path ] ) == 1
+    assert json.loads( capsys.readouterr().out ) == [
+        { "path": path, "line": 1, "column": 5, "rule": "invalid-version", "message": 'Failed parsing semver version, "1.0"' }
+    ]
+    assert main( [ "validate", "--format", "sarif", path ] ) == 1
+    sarif = json.loads( capsys.readouterr().out )
+    assert [ result[ "ruleId" ] for result in sarif[ "runs" ][ 0 ][ "results" ] ] == [ "invalid-version", "invalid-section" ]
+
+def test_missing_file( tmp_path, capsys ):
+    path = str( tmp_path / "missing.md" )
+    assert main( [ "validate", path, str( tmp_path / "*.md" ) ] ) == 1
+    errors = capsys.readouterr().err.splitlines()
+    assert len( errors ) == 2 and all( "No such file or directory" in error for error in errors )
+
+def test_format( files, capsys ):
+    unformatted = files / "unformatted" / "CHANGELOG.md"
+    assert main( [ "format", "--check", str( files / "valid" / "CHANGELOG.md" ) ] ) == 0
+    assert main( [ "format", "--check", str( files / "*" / "CHANGELOG.md" ) ] ) == 1
+    assert capsys.readouterr().out == f'would reformat { unformatted }\n'
+    assert unformatted.read_text() == UNFORMATTED
+
+    assert main( [ "format", "-j", "2", str( files / "valid" / "*.md" ), str( unformatted ) ] ) == 0
+    assert capsys.readouterr().out == f'reformatted { unformatted }\n'
+    assert unformatted.read_text() == VALID
+    assert main( [ "format", "--check", str( unformatted ) ] ) == 0
+
+def test_latest( files, capsys ):
+    path = str( files / "example" / "CHANGELOG.md" )
+    assert main( [ "latest", path ] ) == 0
+    assert capsys.readouterr().out == "## [Unreleased]\n"
+    assert main( [ "latest", "--released", path ] ) == 0
+    notes = capsys.readouterr().out
+    assert notes.startswith( "## [1.1.1] - 2023-03-05\n\n### Added\n\n- Arabic translation (#444).\n" )
+    assert "[1.1.1]:" not in notes and "## [1.1.0]" not in notes
+
+    assert main( [ "latest", str( files / "valid" / "CHANGELOG.md" ), str( files / "unformatted" / "CHANGELOG.md" ) ] ) == 0
+    assert capsys.readouterr().out == (
+        f'==> { files / "valid" / "CHANGELOG.md" } <==\n## [1.0.0] - 2020-01-01\n\n### Added\n\n- A change\n'
+        f'\n==> { files / "unformatted" / "CHANGELOG.md" } <==\n## [1.0.0] - 2020-01-01\n\n### Added\n\n- A change\n'
+    )
+
+def test_json( files, capsys ):
+    path = str( files / "valid" / "CHANGELOG.md" )
+    assert main( [ "json", path ] ) == 0
+    assert json.loads( capsys.readouterr().out ) == [
+        { "version": "1.0.0", "date": "2020-01-01", "yanked": False, "added": [ "A change" ] }
+    ]
+    assert main( [ "json", "-j", "0", str( files / "*" / "CHANGELOG.md" ) ] ) == 1
+    exported = json.loads( capsys.readouterr().out )
+    assert sorted( exported ) == [ str( files / name / "CHANGELOG.md" ) for name in ( "example", "unformatted", "valid" ) ]
+    assert len( exported[ str( files / "example" / "CHANGELOG.md" ) ] ) == 15
+
+def test_invalid_arguments( capsys ):
+    with pytest.raises( SystemExit ) as exit:
+        main( [ "validate", "--jobs", "-1", "CHANGELOG.md" ] )
+    assert exit.value.code == 2
+
+def test_module():
+    result = subprocess.run( [ sys.executable, "-m", "changelog", "--version" ], capture_output = True, text = True )
+    assert result.returncode == 0
+    assert result.stdout == f'changelog { changelog.__version__ }\n'
+
+def test_import_budget():
+    # Importing the package (or the command) only imports what loading and dumping a file needs; the rest (eg. the
+    # submodules, json, and the process pool) is imported when first used
+    def modules( statement ):
+        code = f'import sys; { statement }; print( "\\n".join( sys.modules ) )'
+        result = subprocess.run( [ sys.executable, "-c", code ], capture_output = True, text = True, check = True )
+        return set( result.stdout.split() )
+    lazy = {
+        "glob", "json", "concurrent.futures", "multiprocessing", "tempfile", "shutil", "asyncio", "hashlib",
+        "pickle", "tarfile", "difflib", "array"
+    }
+    eager = { "changelog._entry", "changelog._intern", "changelog._releases" }
+    for statement, submodules in ( ( "import changelog", eager ), ( "import changelog.cli", eager | { "changelog.cli" } ) ):
+        imported = modules( statement )
+        assert { module for module in imported if module.startswith( "changelog." ) } == submodules
+        assert not lazy & imported
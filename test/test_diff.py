@@ -0,0 +1,135 @@
+from io import ( BytesIO, StringIO )
+from datetime import date
+from semver import Version
+import changelog
+import pytest
+
+OLD = """# Changelog
+
+## [Unreleased]
+### Added
+- A feature
+
+## [1.0.0] - 2020-01-01
+### Fixed
+- A fix
+- Another fix
+
+## [0.9.0] - 2019-01-01
+### Added
+- The first feature
+
+[Unreleased]: https://example.com/compare/v1.0.0...HEAD
+[1.0.0]: https://example.com/compare/v0.9.0...v1.0.0
+[0.9.0]: https://example.com/releases/v0.9.0
+"""
+
+NEW = """# Changelog
+
+## [Unreleased]
+
+## [1.1.0] - 2021-01-01
+### Added
+- A feature
+
+## [1.0.0] - 2020-01-01 [YANKED]
+### Fixed
+- A fix
+- Another fix
+
+## [0.9.0] - 2019-01-01
+### Added
+- The first feature
+
+[Unreleased]: https://example.com/compare/v1.1.0...HEAD
+[1.1.0]: https://example.com/compare/v1.0.0...v1.1.0
+[1.0.0]: https://example.com/compare/v0.9.0...v1.0.0
+[0.9.0]: https://example.com/releases/0.9.0
+"""
+
+@pytest.mark.parametrize( "convert", [
+    lambda s : s,
+    lambda s : s.encode(),
+    lambda s : BytesIO( s.encode() ),
+    lambda s : StringIO( s ),
+    changelog.loads,
+    lambda s : changelog.loads( s, compact = True )
+] )
+def test_diff( convert ):
+    changes = changelog.diff( convert( OLD ), convert( NEW ) )
+    assert changes
+    assert changes.added == [ Version( 1, 1, 0 ) ]
+    assert changes.removed == []
+    assert not changes.history_rewritten
+    unreleased, yanked, renamed = changes.changed
+    assert unreleased.version == "Unreleased"
+    assert unreleased.sections == { "added": ( [], [ ( 0, "A feature" ) ] ) }
+    assert unreleased.compare_url == (
+        "https://example.com/compare/v1.0.0...HEAD", "https://example.com/compare/v1.1.0...HEAD"
+    )
+    assert ( yanked.version, yanked.sections, yanked.yanked, yanked.compare_url ) == (
+        Version( 1, 0, 0 ), {}, ( False, True ), None
+    )
+    assert ( renamed.version, renamed.sections, renamed.yanked, renamed.compare_url ) == (
+        Version( 0, 9, 0 ), {}, None,
+        ( "https://example.com/releases/v0.9.0", "https://example.com/releases/0.9.0" )
+    )
+
+def test_unchanged( project_example_changelog_path ):
+    with open( project_example_changelog_path, 'rb' ) as fp:
+        data = fp.read()
+    for old, new in ( ( data, bytearray( data ) ), ( data, changelog.load_bytes( data ) ) ):
+        changes = changelog.diff( old, new )
+        assert not changes
+        assert changes == ( [], [], [], False )
+
+def test_history_rewritten():
+    edited = NEW.replace( "- Another fix", "- Another fix, reworded" ).replace( "2019-01-01", "2019-01-02" )
+    for old, new in ( ( OLD, edited ), ( changelog.loads( OLD ), changelog.loads( edited ) ) ):
+        changes = changelog.diff( old, new )
+        assert changes.history_rewritten
+        assert changes.changed[ 1 ].sections == {
+            "fixed": ( [ ( 1, "Another fix, reworded" ) ], [ ( 1, "Another fix" ) ] )
+        }
+        assert changes.changed[ 2 ].date == ( date( 2019, 1, 1 ), date( 2019, 1, 2 ) )
+
+        # Stopping at the first rewrite (of 1.0.0) skips the rest
+        changes = changelog.diff( old, new, stop_on_rewrite = True )
+        assert changes.history_rewritten
+        assert [ change.version for change in changes.changed ] == [ "Unreleased", Version( 1, 0, 0 ) ]
+        assert changes.added == []
+
+    removed = changelog.diff( OLD, NEW.replace( "## [0.9.0]", "## [0.8.0]" ) )
+    assert removed.added == [ Version( 1, 1, 0 ), Version( 0, 8, 0 ) ]
+    assert removed.removed == [ Version( 0, 9, 0 ) ]
+    assert removed.history_rewritten
+
+def test_changed_blocks_only_parsed():
+    # Unchanged blocks aren't parsed, but changed ones report errors on the lines of the whole file
+    invalid = OLD.replace( "## [0.9.0] - 2019-01-01", "## [0.9.0] - 2019-13-01" )
+    assert not changelog.diff( invalid, invalid + "\n" )
+    with pytest.raises( changelog.ChangelogParsingError ) as e:
+        changelog.diff( OLD, invalid )
+    assert ( e.value.rule, e.value.line_number ) == ( 'invalid-date', 12 )
+
+def test_encodings():
+    old, new = OLD.replace( "A fix", "Ä fix" ), NEW.replace( "A fix", "Ä fix" )
+    changes = changelog.diff( old.encode( 'utf-16' ), new.encode( 'utf-16' ), 'utf-16' )
+    assert changes == changelog.diff( old, new )
+    assert changes == changelog.diff( BytesIO( old.encode( 'latin-1' ) ), new, 'latin-1' )
+
+REPEATED = "## [1.1.0]\n### Added\n- A\n\n## [1.0.0]\n### Added\n- B\n"
+
+@pytest.mark.parametrize( "old, new", [
+    ( "## [1.0.0] - 2020-01-02\n\n## [1.1.0]\n",
+      "## [1.0.0] - 2020-01-02\n\n## [1.1.0]\n\n## [1.0.0] - 2020-01-01\n" ),
+    ( "## [1.0.0] - 2020-01-02\n\n## [1.0.0+b]\n", "## [1.0.0+b]\n\n## [1.0.0] - 2020-01-02\n" ),
+    ( REPEATED, REPEATED + "\n## [1.1.0]\n### Added\n- C\n" )
+] )
+def test_repeated_versions( old, new ):
+    # Releases of a repeated version are compared as they are when parsed (by the first of each version)
+    for first, second in ( ( old, new ), ( new, old ) ):
+        for stop in ( False, True ):
+            parsed = changelog.loads( first ), changelog.loads( second )
+            assert changelog.diff( first, second, stop_on_rewrite = stop ) == \
+                changelog.diff( *parsed, stop_on_rewrite = stop )
@@ -0,0 +1,97 @@
+import io
+import mmap
+import tarfile
+from semver import Version
+import changelog
+import pytest
+
+GOOD = "# Changelog\n\n## [1.0.0] - 2020-01-01\n### Added\n- A feature\n"
+BAD = "# Changelog\n\n## [Unreleased]\n\nasdf\n"
+OTHER = "## [0.1.0]\n### Fixed\n- Ä fix\n"
+
+def check_results( results ):
+    assert [ doc_id for doc_id, _ in results ] == [ 0, 1, 2 ]
+    assert results[ 0 ][ 1 ] == changelog.loads( GOOD )
+    assert isinstance( results[ 1 ][ 1 ], changelog.ChangelogParsingError )
+    assert results[ 1 ][ 1 ].line_number == 5    # counted in the document
+    assert results[ 2 ][ 1 ][ 0 ][ "fixed" ] == [ "Ä fix" ]
+
+@pytest.mark.parametrize( "convert", [
+    lambda s : s,
+    lambda s : s.encode(),
+    lambda s : memoryview( s.encode() ),
+    lambda s : io.BytesIO( s.encode() ),
+    lambda s : io.StringIO( s )
+] )
+def test_delimiter( convert ):
+    data = convert( "\x1e".join( [ GOOD, BAD, OTHER ] ) + "\x1e" )
+    check_results( list( changelog.load_documents( data, delimiter = "\x1e" ) ) )
+
+def test_delimiter_across_chunks( monkeypatch ):
+    monkeypatch.setattr( "changelog._documents._READ_SIZE", 7 )
+    data = "\n---8<---\n".join( [ GOOD, BAD, OTHER ] )
+    sources = ( ( io.StringIO( data ), "\n---8<---\n" ), ( io.BytesIO( data.encode() ), b"\n---8<---\n" ) )
+    for source, delimiter in sources:
+        check_results( list( changelog.load_documents( source, delimiter = delimiter ) ) )
+
+def framed( *documents ):
+    return b"".join( len( document ).to_bytes( 4, 'big' ) + document for document in documents )
+
+def test_length_prefix( tmp_path ):
+    data = framed( GOOD.encode(), BAD.encode(), OTHER.encode() )
+    check_results( list( changelog.load_documents( data, length_prefix = 4 ) ) )
+    check_results( list( changelog.load_documents( io.BytesIO( data ), length_prefix = 4 ) ) )
+
+    # Views of a memory mapped file are released as each document is parsed
+    ( path := tmp_path / "bundle" ).write_bytes( data )
+    with open( path, 'rb' ) as fp, mmap.mmap( fp.fileno(), 0, access = mmap.ACCESS_READ ) as buf:
+        results = changelog.load_documents( buf, length_prefix = 4 )
+        assert next( results )[ 1 ] == changelog.loads( GOOD )
+
+    # A decode error is on the line of the document that holds it
+    data = framed( b"", b"# Changelog\n\n## [1.0.0]\n\xff\n" )
+    results = list( changelog.load_documents( data, length_prefix = 4 ) )
+    assert results[ 0 ] == ( 0, [] )
+    assert ( results[ 1 ][ 1 ].rule, results[ 1 ][ 1 ].line_number ) == ( 'decode-error', 4 )
+
+    # Documents before a truncated one (or truncated length) are still yielded
+    data = framed( GOOD.encode(), BAD.encode(), OTHER.encode() )
+    for truncated, count in ( ( data[ : -1 ], 2 ), ( data + b"\x00\x00", 3 ) ):
+        for source in ( truncated, io.BytesIO( truncated ) ):
+            results = changelog.load_documents( source, length_prefix = 4 )
+            assert [ next( results )[ 0 ] for _ in range( count ) ] == list( range( count ) )
+            with pytest.raises( ValueError ):
+                next( results )
+
+def test_tarfile():
+    stream = io.BytesIO()
+    with tarfile.open( fileobj = stream, mode = 'w:gz' ) as tar:
+        for name, text in ( ( "good/CHANGELOG.md", GOOD ), ( "bad/CHANGELOG.md", BAD ), ( "README.md", "" ) ):
+            ( info := tarfile.TarInfo( name ) ).size = len( text.encode() )
+            tar.addfile( info, io.BytesIO( text.encode() ) )
+    stream.seek( 0 )
+    with tarfile.open( fileobj = stream, mode = 'r|gz' ) as tar:
+        results = list( changelog.load_documents( tar, select = lambda name : name.endswith( ".md" ) ) )
+    assert [ doc_id for doc_id, _ in results ] == [ "good/CHANGELOG.md", "bad/CHANGELOG.md", "README.md" ]
+    assert results[ 0 ][ 1 ][ 0 ][ "version" ] == Version( 1, 0, 0 )
+    assert results[ 1 ][ 1 ].line_number == 5
+    assert results[ 2 ][ 1 ] == []
+
+    stream.seek( 0 )
+    with tarfile.open( fileobj = stream ) as tar:
+        results = changelog.load_documents( tar, select = lambda name : name.startswith( "bad/" ) )
+        assert [ doc_id for doc_id, _ in results ] == [ "bad/CHANGELOG.md" ]
+
+def test_arguments():
+    invalid = ( {}, { "delimiter": "-", "length_prefix": 4 }, { "delimiter": "" }, { "length_prefix": -1 } )
+    for kwargs in invalid:
+        with pytest.raises( ValueError ):
+            next( changelog.load_documents( GOOD.encode(), **kwargs ) )
+    with pytest.raises( ValueError ):
+        next( changelog.load_documents( GOOD, length_prefix = 4 ) )
+    for source in ( GOOD, io.StringIO( GOOD ), GOOD.encode(), io.BytesIO( GOOD.encode() ) ):
+        with pytest.raises( ValueError ):
+            next( changelog.load_documents( source, delimiter = 0 ) )
+    for source in ( GOOD, io.StringIO( GOOD ) ):
+        with pytest.raises( ValueError, match = "must be a string" ):
+            next( changelog.load_documents( source, delimiter = b"\x1e" ) )
@@ -0,0 +1,64 @@
+import os
+from io import ( BytesIO, StringIO )
+import changelog
+import pytest
+import semver
+
+def test_stream( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        expected = fp.read()
+    with open( project_example_changelog_path, "rb" ) as fp:
+        changes = changelog.iter_load( fp )
+        stream = BytesIO()
+        changelog.dump( changes, stream )
+    assert stream.getvalue() == expected
+
+def test_large():
+    changes = [
+        { "version": semver.Version( 1, 0, i ), "added": [ "A change" ] * 4, "compare_url": f"https://example.com/{ i }" }
+        for i in range( 2000, 0, -1 )
+    ]
+    stream = StringIO()
+    changelog.dump( iter( changes ), stream )
+    assert stream.getvalue() == changelog.dumps( changes )
+    assert changelog.loads( stream.getvalue() ) == [ { "date": None, "yanked": False, **i } for i in changes ]
+
+@pytest.mark.parametrize( ( "change", "expected" ), [
+    ( "", "-\n" ),
+    ( "   ", "-  \n" ),
+    ( "One\n\ntwo", "- One\n\n  two\n" ),
+    ( " \nOne", "-\n  One\n" ),
+    ( "One\rtwo", "- One\r  two\n" )
+] )
+def test_changes( change, expected ):
+    assert changelog.dumps( [ { "version": "Unreleased", "added": [ change ] } ], header = "" ).endswith(
+        "### Added\n\n" + expected
+    )
+
+def test_no_output( capsys ):
+    stream, changes = StringIO(), [ { "version": "Unreleased", "yanked": True } ]
+    changelog.dump( changes, stream )
+    assert stream.getvalue().endswith( "\n## [Unreleased] [YANKED]\n" )
+    assert changelog.dumps( changes ) == stream.getvalue()
+    assert capsys.readouterr().out == ""
+
+def test_dump_path( tmp_path, project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        expected = fp.read()
+        changes = changelog.loads( expected.decode() )
+    path = tmp_path / "CHANGELOG.md"
+    changelog.dump_path( changes, path )
+    assert path.read_bytes() == expected
+    assert os.listdir( tmp_path ) == [ "CHANGELOG.md" ]
+
+    os.chmod( path, 0o600 )
+    changelog.dump_path( changes[ : 1 ], path )
+    assert path.read_bytes() == changelog.dumps( changes[ : 1 ] ).encode()
+    assert os.stat( path ).st_mode & 0o777 == 0o600
+
+def test_dump_path_error( tmp_path ):
+    ( path := tmp_path / "CHANGELOG.md" ).write_text( "Unchanged" )
+    with pytest.raises( ValueError ):
+        changelog.dump_path( [ { "version": "Unreleased" }, { "version": 5 } ], path )
+    assert path.read_text() == "Unchanged"
+    assert os.listdir( tmp_path ) == [ "CHANGELOG.md" ]
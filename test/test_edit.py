@@ -0,0 +1,119 @@
+from datetime import date
+from semver import Version
+import changelog
+import pytest
+
+CHANGELOG = """# Changelog
+
+Kept  as it's written.
+
+## [Unreleased]
+### Added
+* A feature
+
+## [1.0.0] - 2020-01-01
+### Fixed
+- A fix
+
+[Unreleased]: https://example.com/compare/v1.0.0...HEAD
+[1.0.0]: https://example.com/releases/v1.0.0
+"""
+
+@pytest.fixture
+def path( tmp_path ):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text( CHANGELOG )
+    return path
+
+def test_promote_unreleased( path ):
+    changelog.promote_unreleased( path, "1.1.0", "2021-02-03" )
+    assert path.read_text() == CHANGELOG.replace(
+        "## [Unreleased]\n", "## [Unreleased]\n\n## [1.1.0] - 2021-02-03\n"
+    ).replace(
+        "[Unreleased]: https://example.com/compare/v1.0.0...HEAD\n",
+        "[Unreleased]: https://example.com/compare/v1.1.0...HEAD\n"
+        "[1.1.0]: https://example.com/compare/v1.0.0...v1.1.0\n"
+    )
+    changes = changelog.load_path( path )
+    assert changes.get( "1.1.0" )[ "added" ] == [ "A feature" ]
+    assert changes.get( "Unreleased" ) == {
+        "version": "Unreleased", "date": None, "yanked": False,
+        "compare_url": "https://example.com/compare/v1.1.0...HEAD"
+    }
+
+    with pytest.raises( ValueError ):
+        changelog.promote_unreleased( path, "1.0.1" )   # not newer than 1.1.0
+    path.write_text( CHANGELOG.replace( "## [Unreleased]\n### Added\n* A feature\n\n", "" ) )
+    with pytest.raises( ValueError ):
+        changelog.promote_unreleased( path, "1.1.0" )
+
+def test_prepend_release( path ):
+    changelog.prepend_release( path, {
+        "version": Version( 1, 1, 0 ), "date": date( 2021, 2, 3 ), "fixed": [ "Another fix" ],
+        "compare_url": "https://example.com/compare/v1.0.0...v1.1.0"
+    } )
+    assert path.read_text() == CHANGELOG.replace(
+        "## [1.0.0]", "## [1.1.0] - 2021-02-03\n\n### Fixed\n\n- Another fix\n\n## [1.0.0]"
+    ).replace(
+        "[1.0.0]: https://", "[1.1.0]: https://example.com/compare/v1.0.0...v1.1.0\n[1.0.0]: https://"
+    )
+    assert [ change[ "version" ] for change in changelog.load_path( path ) ] == [
+        "Unreleased", Version( 1, 1, 0 ), Version( 1, 0, 0 )
+    ]
+    with pytest.raises( ValueError ):
+        changelog.prepend_release( path, { "version": Version( 1, 0, 1 ) } )
+    with pytest.raises( ValueError ):
+        changelog.prepend_release( path, { "version": "Unreleased" } )
+    with pytest.raises( ValueError ):
+        changelog.prepend_release( path, { "version": "1.2" } )
+
+    # Versions can be given as strings, like the other edits take them
+    url = "https://example.com/compare/v1.1.0...v1.2.0"
+    changelog.prepend_release( path, { "version": "1.2.0", "compare_url": url } )
+    assert changelog.load_path( path )[ 1 ] == {
+        "version": Version( 1, 2, 0 ), "date": None, "yanked": False, "compare_url": url
+    }
+
+def test_prepend_to_empty( tmp_path ):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text( "# Changelog" )
+    changelog.prepend_release( path, { "version": Version( 0, 1, 0 ), "compare_url": "https://example.com" } )
+    changelog.prepend_release( path, { "version": "unreleased", "added": [ "A feature" ] } )
+    assert changelog.load_path( path ) == [
+        { "version": "Unreleased", "date": None, "yanked": False, "added": [ "A feature" ] },
+        { "version": Version( 0, 1, 0 ), "date": None, "yanked": False, "compare_url": "https://example.com" }
+    ]
+
+def test_mark_yanked( path ):
+    changelog.mark_yanked( path, Version( 1, 0, 0 ) )
+    assert path.read_text() == CHANGELOG.replace( "2020-01-01", "2020-01-01 [YANKED]" )
+    assert changelog.load_path( path ).get( "1.0.0" )[ "yanked" ]
+    changelog.mark_yanked( path, "1.0.0", False )
+    assert path.read_text() == CHANGELOG
+    with pytest.raises( ValueError ):
+        changelog.mark_yanked( path, "2.0.0" )
+    with pytest.raises( ValueError ):
+        changelog.mark_yanked( path, "Unreleased" )
+
+def test_set_compare_url( path ):
+    changelog.set_compare_url( path, "1.0.0", "https://example.com/compare/v0.9.0...v1.0.0" )
+    url = changelog.load_path( path ).get( "1.0.0" )[ "compare_url" ]
+    assert url == "https://example.com/compare/v0.9.0...v1.0.0"
+    changelog.set_compare_url( path, "unreleased", None )
+    assert path.read_text() == CHANGELOG.replace(
+        "[Unreleased]: https://example.com/compare/v1.0.0...HEAD\n", ""
+    ).replace( "/releases/v1.0.0", "/compare/v0.9.0...v1.0.0" )
+    changelog.set_compare_url( path, "Unreleased", "https://example.com/compare/v1.0.0...HEAD" )
+    assert path.read_text() == CHANGELOG.replace( "/releases/v1.0.0", "/compare/v0.9.0...v1.0.0" )
+
+    with pytest.raises( ValueError ):
+        changelog.set_compare_url( path, "1.0.0", "example.com" )
+    with pytest.raises( ValueError ):
+        changelog.set_compare_url( path, "2.0.0", "https://example.com" )
+
+def test_set_compare_url_without_footer( tmp_path ):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text( "# Changelog\n\n## [1.0.0]\n### Added\n- Changes are kept on one line" )
+    changelog.set_compare_url( path, "1.0.0", "https://example.com" )
+    assert path.read_text().endswith( "- Changes are kept on one line\n\n[1.0.0]: https://example.com\n" )
+    assert changelog.load_path( path )[ 0 ][ "compare_url" ] == "https://example.com"
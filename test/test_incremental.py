@@ -0,0 +1,80 @@
+import changelog
+import random
+import pytest
+
+def parse_result( text ):
+    try:
+        return changelog.loads( text )
+    except changelog.ChangelogParsingError as e:
+        return str( e )
+
+@pytest.fixture
+def text( project_example_changelog_path ):
+    with open( project_example_changelog_path, "r" ) as fp:
+        return fp.read()
+
+def test_span( text ):
+    document = changelog.ChangelogDocument( text )
+    assert document.changes == changelog.loads( text )
+    assert document.text == text
+    assert document.span( 0 ) == ( 7, 9 )
+    assert document.span( -1 )[ 1 ] == text.splitlines().index( "[unreleased]: " + document.changes[ 0 ][ "compare_url" ] )
+
+def test_reuses_untouched_releases( text ):
+    document = changelog.ChangelogDocument( text )
+    before = list( document.changes )
+    changes = document.update( text.replace( "## [Unreleased]\n", "## [Unreleased]\n\n### Added\n\n- New\n" ) )
+    assert changes is document.changes
+    assert changes[ 0 ][ "added" ] == [ "New" ]
+    assert changes[ 0 ][ "compare_url" ] == before[ 0 ][ "compare_url" ]
+    assert changes[ 0 ] is not before[ 0 ]
+    assert all( new is old for new, old in zip( changes[ 1 : ], before[ 1 : ] ) )
+
+def test_error_line_numbers( text ):
+    document = changelog.ChangelogDocument( text )
+    lines = text.splitlines( keepends = True )
+    with pytest.raises( changelog.ChangelogParsingError, match = r'"asdf" \(at line 200\)$' ):
+        document.edit( 199, 199, "asdf\n" )
+    assert document.text == text
+    with pytest.raises( changelog.ChangelogParsingError, match = r'version, "1.1.0" \(at line 216, column 2\)$' ):
+        document.update( "".join( lines[ : 51 ] + lines[ 64 : ] ) )
+    assert document.changes == changelog.loads( text )
+    with pytest.raises( ValueError ):
+        document.edit( 2, 1, "" )
+
+def test_releases_to_and_from_none():
+    # Compare URLs before the first release are ignored, so removing (or adding) the only release changes them
+    document = changelog.ChangelogDocument( "# T\n\n## [1.0.0]\n\n[1.0.0]: https://x/1\n" )
+    assert document.edit( 2, 3, "" ) == changelog.loads( "# T\n\n\n[1.0.0]: https://x/1\n" ) == []
+    assert document.edit( 2, 2, "## [1.0.0]\n" )[ 0 ][ "compare_url" ] == "https://x/1"
+
+    document = changelog.ChangelogDocument( "# T\n\n[1.0.0]: https://x/1\n\n## [2.0.0]\n" )
+    expected = parse_result( "# T\n## [1.0.0]\n\n[1.0.0]: https://x/1\n\n## [2.0.0]\n" )
+    assert expected.startswith( "After compare URL definitions have started" )
+    with pytest.raises( changelog.ChangelogParsingError ) as e:
+        document.edit( 1, 1, "## [1.0.0]\n" )
+    assert str( e.value ) == expected
+    assert document.changes == changelog.loads( document.text )
+
+def test_random_edits( text ):
+    rng, document = random.Random( 1 ), changelog.ChangelogDocument( text )
+    snippets = [
+        "", "\n", "- Change\n", "  more\n", "### Fixed\n", "### Added\n\n- A\n", "## [Unreleased]\n",
+        "## [9.9.9] - 2023-01-01\n", "## [0.0.1]\n", "[9.9.9]: https://example.com\n", "asdf\n", "## [1.0.0]\n"
+    ]
+    for _ in range( 300 ):
+        lines = document.text.splitlines( keepends = True )
+        start = rng.randrange( len( lines ) + 1 )
+        end = min( len( lines ), start + rng.choice( ( 0, 0, 1, 1, 2, 5 ) ) )
+        new_text = "".join( lines[ : start ] + rng.sample( snippets, rng.randrange( 3 ) ) + lines[ end : ] )
+        expected = parse_result( new_text )
+        try:
+            assert document.update( new_text ) == expected
+            assert document.text == new_text
+        except changelog.ChangelogParsingError as e:
+            assert str( e ) == expected
+            assert document.text == "".join( lines )
+        assert document.changes == changelog.loads( document.text )
+        assert [ document.span( i ) for i in range( len( document.changes ) ) ] == [
+            changelog.ChangelogDocument( document.text ).span( i ) for i in range( len( document.changes ) )
+        ]
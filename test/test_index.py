@@ -0,0 +1,114 @@
+import os
+import json
+import shutil
+import changelog
+import changelog._index
+import pytest
+
+@pytest.fixture
+def example( tmp_path, project_example_changelog_path ):
+    path = tmp_path / "CHANGELOG.md"
+    shutil.copy( project_example_changelog_path, path )
+    return path
+
+def test_entries( example ):
+    changes = changelog.load_path( example )
+    index = changelog.ReleaseIndex( example )
+    assert [ entry.version for entry in index.entries ] == [ str( change[ "version" ] ) for change in changes ]
+    assert [ entry.date for entry in index.entries ] == [
+        None if change[ "date" ] is None else change[ "date" ].isoformat() for change in changes
+    ]
+    contents = example.read_bytes()
+    for entry in index.entries:
+        assert contents[ entry.start : entry.end ].startswith( b"## [" + entry.version.encode() )
+        assert contents.count( b"\n", 0, entry.start ) + 1 == entry.line
+
+def test_load_release( example ):
+    changes = changelog.load_path( example )
+    index = changelog.ReleaseIndex( example )
+    for change in changes:
+        assert index.load_release( change[ "version" ] ) == change
+        assert index.load_release( str( change[ "version" ] ) ) == change
+    assert index.load_release( "UNRELEASED" ) == changes[ 0 ]
+    assert index.load_release( "1.1.1", compact = True )[ "added" ] == tuple( changes.get( "1.1.1" )[ "added" ] )
+    assert index.load_release( "9.9.9" ) is None
+    with pytest.raises( ValueError ):
+        index.load_release( "1.1" )
+    assert changelog.load_release( example, "1.0.0" ) == changes.get( "1.0.0" )
+
+def test_load_between( example ):
+    changes = changelog.load_path( example )
+    index = changelog.ReleaseIndex( example )
+    assert index.load_between() == changes.between()
+    assert index.load_between( "0.3.0", "1.0.0" ) == changes.between( "0.3.0", "1.0.0" )
+    with pytest.raises( ValueError ):
+        index.load_between( "Unreleased" )
+
+def test_repeated_version( tmp_path ):
+    # Only the first release with a version gets its compare URL, as when parsing
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text( "## [1.0.0]\n## [1.0.0] [YANKED]\n[1.0.0+b]: http://y\n" )
+    changes = changelog.load_path( path )
+    assert changelog.ReleaseIndex( path ).load_between() == changes.between()
+    assert [ "compare_url" in change for change in changes ] == [ True, False ]
+
+def test_errors( tmp_path ):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text( "# Changelog\n\n## [2.0.0] - 2020-02-01\n### Added\n- A\n\n## [1.0.0] - 2020-01-01\n### Nope\n" )
+    index = changelog.ReleaseIndex( path )
+    assert index.load_release( "2.0.0" ) == changelog.loads( "## [2.0.0] - 2020-02-01\n### Added\n- A\n" )[ 0 ]
+    with pytest.raises( changelog.ChangelogParsingError ) as expected:
+        changelog.load_path( path )
+    with pytest.raises( changelog.ChangelogParsingError ) as error:
+        index.load_release( "1.0.0" )
+    assert ( error.value.line_number, error.value.column_number, error.value.rule ) == ( 8, 5, "invalid-section" )
+    assert str( error.value ) == str( expected.value )
+
+    path.write_bytes( b"## [1.0.0] - 2020-01-01\n### Added\n- \xff\n" )
+    with pytest.raises( changelog.ChangelogParsingError ) as error:
+        changelog.load_release( path, "1.0.0" )
+    assert ( error.value.line_number, error.value.rule ) == ( 3, "decode-error" )
+
+def test_refresh( tmp_path ):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text( "## [1.0.0] - 2020-01-01\n### Added\n- A\n" )
+    index = changelog.ReleaseIndex( path )
+    assert index.load_release( "2.0.0" ) is None
+    path.write_text( "## [2.0.0] - 2020-02-01\n### Fixed\n- B\n\n## [1.0.0] - 2020-01-01\n### Added\n- A\n" )
+    assert index.load_release( "2.0.0" )[ "fixed" ] == [ "B" ]
+    assert index.load_release( "1.0.0" )[ "added" ] == [ "A" ]
+
+def test_sidecar( example, monkeypatch ):
+    changes = changelog.load_path( example )
+    assert changelog.load_release( example, "1.0.0", sidecar = True ) == changes.get( "1.0.0" )
+    sidecar = f'{ example }.index'
+    assert os.path.getsize( sidecar ) < os.path.getsize( example )
+
+    # The sidecar file is used instead of scanning the changelog again, even after only its modification time changes
+    scans = []
+    scan = changelog._index._scan
+    monkeypatch.setattr( changelog._index, "_scan", lambda *args: scans.append( args ) or scan( *args ) )
+    assert changelog.load_release( example, "1.1.0", sidecar = True ) == changes.get( "1.1.0" )
+    os.utime( example, ns = ( 0, 0 ) )
+    assert changelog.load_release( example, "1.1.0", sidecar = True ) == changes.get( "1.1.0" )
+    assert json.loads( open( sidecar ).read() )[ "stamp" ][ 1 ] == 0
+    assert not scans
+
+    # It's rebuilt when the changelog changes, or if it's corrupt
+    example.write_text( example.read_text().replace( "## [1.1.0] - 2019-02-15", "## [1.1.0] - 2019-02-15 [YANKED]" ) )
+    assert changelog.ReleaseIndex( example, sidecar = True ).get( "1.1.0" ).yanked
+    assert len( scans ) == 1
+    with open( sidecar, "w" ) as fp:
+        fp.write( "{" )
+    assert changelog.load_release( example, "1.1.0", sidecar = True )[ "yanked" ]
+    assert len( scans ) == 2
+
+def test_empty( tmp_path ):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text( "" )
+    index = changelog.ReleaseIndex( path, sidecar = tmp_path / "index.json" )
+    assert index.entries == [] and index.load_between() == []
+
+def test_encoding( tmp_path ):
+    with pytest.raises( ValueError ):
+        changelog.ReleaseIndex( tmp_path / "CHANGELOG.md", "utf-16" )
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+from semver import Version
+import changelog
+import pytest
+
+CHANGELOG = """# Changelog
+
+## [1.1.0] - 2020-01-01
+### Added
+- A feature
+
+## [1.0.0] - 2020-01-01
+### Fixed
+- A fix
+
+[1.1.0]: https://example.com/compare/v1.0.0...v1.1.0
+[1.0.0]: https://example.com/releases/v1.0.0
+"""
+
+@pytest.fixture( autouse = True )
+def interning():
+    changelog.set_intern_size()
+    yield
+    changelog.set_intern_size()
+
+def test_shared_between_loads():
+    first, second = changelog.loads( CHANGELOG ), changelog.load_bytes( CHANGELOG.encode(), compact = True )
+    for old, new in zip( first, second ):
+        assert old[ "version" ] is new[ "version" ]
+        assert old[ "date" ] is new[ "date" ]
+    assert first[ 0 ][ "date" ] is first[ 1 ][ "date" ]
+
+    versions, dates = changelog.intern_info()
+    assert ( versions.hits, versions.misses, versions.currsize ) == ( 2, 2, 2 )
+    assert ( dates.hits, dates.misses, dates.currsize ) == ( 3, 1, 1 )
+
+def test_set_intern_size():
+    changelog.set_intern_size( 1 )
+    first = changelog.loads( CHANGELOG )
+    # Only the first version parsed (1.1.0) is kept, and isn't replaced by versions parsed after it
+    second = changelog.loads( CHANGELOG )
+    assert first[ 0 ][ "version" ] is second[ 0 ][ "version" ]
+    assert first[ 1 ][ "version" ] is not second[ 1 ][ "version" ]
+    assert first[ 1 ][ "version" ] == second[ 1 ][ "version" ] == Version( 1, 0, 0 )
+    assert changelog.intern_info().versions == ( 1, 3, 1, 1 )
+    assert changelog.loads( "## [1.1.0]" )[ 0 ][ "version" ] is second[ 0 ][ "version" ]
+    assert changelog.intern_info().versions == ( 2, 3, 1, 1 )
+
+    changelog.set_intern_size( 0 )
+    assert changelog.intern_info().versions == ( 0, 0, 0, 0 )
+    first, second = changelog.loads( CHANGELOG ), changelog.loads( CHANGELOG )
+    assert first[ 1 ][ "version" ] is not second[ 1 ][ "version" ]
+    assert changelog.intern_info().versions.misses == 4
+
+def test_invalid_not_interned():
+    with pytest.raises( changelog.ChangelogParsingError ):
+        changelog.loads( CHANGELOG.replace( "1.1.0]", "1.1]" ) )
+    assert changelog.intern_info().versions.currsize == 0
+
+def test_threads():
+    with ThreadPoolExecutor( 4 ) as executor:
+        results = list( executor.map( changelog.loads, [ CHANGELOG ] * 100 ) )
+    assert all( result[ 0 ][ "version" ] is results[ 0 ][ 0 ][ "version" ] for result in results )
+    assert results[ 0 ][ 0 ][ "version" ] == Version( 1, 1, 0 )
+    assert sum( changelog.intern_info().versions[ : 2 ] ) == 200
@@ -0,0 +1,48 @@
+import changelog
+import pytest
+import semver
+from io import StringIO
+
+def test_matches_load( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        expected = changelog.load( fp )
+    with open( project_example_changelog_path, "rb" ) as fp:
+        assert list( changelog.iter_load( fp ) ) == expected
+
+def test_yields_before_end_of_stream():
+    fp = StringIO( "## [Unreleased]\n\n### Added\n\n- New\n\n## [1.0.0] - 2023-01-01\n\n## [0.1.0]\n" )
+    releases = changelog.iter_load( fp )
+    assert next( releases ) == { "version": "Unreleased", "date": None, "yanked": False, "added": [ "New" ] }
+    assert fp.readline() == "\n"
+
+@pytest.mark.parametrize(
+    ( "kwargs", "versions" ),
+    [
+        ( { "limit": 2 }, [ "Unreleased", semver.Version( 1, 1, 1 ) ] ),
+        ( { "limit": 0 }, [] ),
+        ( { "until": lambda version: str( version ) == "1.0.0" },
+            [ "Unreleased", semver.Version( 1, 1, 1 ), semver.Version( 1, 1, 0 ), semver.Version( 1, 0, 0 ) ] )
+    ] )
+def test_stop_early( project_example_changelog_path, kwargs, versions ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        releases = list( changelog.iter_load( fp, **kwargs ) )
+        assert fp.read( 1 )
+    assert [ release[ "version" ] for release in releases ] == versions
+    assert all( "compare_url" not in release for release in releases )
+
+def test_compare_urls_attached_when_exhausted():
+    releases = changelog.iter_loads( "## [1.0.0]\n\n## [0.1.0]\n\n[1.0.0]: https://example.com\n" )
+    release = next( releases )
+    assert "compare_url" not in release
+    assert [ i[ "version" ] for i in releases ] == [ semver.Version( 0, 1, 0 ) ]
+    assert release[ "compare_url" ] == "https://example.com"
+
+def test_error_after_yield():
+    releases = changelog.iter_loads( "## [1.0.0]\n\n## [1.0.0]\n\nasdf" )
+    assert next( releases )[ "version" ] == semver.Version( 1, 0, 0 )
+    with pytest.raises( changelog.ChangelogParsingError, match = r'^Unrecognized line pattern, "asdf" \(at line 5\)$' ):
+        next( releases )
+
+def test_change_after_compare_urls():
+    with pytest.raises( changelog.ChangelogParsingError, match = r'no other line types are allowed \(at line 6\)$' ):
+        changelog.loads( "## [1.0.0]\n\n### Added\n\n[1.0.0]: https://example.com\n- Change" )
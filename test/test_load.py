@@ -1,5 +1,6 @@
 import tempfile
 import os
+from io import BytesIO
 import changelog
 import pytest
 import semver
@@ -75,12 +76,22 @@ def test_write( project_example_changelog_path ):
         ( '## [Unreleased]\n\n[1.a.1]: https://asdf', 'Failed parsing semver version, "1.a.1" '
             '(at line 3, column 2)', 3, 2 ),
         ( '## [1.1.1]\n\n[1.1.1]: https://asdf\n\n## [Unreleased]', 'After compare URL definitions have started, '
-            'no other line types are allowed (at line 5)', 5, None )
+            'no other line types are allowed (at line 5)', 5, None ),
+        # An error parsing a line before undecodable data is raised first
+        ( '## [1.0]\nfoo\n- \udcff\n', 'Failed parsing semver version, "1.0" (at line 1, column 5)', 1, 5 )
     ] )
 
-def test_basic_error_line_patterns( changelog_contents, error_message, msg_line_no, msg_col_no ):
+@pytest.mark.parametrize(
+    "loader",
+    [
+        changelog.loads,
+        lambda s: changelog.load( BytesIO( s.encode( 'utf-8', 'surrogateescape' ) ) ),
+        lambda s: changelog.load_bytes( s.encode( 'utf-8', 'surrogateescape' ) )
+    ],
+    ids = [ "loads", "load", "load_bytes" ] )
+def test_basic_error_line_patterns( loader, changelog_contents, error_message, msg_line_no, msg_col_no ):
     try:
-        changelog.loads( changelog_contents )
+        loader( changelog_contents )
     except Exception as e:
         assert isinstance( e, changelog.ChangelogParsingError )
         assert str( e ) == error_message
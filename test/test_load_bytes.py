@@ -0,0 +1,48 @@
+import os
+import threading
+import changelog
+import pytest
+
+def test_matches_load( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        expected = changelog.load( fp )
+    with open( project_example_changelog_path, "rb" ) as fp:
+        assert changelog.load_bytes( memoryview( fp.read() ) ) == expected
+    assert changelog.load_path( project_example_changelog_path ) == expected
+
+def test_continuation_lines():
+    contents = "## [1.0.0]\n### Added\n- One\n  two\n\n  three\n- Four\n\n  five\n\n\n"
+    expected = [ {
+        "version": changelog.load_bytes( b"## [1.0.0]" )[ 0 ][ "version" ],
+        "date": None,
+        "yanked": False,
+        "added": [ "One\ntwo\n\nthree", "Four\n\nfive" ]
+    } ]
+    assert changelog.load_bytes( contents.encode() ) == expected
+    assert changelog.loads( contents ) == expected
+
+def test_empty( tmp_path ):
+    ( path := tmp_path / "CHANGELOG.md" ).write_bytes( b"" )
+    assert changelog.load_path( path ) == []
+    assert changelog.load_bytes( b"" ) == []
+
+@pytest.mark.skipif( not os.path.isdir( "/dev/fd" ), reason = "Pipes can't be opened by path" )
+def test_pipe():
+    # More data than a pipe holds, so it's read while it's written
+    data = b"## [1.0.0]\n### Added\n" + b"- A change\n" * 10000
+    read_fd, write_fd = os.pipe()
+    def write():
+        with open( write_fd, "wb" ) as fp:
+            fp.write( data )
+    ( thread := threading.Thread( target = write ) ).start()
+    try:
+        assert changelog.load_path( f"/dev/fd/{ read_fd }" ) == changelog.load_bytes( data )
+    finally:
+        os.close( read_fd )
+        thread.join()
+
+def test_decode_error_line():
+    with pytest.raises( changelog.ChangelogParsingError ) as error:
+        changelog.load_bytes( b"## [Unreleased]\n\n### Added\n\n- \xff\n" )
+    assert str( error.value ) == 'Unable to decode line using encoding, "utf-8" (at line 5)'
+    assert error.value.line_number == 5
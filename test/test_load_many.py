@@ -0,0 +1,39 @@
+import changelog
+import pytest
+
+@pytest.fixture
+def paths( tmp_path, project_example_changelog_path ):
+    ( good := tmp_path / "good.md" ).write_text( "## [1.0.0] - 2023-01-01\n\n### Added\n\n- Thing\n" )
+    ( bad := tmp_path / "bad.md" ).write_text( "## [Unreleased]\n\nasdf\n" )
+    return [ project_example_changelog_path, good, bad, tmp_path / "missing.md", good ]
+
+def check_results( paths, results ):
+    results = dict( results )
+    assert results.keys() == set( paths )
+    assert results[ paths[ 0 ] ] == changelog.load_path( paths[ 0 ] )
+    assert isinstance( results[ paths[ 0 ] ], changelog.Changelog )
+    assert results[ paths[ 1 ] ][ 0 ][ "added" ] == [ "Thing" ]
+    assert isinstance( results[ paths[ 2 ] ], changelog.ChangelogParsingError )
+    assert results[ paths[ 2 ] ].line_number == 3
+    assert isinstance( results[ paths[ 3 ] ], FileNotFoundError )
+
+@pytest.mark.parametrize( "threads", [ False, True ] )
+@pytest.mark.parametrize( "chunksize", [ 1, 2 ] )
+def test_ordered( paths, threads, chunksize ):
+    results = list( changelog.load_many( paths, workers = 2, threads = threads, chunksize = chunksize ) )
+    assert [ path for path, _ in results ] == paths
+    check_results( paths, results )
+
+def test_completion_order( paths ):
+    results = list( changelog.load_many( paths, workers = 2, ordered = False ) )
+    assert sorted( map( str, ( path for path, _ in results ) ) ) == sorted( map( str, paths ) )
+    check_results( paths, results )
+
+def test_stop_early( paths ):
+    results = changelog.load_many( paths, threads = True )
+    assert next( results )[ 0 ] == paths[ 0 ]
+    results.close()
+
+def test_bad_chunksize( paths ):
+    with pytest.raises( ValueError ):
+        next( changelog.load_many( paths, chunksize = 0 ) )
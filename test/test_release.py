@@ -0,0 +1,77 @@
+import changelog
+import pytest
+from semver import Version
+
+def test_matches_load( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        expected = changelog.load( fp )
+    changes = changelog.load_path( project_example_changelog_path, compact = True )
+    assert all( isinstance( change, changelog.Release ) for change in changes )
+    # Sections are tuples instead of lists
+    assert [ { key: list( value ) if isinstance( value, tuple ) else value for key, value in change.items() }
+             for change in changes ] == expected
+
+def test_lazy_version():
+    release = changelog.loads( "## [1.2.3-rc.1] - 2020-01-02 [YANKED]\n### Fixed\n- A bug\n", compact = True )[ 0 ]
+    assert release.raw_version == "1.2.3-rc.1"
+    assert release[ "version" ] == Version( 1, 2, 3, "rc.1" )
+    assert release.raw_version is release[ "version" ]
+    assert release[ "yanked" ] is True
+    assert release[ "fixed" ] == ( "A bug", )
+
+def test_unreleased():
+    release = changelog.loads( "## [unreleased]\n", compact = True )[ 0 ]
+    assert release[ "version" ] == "Unreleased"
+    assert release[ "date" ] is None
+
+def test_mapping():
+    release = changelog.Release( "1.0.0", "2020-01-02", sections = [ ( "added", [ "A" ] ) ] )
+    assert list( release ) == [ "date", "yanked", "version", "added" ]
+    assert "compare_url" not in release and "removed" not in release
+    release[ "compare_url" ] = "https://example.com"
+    release[ "fixed" ] = ( "B", )
+    release[ "added" ] = ( "C", )
+    assert list( release ) == [ "date", "yanked", "version", "added", "fixed", "compare_url" ]
+    assert release[ "added" ] == ( "C", ) and release.get( "removed" ) is None
+    del release[ "added" ]
+    assert len( release ) == 5
+    with pytest.raises( KeyError ):
+        release[ "unknown" ] = 1
+    with pytest.raises( KeyError ):
+        del release[ "version" ]
+
+@pytest.mark.parametrize( "changes", [
+    (),
+    ( "", ),
+    ( "A", "", "Multiple\nlines" ),
+    ( "A\0B", "C" ),        # holding the character changes are packed with
+    ( "A", 1 )
+] )
+def test_packed_sections( changes ):
+    release = changelog.Release( "1.0.0", sections = [ ( "added", list( changes ) ) ] )
+    release[ "fixed" ] = changes
+    assert release[ "added" ] == release[ "fixed" ] == changes
+
+def test_dump( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        expected = changelog.dumps( changelog.load( fp ) )
+    assert changelog.dumps( changelog.load_path( project_example_changelog_path, compact = True ) ) == expected
+
+def test_get():
+    changes = changelog.loads( "## [Unreleased]\n## [1.0.0]\n[1.0.0]: https://example.com\n", compact = True )
+    assert changes.get( "1.0.0" )[ "compare_url" ] == "https://example.com"
+    assert changes.get( Version( 1, 0, 0 ) ) is changes[ 1 ]
+    assert changes.latest_released() is changes[ 1 ]
+
+@pytest.mark.parametrize( "contents", [
+    "## [1.0]\n",
+    "## [1.0.0] - 2020-13-01\n",
+    "## [1.0.0]\n### Fixed\n- A\n### Fixed\n",
+    "## [1.0.0]\n[1.0.1]: https://example.com\n"
+] )
+def test_errors( contents ):
+    with pytest.raises( changelog.ChangelogParsingError ) as expected:
+        changelog.loads( contents )
+    with pytest.raises( changelog.ChangelogParsingError ) as error:
+        changelog.loads( contents, compact = True )
+    assert str( error.value ) == str( expected.value )
@@ -0,0 +1,79 @@
+from io import ( BytesIO, StringIO )
+import changelog
+import pytest
+
+def test_counts( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        contents = fp.read()
+    collected = []
+    changes = changelog.load_path( project_example_changelog_path, stats = collected.append )
+    assert changes == changelog.loads( contents.decode() )
+
+    stats, = collected
+    assert stats.lines == {
+        "release": 15,
+        "section": 26,
+        "item": 97,
+        "continuation": 14,
+        "compare_url": 15,
+        "blank": 70,
+        "other": 4
+    }
+    assert sum( stats.lines.values() ) == contents.count( b"\n" )
+    assert stats.bytes_decoded == len( contents )
+    assert stats.releases == len( changes )
+    assert stats.versions_parsed == stats.dates_parsed == 14
+    assert stats.error is None
+    assert 0 < sum( stats.line_times.values() ) <= stats.total_time
+    assert stats.as_dict()[ "lines.item" ] == 97
+
+@pytest.mark.parametrize( "load", [
+    lambda contents, stats: changelog.load( BytesIO( contents.encode() ), stats = stats ),
+    lambda contents, stats: changelog.load( StringIO( contents ), stats = stats ),
+    lambda contents, stats: changelog.loads( contents, stats = stats ),
+    lambda contents, stats: changelog.load_bytes( contents.encode(), stats = stats ),
+    lambda contents, stats: list( changelog.iter_loads( contents, stats = stats ) )
+] )
+def test_loaders( load ):
+    collected = []
+    contents = "## [Unreleased]\n### Added\n- One\n  two\n\n## [1.0.0] - 2020-01-01\n[1.0.0]: https://example.com\n"
+    assert load( contents, collected.append ) == changelog.loads( contents )
+    assert collected[ 0 ].lines == {
+        "release": 2,
+        "section": 1,
+        "item": 1,
+        "continuation": 1,
+        "compare_url": 1,
+        "blank": 1,
+        "other": 0
+    }
+    assert collected[ 0 ].releases == 2
+
+def test_compact():
+    collected = []
+    changelog.loads( "## [1.0.0] - 2020-01-01\n", compact = True, stats = collected.append )
+    assert collected[ 0 ].versions_parsed == 0 and collected[ 0 ].dates_parsed == 1
+
+def test_limit():
+    collected = []
+    assert len( list( changelog.iter_loads( "## [1.0.1]\n## [1.0.0]\n", limit = 1, stats = collected.append ) ) ) == 1
+    assert collected[ 0 ].releases == 1
+    assert collected[ 0 ].lines[ "release" ] == 2
+
+@pytest.mark.parametrize( ( "load", "line_number" ), [
+    ( lambda stats: changelog.loads( "## [1.0.0]\nUnknown\n", stats = stats ), 2 ),
+    ( lambda stats: changelog.load( BytesIO( b"## [1.0.0]\n\xff\n" ), stats = stats ), 2 ),
+    ( lambda stats: changelog.load_bytes( b"## [1.0.0]\n\xff\n", stats = stats ), 2 )
+] )
+def test_error( load, line_number ):
+    collected = []
+    with pytest.raises( changelog.ChangelogParsingError ) as error:
+        load( collected.append )
+    assert error.value.line_number == line_number
+    assert collected[ 0 ].error is error.value
+
+def test_empty( tmp_path ):
+    ( path := tmp_path / "CHANGELOG.md" ).write_bytes( b"" )
+    collected = []
+    assert changelog.load_path( path, stats = collected.append ) == []
+    assert collected[ 0 ].releases == 0 and collected[ 0 ].bytes_decoded == 0
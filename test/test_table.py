@@ -0,0 +1,116 @@
+import io
+import sys
+from array import array
+from datetime import date
+from semver import Version
+import changelog
+import pytest
+
+CHANGELOG = """# Changelog
+
+## [Unreleased]
+### Added
+- A feature
+
+## [1.1.0-rc.1+build.5] - 2021-02-03 [YANKED]
+### Fixed
+
+### Security
+- A fix
+- Another fix
+
+## [1.0.0] - 2020-01-01
+### Changed
+- A change
+
+[1.0.0]: https://example.com/releases/v1.0.0
+"""
+
+@pytest.fixture
+def table( project_example_changelog_path ):
+    table = changelog.ChangelogTable()
+    table.extend( changelog.loads( CHANGELOG ), "a" )
+    table.extend( changelog.load_path( project_example_changelog_path, compact = True ), "b" )
+    return table
+
+def test_columns():
+    table = changelog.ChangelogTable()
+    table.extend( changelog.loads( CHANGELOG, compact = True ) )
+    columns = table.columns
+    assert len( table ) == 3
+    assert ( list( columns[ "major" ] ), list( columns[ "minor" ] ), list( columns[ "patch" ] ) ) == (
+        [ -1, 1, 1 ], [ -1, 1, 0 ], [ -1, 0, 0 ]
+    )
+    assert ( columns[ "prerelease" ], columns[ "build" ] ) == ( [ None, "rc.1", None ], [ None, "build.5", None ] )
+    assert list( columns[ "date" ] ) == [ 0, date( 2021, 2, 3 ).toordinal(), date( 2020, 1, 1 ).toordinal() ]
+    assert list( columns[ "yanked" ] ) == [ 0, 1, 0 ]
+    assert list( columns[ "sections" ] ) == [ 0b000001, 0b110000, 0b000010 ]
+    assert list( columns[ "offset" ] ) == [ 0, 1, 3 ]
+    assert list( columns[ "security_count" ] ) == [ 0, 2, 0 ]
+    assert columns[ "compare_url" ] == [ None, None, "https://example.com/releases/v1.0.0" ]
+    assert table.items == [ "A feature", "A fix", "Another fix", "A change" ]
+    assert table.sources == [ None ]
+    assert isinstance( columns[ "major" ], array ) and columns[ "major" ].itemsize == 8
+
+def test_round_trips( table, project_example_changelog_path ):
+    assert table.changelogs() == [
+        ( "a", changelog.loads( CHANGELOG ) ), ( "b", changelog.load_path( project_example_changelog_path ) )
+    ]
+    assert changelog.ChangelogTable.from_dict( table.as_dict() ) == table
+    assert changelog.ChangelogTable.from_bytes( table.to_bytes() ) == table
+    for stream in ( io.StringIO(), io.BytesIO() ):
+        table.dump_jsonl( stream )
+        stream.seek( 0 )
+        assert changelog.ChangelogTable.load_jsonl( stream ) == table
+
+def test_jsonl( table ):
+    stream = io.StringIO()
+    table.dump_jsonl( stream )
+    assert stream.getvalue().splitlines()[ 1 ] == (
+        '{"source_index": 0, "source": "a", "major": 1, "minor": 1, "patch": 0, "date": 737824, "yanked": 1, '
+        '"prerelease": "rc.1", "build": "build.5", "compare_url": null, "fixed": [], '
+        '"security": ["A fix", "Another fix"]}'
+    )
+    with pytest.raises( changelog.ChangelogParsingError ) as e:
+        changelog.ChangelogTable.load_jsonl( io.StringIO( stream.getvalue() + "{\n" ) )
+    assert e.value.line_number == len( table ) + 1
+
+def test_jsonl_sources( project_example_changelog_path ):
+    # Changelogs are told apart by the index of their source, even without releases or with equal sources
+    changes = [
+        changelog.loads( CHANGELOG ), [], changelog.load_path( project_example_changelog_path ),
+        changelog.loads( CHANGELOG ), []
+    ]
+    for sources in ( [ None ] * 5, [ "a", "a", "b", "a", "c" ] ):
+        table = changelog.ChangelogTable()
+        for source, releases in zip( sources, changes ):
+            table.extend( releases, source )
+        stream = io.StringIO()
+        table.dump_jsonl( stream )
+        stream.seek( 0 )
+        loaded = changelog.ChangelogTable.load_jsonl( stream )
+        assert loaded == table
+        assert loaded.changelogs() == list( zip( sources, changes ) )
+
+def test_concat( table, project_example_changelog_path ):
+    first, second = changelog.ChangelogTable(), changelog.ChangelogTable()
+    first.extend( changelog.loads( CHANGELOG ), "a" )
+    second.extend( changelog.load_path( project_example_changelog_path ), "b" )
+    assert changelog.ChangelogTable.concat( [ first, second ] ) == table
+    assert changelog.ChangelogTable.concat( [] ) == changelog.ChangelogTable()
+
+def test_from_bytes_errors( table ):
+    data = table.to_bytes()
+    with pytest.raises( ValueError ):
+        changelog.ChangelogTable.from_bytes( b"not a table" + data )
+    with pytest.raises( ValueError ):
+        changelog.ChangelogTable.from_bytes( data[ : -1 ] )
+
+    # Tables serialized on machines of the other byte order are read too
+    swapped = changelog.ChangelogTable.from_bytes( data )
+    for column in swapped.columns.values():
+        if isinstance( column, array ):
+            column.byteswap()
+    swapped_data = bytearray( swapped.to_bytes() )
+    swapped_data[ 9 ] = ord( ">" if sys.byteorder == "little" else "<" )
+    assert changelog.ChangelogTable.from_bytes( swapped_data ) == table
@@ -0,0 +1,112 @@
+import json
+import pickle
+from io import ( BytesIO, StringIO )
+import changelog
+import pytest
+
+INVALID = """# Changelog
+
+## [Unreleased]
+### Added
+- A change
+bad line
+- skipped, until the next header
+
+### Wrong
+- skipped
+
+## [1.0] - 2020-01-01
+### Added
+- under a release that failed to parse
+
+## [1.0.0] - 2020-13-01
+### Fixed
+- A fix
+
+## [0.9.0]  - 2020-01-01
+### Fixed
+- A fix
+
+[unreleased]: https://example.com/compare/v1.0.0...HEAD
+[2.0.0]: https://example.com/releases/tag/v2.0.0
+[0.9.0]: https://example.com/releases/tag/v0.9.0
+"""
+
+EXPECTED = [
+    changelog.Diagnostic( 6, None, "unrecognized-line", 'Unrecognized line pattern, "bad line"' ),
+    changelog.Diagnostic( 9, 5, "invalid-section", 'Invalid change type, "Wrong"' ),
+    changelog.Diagnostic( 12, 5, "invalid-version", 'Failed parsing semver version, "1.0"' ),
+    changelog.Diagnostic( 16, 14, "invalid-date", 'Unable to parse changelog entry date, "2020-13-01"' ),
+    changelog.Diagnostic( 20, 11, "extra-space", "Extra space(s) after version" ),
+    changelog.Diagnostic( 25, 2, "unknown-compare-url-version", 'No corresponding record for compare url with version, "2.0.0"' )
+]
+
+def test_valid( project_example_changelog_path ):
+    with open( project_example_changelog_path, "rb" ) as fp:
+        assert changelog.validate( fp ) == []
+    with open( project_example_changelog_path, "r", encoding = "utf-8" ) as fp:
+        assert changelog.validates( fp.read() ) == []
+
+@pytest.mark.parametrize( "validate", [
+    lambda contents, **kwargs: changelog.validates( contents, **kwargs ),
+    lambda contents, **kwargs: changelog.validate( StringIO( contents ), **kwargs ),
+    lambda contents, **kwargs: changelog.validate( BytesIO( contents.encode() ), **kwargs )
+] )
+def test_all_errors( validate ):
+    assert validate( INVALID ) == EXPECTED
+    assert validate( INVALID, max_errors = 2 ) == EXPECTED[ : 2 ]
+
+def test_recovery():
+    assert changelog.validates(
+        "## [1.0.0]\n### Added\n- A\n### Added\n- B\n\n## 2.0.0\n### Fixed\n### Fixed\n- C\n\n"
+        "[2.0.0]: https://example.com\n[3.0.0]: https://example.com\n"
+    ) == [
+        changelog.Diagnostic( 4, 5, "duplicate-section", 'Multiple "Added" sections found' ),
+        changelog.Diagnostic( 7, 4, "version-brackets", "Version must be enclosed with square brackets" ),
+        changelog.Diagnostic( 9, 5, "duplicate-section", 'Multiple "Fixed" sections found' ),
+        changelog.Diagnostic( 13, 2, "unknown-compare-url-version",
+                              'No corresponding record for compare url with version, "3.0.0"' )
+    ]
+
+def test_decode_errors():
+    assert changelog.validate( BytesIO( b"## [1.0.0]\n- \xff\n### Nope\n" ) ) == [
+        changelog.Diagnostic( 2, None, "decode-error", 'Unable to decode line using encoding, "utf-8"' ),
+        changelog.Diagnostic( 3, 5, "invalid-section", 'Invalid change type, "Nope"' )
+    ]
+
+def test_unreadable_type():
+    class Reader:
+        def readline( self ):
+            return 1
+    diagnostic, = changelog.validate( Reader() )
+    assert diagnostic.rule == "unreadable-type"
+    assert diagnostic.line is None
+
+def test_error_attributes():
+    error = changelog.ChangelogParsingError( "Invalid change type", 3, 5, "invalid-section" )
+    assert ( error.msg, error.line_number, error.column_number, error.rule ) == ( "Invalid change type", 3, 5,
+                                                                                  "invalid-section" )
+    assert str( error ) == "Invalid change type (at line 3, column 5)"
+
+    copy = pickle.loads( pickle.dumps( error ) )
+    assert type( copy ) is changelog.ChangelogParsingError
+    assert ( copy.msg, copy.line_number, copy.column_number, copy.rule ) == ( error.msg, 3, 5, "invalid-section" )
+    assert str( copy ) == str( error )
+
+def test_sarif():
+    log = json.loads( json.dumps( changelog.to_sarif( { "CHANGELOG.md": EXPECTED, "other/CHANGELOG.md": [] } ) ) )
+    assert log[ "version" ] == "2.1.0"
+    run, = log[ "runs" ]
+    rules = { rule[ "id" ] for rule in run[ "tool" ][ "driver" ][ "rules" ] }
+    assert { diagnostic.rule for diagnostic in EXPECTED } <= rules
+    assert len( run[ "results" ] ) == len( EXPECTED )
+    assert run[ "results" ][ 1 ] == {
+        "ruleId": "invalid-section",
+        "level": "error",
+        "message": { "text": 'Invalid change type, "Wrong"' },
+        "locations": [ { "physicalLocation": {
+            "artifactLocation": { "uri": "CHANGELOG.md" },
+            "region": { "startLine": 9, "startColumn": 5 }
+        } } ]
+    }
+    assert "startColumn" not in run[ "results" ][ 0 ][ "locations" ][ 0 ][ "physicalLocation" ][ "region" ]